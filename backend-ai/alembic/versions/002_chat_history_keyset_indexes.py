@@ -0,0 +1,38 @@
+"""Chat history keyset pagination indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 세션별 메시지: (session_id, created_at, id) 순서 조회 → 기존 session_id 단일 인덱스 대체
+    op.create_index(
+        "idx_chat_messages_session_created",
+        "chat_messages",
+        ["session_id", "created_at", "id"],
+    )
+    op.drop_index("idx_chat_messages_session", table_name="chat_messages")
+
+    # 사용자별 세션 목록: 최근 대화 순
+    op.create_index(
+        "idx_chat_sessions_user_updated",
+        "chat_sessions",
+        ["user_id", "updated_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_chat_sessions_user_updated", table_name="chat_sessions")
+    op.create_index("idx_chat_messages_session", "chat_messages", ["session_id"])
+    op.drop_index("idx_chat_messages_session_created", table_name="chat_messages")
@@ -0,0 +1,38 @@
+"""Shared chat session state for multi-worker deployments
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # chat_session_state 테이블 (워커 간 공유 세션, 버전 기반 낙관적 동시성 제어)
+    op.create_table(
+        "chat_session_state",
+        sa.Column("session_key", sa.String(128), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="1"),
+        sa.Column("user_name", sa.String(100), nullable=True),
+        sa.Column("user_email", sa.String(255), nullable=True),
+        sa.Column("summary", sa.Text(), nullable=True),
+        sa.Column("messages", postgresql.JSONB(), nullable=False, server_default="[]"),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+
+    # 오래된 세션 정리용
+    op.create_index("idx_chat_session_state_updated", "chat_session_state", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_table("chat_session_state")
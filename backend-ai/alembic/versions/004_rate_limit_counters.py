@@ -0,0 +1,34 @@
+"""Shared rate limit counters for multi-worker deployments
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # rate_limit_counters 테이블 (사용자 × 1시간 윈도우 카운터, 원자적 upsert로 증가)
+    op.create_table(
+        "rate_limit_counters",
+        sa.Column("user_key", sa.String(128), nullable=False),
+        sa.Column("window_start", sa.BigInteger(), nullable=False),  # epoch 초
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("user_key", "window_start"),
+    )
+
+    # 지난 윈도우 정리용
+    op.create_index("idx_rate_limit_counters_window", "rate_limit_counters", ["window_start"])
+
+
+def downgrade() -> None:
+    op.drop_table("rate_limit_counters")
@@ -0,0 +1,32 @@
+"""Scope shared chat session state to its owner
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 소유자 없이 session_id로만 저장된 상태는 다른 사용자가 읽을 수 있으므로 폐기 (워커 캐시/DB 대화 기록으로 복원됨)
+    op.execute("DELETE FROM chat_session_state")
+    op.drop_constraint("chat_session_state_pkey", "chat_session_state", type_="primary")
+    op.add_column("chat_session_state", sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False))
+    op.create_primary_key("chat_session_state_pkey", "chat_session_state", ["user_id", "session_key"])
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM chat_session_state")
+    op.drop_constraint("chat_session_state_pkey", "chat_session_state", type_="primary")
+    op.drop_column("chat_session_state", "user_id")
+    op.create_primary_key("chat_session_state_pkey", "chat_session_state", ["session_key"])
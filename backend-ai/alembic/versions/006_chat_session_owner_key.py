@@ -0,0 +1,34 @@
+"""Key chat sessions by (user_id, session_key)
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 행의 id는 클라이언트 세션 ID(UUID) 그대로이므로 session_key로 복사 (새 행 id는 사용자별 uuid5)
+    op.add_column("chat_sessions", sa.Column("session_key", sa.String(128), nullable=True))
+    op.execute("UPDATE chat_sessions SET session_key = id::text")
+    op.alter_column("chat_sessions", "session_key", nullable=False)
+    op.create_index(
+        "uq_chat_sessions_user_session_key",
+        "chat_sessions",
+        ["user_id", "session_key"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_chat_sessions_user_session_key", table_name="chat_sessions")
+    op.drop_column("chat_sessions", "session_key")
@@ -1,21 +1,31 @@
 """
 챗봇 API 엔드포인트
-SSE 스트리밍 + Spring API 사용량 제한 연동
+SSE 스트리밍 + Spring API 사용량 제한 연동 + 시간당 요청 제한
 """
 
-import json
+import asyncio
+import time
+from contextlib import aclosing
 import uuid
 import logging
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Header
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
+from pydantic import BaseModel, Field
 from sse_starlette.sse import EventSourceResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 import httpx
 
 from app.db.database import get_db
-from app.services.agent import get_agent_response
+from app.services.agent import get_agent_response, prepare_context
+from app.services.rate_limiter import get_rate_limiter, rate_limit_tier
+from app.services.tools import invalidate_spring_cache
+from app.services.usage_meter import get_usage_meter
+from app.services.chat_history import get_history_writer, list_messages, list_sessions
+from app.services.user_profile import get_user_profile, invalidate_profile, verified_user_id
 from app.core.config import get_settings
+from app.core.http import get_spring_client
+from app.core.sse import SSEEmitter, get_stream_registry
+from app.core.security import token_fingerprint
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -24,29 +34,22 @@ router = APIRouter()
 
 async def check_and_increment_usage(token: str) -> tuple[bool, str]:
     """
-    Spring API로 AI_CHAT 사용량 체크 및 증가
+    AI_CHAT 사용량 체크 및 차감 (Spring 예약분을 로컬에서 차감)
     Returns: (allowed, message)
     """
-    try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.post(
-                f"{settings.spring_api_url}/api/v1/subscription/usage/increment",
-                params={"type": "AI_CHAT"},
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            if response.status_code == 200:
-                data = response.json().get("data", {})
-                allowed = data.get("allowed", True)
-                message = data.get("message", "")
-                return allowed, message
-            elif response.status_code == 401:
-                return False, "인증이 만료되었습니다. 다시 로그인해주세요."
-            else:
-                logger.warning(f"Usage API error: {response.status_code}")
-                return True, ""  # API 오류 시 허용 (fallback)
-    except Exception as e:
-        logger.error(f"Usage check failed: {e}")
-        return True, ""  # 네트워크 오류 시 허용 (fallback)
+    return await get_usage_meter().consume(token)
+
+
+async def check_rate_limit(token: str) -> tuple[bool, int, int]:
+    """
+    시간당 요청 한도 체크 및 기록 (사용자/요금제는 /auth/me 프로필 기준, 캐시/진행 중인 조회 공유)
+    인증되지 않은 토큰은 토큰별 키로 따로 세고, 요금제는 갱신하지 않음 (처음이면 free)
+    Returns: (allowed, remaining, reset_seconds)
+    """
+    profile = await get_user_profile(token)
+    if profile is None:
+        return await get_rate_limiter().acquire(f"token:{token_fingerprint(token)}")
+    return await get_rate_limiter().acquire(str(profile.user_id), rate_limit_tier(profile.tier))
 
 
 @router.options("/stream")
@@ -66,7 +69,7 @@ async def options_handler():
 
 class ChatRequest(BaseModel):
     message: str
-    session_id: Optional[str] = None
+    session_id: Optional[str] = Field(None, max_length=128)  # chat_session_state.session_key 길이
     user_id: Optional[str] = None
     token: Optional[str] = None  # JWT 토큰 (사용자 데이터 조회용)
 
@@ -84,16 +87,77 @@ def get_auth_token(authorization: Optional[str] = Header(None)) -> Optional[str]
     return None
 
 
+def _retrieve_preflight_error(task: asyncio.Task):
+    """미리 시작한 작업이 결과를 쓰지 않은 채 실패해도 예외를 회수 (미회수 예외 경고 방지)"""
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"Preflight task failed: {task.exception()}")
+
+
+async def start_preflight(request: ChatRequest, user_token: str) -> asyncio.Task:
+    """
+    LLM 호출 전 단계 동시 시작
+    사용자 정보 조회 + RAG 검색은 사용량 체크 결과를 기다리지 않고 미리 실행
+    시간당 요청 한도를 먼저 확인하고 (거부된 요청은 월 사용량을 차감하지 않음) 월 사용량 차감
+    한도 초과/오류로 여기서 끝나면 미리 시작한 작업은 취소, 이후에는 호출한 쪽이 취소 책임
+    """
+    started = time.monotonic()
+    prepared = asyncio.create_task(prepare_context(request.message, request.session_id, user_token))
+    prepared.add_done_callback(_retrieve_preflight_error)
+
+    try:
+        allowed, _, reset_seconds = await check_rate_limit(user_token)
+        if not allowed:
+            logger.info(f"Preflight: rate limited (retry in {reset_seconds}s), speculative work cancelled")
+            raise HTTPException(
+                status_code=429,
+                detail={"error": "Rate limit exceeded", "message": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.", "retry_after": reset_seconds},
+                headers={"Retry-After": str(reset_seconds), "X-RateLimit-Remaining": "0"},
+            )
+
+        allowed, message = await check_and_increment_usage(user_token)
+        usage_ms = round((time.monotonic() - started) * 1000)
+        if not allowed:
+            logger.info(f"Preflight: usage denied after {usage_ms}ms, speculative work cancelled")
+            raise HTTPException(
+                status_code=429,
+                detail={"error": "Usage limit exceeded", "message": message or "이번 달 AI 상담 횟수를 모두 사용했습니다. 업그레이드해주세요."},
+            )
+    except BaseException:
+        prepared.cancel()
+        raise
+
+    logger.info(f"Preflight: usage check {usage_ms}ms")
+    return prepared
+
+
+def sse_response(emitter: SSEEmitter, after: int = 0) -> EventSourceResponse:
+    """SSE 응답 (X-Stream-Id: 재연결 시 Last-Event-ID로 이어받을 스트림)"""
+    return EventSourceResponse(
+        emitter.stream(after),
+        send_timeout=settings.sse_send_timeout,
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Headers": "*",
+            "Access-Control-Expose-Headers": "X-Stream-Id",
+            "X-Stream-Id": emitter.stream_id,
+        }
+    )
+
+
 @router.post("/stream")
 async def chat_stream(
     request: ChatRequest,
     auth_token: Optional[str] = Depends(get_auth_token),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
 ):
     """
     SSE 스트리밍 챗봇 응답 (로그인 필수)
 
     Headers:
         Authorization: Bearer {token}
+        Last-Event-ID: 끊긴 응답의 마지막 이벤트 id (있으면 재생성/사용량 차감 없이 이어서 전송)
 
     Event Types:
         - "token": 응답 토큰 (incremental)
@@ -111,45 +175,32 @@ async def chat_stream(
             detail={"error": "로그인이 필요합니다.", "message": "AI 상담을 이용하려면 로그인해주세요."},
         )
 
-    # Spring API로 사용량 체크 및 증가
-    allowed, message = await check_and_increment_usage(user_token)
-    if not allowed:
-        raise HTTPException(
-            status_code=429,
-            detail={"error": "Usage limit exceeded", "message": message or "이번 달 AI 상담 횟수를 모두 사용했습니다. 업그레이드해주세요."},
-        )
+    registry = get_stream_registry()
+    owner = token_fingerprint(user_token)
 
-    async def event_generator():
-        try:
-            async for event in get_agent_response(request.message, request.session_id, user_token):
-                event_type = event.get("type", "token")
-                data = event.get("data", "")
-
-                if event_type == "token":
-                    yield {"event": "token", "data": data}
-                elif event_type == "citation":
-                    yield {"event": "citation", "data": json.dumps(data, ensure_ascii=False)}
-                elif event_type == "tool_call":
-                    yield {"event": "tool_call", "data": json.dumps(data, ensure_ascii=False)}
-                elif event_type == "done":
-                    yield {"event": "done", "data": ""}
-                    break
-                elif event_type == "error":
-                    yield {"event": "error", "data": data}
-                    break
-
-        except Exception as e:
-            yield {"event": "error", "data": str(e)}
+    # 재연결: 보관 중인 응답을 이어서 전송
+    if last_event_id:
+        resumed = registry.resume(last_event_id, owner)
+        if resumed is not None:
+            emitter, after = resumed
+            logger.info(f"SSE resume {emitter.stream_id} after #{after}")
+            return sse_response(emitter, after)
+        logger.info("SSE resume unavailable, starting new response")
 
-    return EventSourceResponse(
-        event_generator(),
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "*",
-        }
-    )
+    # Spring API 사용량 체크 및 증가 (사용자 정보/RAG 조회와 동시 진행)
+    prepared = await start_preflight(request, user_token)
+
+    # 토큰 병합 + heartbeat + 재연결 이어받기 (core/sse.py)
+    # 이후 prepared 정리는 에이전트 제너레이터의 finally가 담당 (응답 생성 전 실패 시에만 여기서 취소)
+    try:
+        emitter = registry.register(SSEEmitter(
+            get_agent_response(request.message, request.session_id, user_token, prepared),
+            owner=owner,
+        ))
+        return sse_response(emitter)
+    except BaseException:
+        prepared.cancel()
+        raise
 
 
 @router.post("/message")
@@ -165,16 +216,18 @@ async def chat_message(
     if not user_token:
         raise HTTPException(status_code=401, detail={"error": "로그인이 필요합니다."})
 
-    allowed, message = await check_and_increment_usage(user_token)
-    if not allowed:
-        raise HTTPException(status_code=429, detail={"error": "Usage limit exceeded", "message": message})
+    prepared = await start_preflight(request, user_token)
 
     full_response = ""
-    async for event in get_agent_response(request.message, request.session_id, user_token):
-        if event.get("type") == "token":
-            full_response += event.get("data", "")
-        elif event.get("type") == "error":
-            raise HTTPException(status_code=500, detail=event.get("data"))
+    try:
+        async with aclosing(get_agent_response(request.message, request.session_id, user_token, prepared)) as events:
+            async for event in events:
+                if event.get("type") == "token":
+                    full_response += event.get("data", "")
+                elif event.get("type") == "error":
+                    raise HTTPException(status_code=500, detail=event.get("data"))
+    finally:
+        prepared.cancel()
 
     return {"session_id": request.session_id or str(uuid.uuid4()), "message": full_response}
 
@@ -186,35 +239,66 @@ async def get_usage(auth_token: Optional[str] = Depends(get_auth_token)):
         raise HTTPException(status_code=401, detail={"error": "로그인이 필요합니다."})
 
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.get(
-                f"{settings.spring_api_url}/api/v1/subscription/usage",
-                headers={"Authorization": f"Bearer {auth_token}"},
-            )
-            if response.status_code == 200:
-                return response.json()
-            raise HTTPException(status_code=response.status_code, detail="사용량 조회 실패")
+        response = await get_spring_client().get(
+            "/api/v1/subscription/usage",
+            headers={"Authorization": f"Bearer {auth_token}"},
+            timeout=10,
+        )
+        if response.status_code == 200:
+            return response.json()
+        raise HTTPException(status_code=response.status_code, detail="사용량 조회 실패")
     except httpx.RequestError as e:
         raise HTTPException(status_code=500, detail=f"API 연결 오류: {e}")
 
 
+@router.post("/cache/invalidate")
+async def invalidate_cache(auth_token: Optional[str] = Depends(get_auth_token)):
+    """사용자 데이터 조회 캐시 삭제 (직원/급여대장/프로필 수정 후 호출)"""
+    if not auth_token:
+        raise HTTPException(status_code=401, detail={"error": "로그인이 필요합니다."})
+    removed = invalidate_spring_cache(auth_token)
+    removed += int(invalidate_profile(auth_token))
+    return {"invalidated": removed}
+
+
 @router.get("/sessions")
 async def get_sessions(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     auth_token: Optional[str] = Depends(get_auth_token),
     db: AsyncSession = Depends(get_db),
 ):
-    """사용자의 대화 세션 목록"""
-    if not auth_token:
+    """사용자의 대화 세션 목록 (최근 순, 커서 페이지네이션)"""
+    # 토큰 sub는 서명 검증 전이므로 Spring이 인증한 사용자 ID로만 조회
+    user_id = await verified_user_id(auth_token)
+    if user_id is None:
         raise HTTPException(status_code=401, detail={"error": "로그인이 필요합니다."})
-    # TODO: DB에서 세션 조회
-    return {"sessions": []}
+
+    # 아직 기록 대기 중인 대화도 목록에 보이도록 먼저 flush
+    await get_history_writer().flush()
+    try:
+        sessions, next_cursor = await list_sessions(db, user_id, limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail={"error": "잘못된 cursor입니다."})
+    return {"sessions": sessions, "next_cursor": next_cursor}
 
 
 @router.get("/sessions/{session_id}/messages")
 async def get_messages(
     session_id: str,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    auth_token: Optional[str] = Depends(get_auth_token),
     db: AsyncSession = Depends(get_db),
 ):
-    """특정 세션의 대화 내역"""
-    # TODO: DB에서 메시지 조회
-    return {"session_id": session_id, "messages": []}
+    """특정 세션의 대화 내역 (오래된 순, 커서 페이지네이션)"""
+    user_id = await verified_user_id(auth_token)
+    if user_id is None:
+        raise HTTPException(status_code=401, detail={"error": "로그인이 필요합니다."})
+
+    await get_history_writer().flush()
+    try:
+        messages, next_cursor = await list_messages(db, session_id, user_id, limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail={"error": "잘못된 cursor입니다."})
+    return {"session_id": session_id, "messages": messages, "next_cursor": next_cursor}
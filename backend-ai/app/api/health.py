@@ -2,8 +2,25 @@
 헬스체크 API
 """
 
+import logging
+
 from fastapi import APIRouter
 
+from app.core.http import get_spring_pool_stats
+from app.core.sse import get_sse_stats
+from app.services.llm import get_tiered_llm
+from app.services.summarizer import get_summarizer
+from app.services.tools import get_spring_cache_stats
+from app.services.usage_writer import get_usage_writer
+from app.services.usage_meter import get_usage_meter
+from app.services.session_store import get_session_store
+from app.services.chat_history import get_history_writer
+from app.services.session_backend import get_session_sync
+from app.services.rate_limiter import get_rate_limiter
+from app.services.user_profile import get_profile_cache_stats
+
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -11,3 +28,29 @@ router = APIRouter()
 async def health_check():
     """서비스 상태 확인"""
     return {"status": "healthy", "service": "paytools-ai"}
+
+
+@router.get("/health/metrics")
+async def metrics():
+    """내부 성능 지표 (토큰 사용량/프롬프트 캐시 적중률, 요약 토큰 절감량 등)"""
+    try:
+        llm_usage = get_tiered_llm().get_usage_stats()
+    except Exception as e:
+        logger.warning(f"LLM metrics unavailable: {e}")
+        llm_usage = {}
+    session_sync = get_session_sync()
+
+    return {
+        "llm_usage": llm_usage,
+        "summarizer": get_summarizer().get_stats(),
+        "usage_writer": get_usage_writer().get_stats(),
+        "usage_meter": get_usage_meter().get_stats(),
+        "sessions": get_session_store().get_stats(),
+        "chat_history": get_history_writer().get_stats(),
+        "session_sync": session_sync.get_stats() if session_sync else None,
+        "rate_limiter": get_rate_limiter().get_stats(),
+        "spring_cache": get_spring_cache_stats(),
+        "profile_cache": get_profile_cache_stats(),
+        "spring_http_pool": get_spring_pool_stats(),
+        "sse": get_sse_stats(),
+    }
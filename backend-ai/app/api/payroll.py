@@ -0,0 +1,72 @@
+"""
+급여 계산 API 엔드포인트
+- /calculate: Spring /api/v1/salary/calculate와 같은 요청/응답 형식의 인프로세스 계산 (scripts/verify_parity.py 대조 대상)
+- /simulate: 여러 직원 급여 일괄 시뮬레이션 (NumPy 벡터 연산)
+"""
+
+import logging
+from typing import Optional
+from fastapi import APIRouter, Body, HTTPException
+from pydantic import BaseModel, Field
+
+from app.core.config import get_settings
+from app.services.payroll import calculate_salary_request
+from app.services.payroll_batch import simulate_batch
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+router = APIRouter()
+
+
+class BatchSimulationRequest(BaseModel):
+    base_salaries: list[int] = Field(..., min_length=1)
+    weekly_hours: Optional[list[int]] = None  # 생략 시 전원 40시간
+    dependents: Optional[list[int]] = None  # 생략 시 전원 1명
+    children_under_20: Optional[list[int]] = None
+    overtime_hours: Optional[list[float]] = None  # 월 연장근로 시간
+    night_hours: Optional[list[float]] = None
+    holiday_hours: Optional[list[float]] = None
+    company_size: str = "OVER_5"
+    raise_percent: float = 0
+    include_employees: bool = True  # False면 합계만 반환
+
+
+@router.post("/calculate")
+async def calculate(payload: dict = Body(...)):
+    """급여 계산 (SalaryCalculationRequest → SalaryCalculationResponse)"""
+    try:
+        return calculate_salary_request(payload)
+    except (KeyError, TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail={"error": f"잘못된 요청: {e}"})
+
+
+@router.post("/simulate")
+def simulate(request: BatchSimulationRequest):
+    """
+    급여 일괄 시뮬레이션
+    직원별 결과는 배열(열) 형식: {"net_pay": [...], "income_tax": [...], ...}
+    """
+    if len(request.base_salaries) > settings.payroll_batch_max_employees:
+        raise HTTPException(
+            status_code=413,
+            detail={"error": f"한 번에 최대 {settings.payroll_batch_max_employees:,}명까지 계산할 수 있습니다."},
+        )
+    try:
+        result = simulate_batch(
+            request.base_salaries,
+            request.weekly_hours,
+            request.dependents,
+            request.children_under_20,
+            request.overtime_hours,
+            request.night_hours,
+            request.holiday_hours,
+            company_size=request.company_size,
+            raise_percent=request.raise_percent,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail={"error": f"잘못된 요청: {e}"})
+
+    response = {"employee_count": len(result), "totals": result.totals()}
+    if request.include_employees:
+        response["employees"] = {name: getattr(result, name).tolist() for name in result.__dataclass_fields__}
+    return response
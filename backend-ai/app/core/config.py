@@ -23,27 +23,90 @@ class Settings(BaseSettings):
     google_api_key: str = ""
     groq_api_key: str = ""
     openai_api_key: str = ""
+    # 프로바이더 엔드포인트 ("" = 기본값, 부하 테스트 시 benchmarks/mock_upstreams.py 주소)
+    openai_base_url: str = ""
+    groq_base_url: str = ""
 
     # Law API
     law_api_key: str = ""
+    law_api_base_url: str = "http://www.law.go.kr/DRF"
 
     # Spring Boot API
     spring_api_url: str = "https://calcul-production.up.railway.app"
     internal_api_key: str = ""
+    spring_cache_ttl: int = 60  # 직원/급여대장 조회 캐시 TTL (초)
+    spring_http_timeout: float = 30.0
+    spring_http_max_connections: int = 100
+    spring_http_max_keepalive: int = 20
+    spring_http_keepalive_expiry: float = 30.0
+    spring_http2: bool = False  # h2 패키지 설치 시에만 적용
+    spring_fanout_concurrency: int = 6  # 도구 1회 호출에서 동시에 보내는 Spring 조회 수 (기간별 급여대장 등)
+    profile_cache_size: int = 10000  # JWT → 사용자 프로필(이름/이메일) 캐시 최대 항목 수
+    profile_cache_max_ttl: int = 3600  # 초, 토큰 exp가 더 빠르면 exp까지
+    profile_stale_max_ttl: int = 86400  # 초, Spring 장애 시 마지막 인증 결과를 쓰는 최대 시간 (토큰 exp까지)
 
     # Server
     host: str = "0.0.0.0"
     port: int = 8001
     debug: bool = False
 
+    # SSE 스트리밍 (토큰 병합/하트비트/백프레셔)
+    sse_coalesce_delay: float = 0.05  # 초, 첫 토큰 이후 이 시간 동안 모아서 한 프레임으로
+    sse_coalesce_bytes: int = 1024  # 모인 토큰이 이 크기를 넘으면 즉시 전송
+    sse_heartbeat_interval: float = 10.0  # 초, 이벤트가 없을 때 heartbeat 주석 전송
+    sse_queue_size: int = 64  # 생성 → 전송 큐 크기 (가득 차면 생성 일시 정지)
+    sse_send_timeout: float = 30.0  # 초, 한 프레임 전송이 이보다 오래 걸리면 연결 종료
+    sse_resume_grace: float = 30.0  # 초, 연결이 끊긴 뒤 재연결을 기다리며 생성을 계속하는 시간 (0이면 즉시 중단)
+    sse_resume_ttl: int = 120  # 초, 완료된 응답을 Last-Event-ID 재연결용으로 보관하는 시간
+    sse_resume_max_frames: int = 512  # 스트림당 보관 프레임 수 (연결된 리더가 이만큼 뒤처지면 생성 일시 정지)
+    sse_resume_max_streams: int = 5000  # 보관 스트림 수 상한
+
+    # 대화 세션 저장소 (LRU + 유휴 TTL)
+    session_max_sessions: int = 10000
+    session_idle_ttl: int = 3600  # 초, 마지막 사용 이후 유지 시간
+    # 공유 세션 백엔드 ("" = 워커 메모리만, "postgres" = 다중 워커/레플리카, "local" = 테스트용)
+    session_backend: str = ""
+    session_state_ttl: int = 604800  # 초, 공유 세션 상태 보관 기간 (7일)
+    session_sync_fresh_seconds: float = 5.0  # 초, 갱신 알림 연결이 없을 때 로컬 사본을 버전 조회 없이 쓰는 시간
+
+    # 대화 히스토리 DB 기록 (write-behind)
+    history_flush_interval: float = 2.0  # 초
+    history_batch_size: int = 500  # 큐가 이 크기를 넘으면 주기 전에 flush
+    history_max_buffer: int = 20000  # DB 장애 시 보관할 최대 메시지 수
+    history_load_timeout: float = 2.0  # 세션 지연 로드 타임아웃 (초)
+
+    # AI_CHAT 사용량 리스 (Spring에서 블록 단위 예약 후 로컬 차감)
+    usage_lease_size: int = 5
+    usage_lease_ttl: int = 300  # 초, 만료 시 미사용분 반환
+    usage_lease_low_watermark: int = 1  # 잔량이 이 이하가 되면 백그라운드 갱신
+    usage_provisional_limit: int = 3  # Spring 장애 시 사용자별 임시 허용 횟수
+    usage_exhausted_recheck: int = 60  # 한도 초과 후 재조회 간격 (초)
+
     # Rate Limiting
     free_tier_requests_per_hour: int = 30
     pro_tier_requests_per_hour: int = 300
+    # 워커 간 공유 한도 ("" = 워커별, "postgres" = 공유 카운터, "local" = 테스트용)
+    rate_limit_backend: str = ""
+    rate_limit_local_allowance: int = 5  # 공유 모드에서 한 번에 확보하는 최대 요청 수
 
     # LLM Settings
     llm_temperature: float = 0.3
     llm_timeout: int = 30
 
+    # Tool 실행 제한 시간 (도구별, 초)
+    tool_timeout: int = 30
+
+    # 급여 일괄 시뮬레이션
+    payroll_batch_max_employees: int = 10000  # 요청당 최대 직원 수
+    payroll_batch_tool_rows: int = 20  # 도구 응답에 포함할 직원별 결과 수 (나머지는 합계만)
+
+    # LLM Hedging (1순위 티어 지연 시 다음 티어로 중복 요청)
+    llm_hedge_enabled: bool = False
+    llm_hedge_percentile: float = 0.9  # 1순위 티어 지연시간 백분위 도달 시 헤지
+    llm_hedge_default_delay: float = 8.0  # 지연 샘플이 부족할 때 사용할 대기 시간(초)
+    llm_hedge_min_delay: float = 1.0
+    llm_hedge_budget_ratio: float = 0.1  # 전체 요청 대비 헤지 요청 비율 상한
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,97 @@
+"""
+Spring API 공용 HTTP 클라이언트
+앱 전체에서 하나의 커넥션 풀을 공유 (keep-alive, 선택적 HTTP/2)
+lifespan에서 생성/종료
+"""
+
+import logging
+from typing import Optional
+
+import httpx
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_spring_client: Optional[httpx.AsyncClient] = None
+_stats = {"requests": 0, "responses": 0, "server_errors": 0}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+async def _on_request(request: httpx.Request):
+    _stats["requests"] += 1
+
+
+async def _on_response(response: httpx.Response):
+    _stats["responses"] += 1
+    if response.status_code >= 500:
+        _stats["server_errors"] += 1
+
+
+def _create_client() -> httpx.AsyncClient:
+    http2 = settings.spring_http2 and _http2_available()
+    if settings.spring_http2 and not http2:
+        logger.warning("SPRING_HTTP2 requested but 'h2' is not installed, using HTTP/1.1")
+
+    logger.info(
+        f"Spring HTTP client ready (max_connections={settings.spring_http_max_connections}, "
+        f"keepalive={settings.spring_http_max_keepalive}, http2={http2})"
+    )
+    return httpx.AsyncClient(
+        base_url=settings.spring_api_url,
+        timeout=settings.spring_http_timeout,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.spring_http_max_connections,
+            max_keepalive_connections=settings.spring_http_max_keepalive,
+            keepalive_expiry=settings.spring_http_keepalive_expiry,
+        ),
+        event_hooks={"request": [_on_request], "response": [_on_response]},
+    )
+
+
+async def init_spring_client():
+    """앱 시작 시 공용 클라이언트 생성"""
+    global _spring_client
+    if _spring_client is None:
+        _spring_client = _create_client()
+
+
+async def close_spring_client():
+    """앱 종료 시 커넥션 풀 정리"""
+    global _spring_client
+    if _spring_client is not None:
+        await _spring_client.aclose()
+        _spring_client = None
+
+
+def get_spring_client() -> httpx.AsyncClient:
+    """공용 Spring 클라이언트 (lifespan 밖에서 호출되면 지연 생성)"""
+    global _spring_client
+    if _spring_client is None:
+        _spring_client = _create_client()
+    return _spring_client
+
+
+def get_spring_pool_stats() -> dict:
+    """커넥션 풀 통계 (풀 크기 조정용)"""
+    stats = dict(_stats)
+    stats["max_connections"] = settings.spring_http_max_connections
+    stats["max_keepalive"] = settings.spring_http_max_keepalive
+
+    pool = getattr(getattr(_spring_client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if connections is not None:
+        stats["connections"] = len(connections)
+        stats["idle_connections"] = sum(1 for c in connections if c.is_idle())
+        stats["active_connections"] = stats["connections"] - stats["idle_connections"]
+        stats["http2_connections"] = sum(1 for c in connections if "HTTP/2" in repr(c))
+    return stats
@@ -0,0 +1,37 @@
+"""
+JWT 토큰 유틸리티
+서명 검증은 Spring API가 담당하므로 여기서는 클레임만 읽음 (캐시 키/만료 계산 용도, 사용자 식별은 services/user_profile.py)
+"""
+
+import base64
+import hashlib
+import json
+import time
+
+
+def decode_token_claims(token: str) -> dict:
+    """JWT 페이로드 디코딩 (서명 검증 없음, 실패 시 빈 dict)"""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload))
+    except (IndexError, ValueError):
+        return {}
+
+
+def token_fingerprint(token: str) -> str:
+    """캐시 키용 토큰 지문 (원문 토큰을 메모리 키로 두지 않음)"""
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+def token_ttl(token: str, max_ttl: float) -> float:
+    """
+    토큰 만료(exp)까지 남은 시간 (초, 최대 max_ttl)
+    exp가 없으면 max_ttl, 이미 만료됐으면 0
+    """
+    exp = decode_token_claims(token).get("exp")
+    try:
+        remaining = float(exp) - time.time()
+    except (TypeError, ValueError):
+        return max_ttl
+    return max(0.0, min(max_ttl, remaining))
@@ -0,0 +1,386 @@
+"""
+SSE 이벤트 송신기
+에이전트 이벤트를 SSE 프레임으로 변환 (토큰 병합, 하트비트, 백프레셔, 재연결 이어받기)
+
+- token 이벤트는 시간(max_delay)/크기(max_bytes) 기준으로 모아서 한 프레임으로 전송
+- 도구 실행 등으로 이벤트가 없으면 heartbeat 주석 프레임 전송 (프록시 유휴 타임아웃 방지)
+- 생성 작업과 병합 단계 사이에 크기 제한 큐를 두어 생성 속도를 제한
+- 모든 프레임에 "{stream_id}:{seq}" id를 붙이고 최근 프레임을 보관
+  → 연결이 끊겨도 Last-Event-ID로 재연결하면 재생성/재차감 없이 이어서 전송
+- 보관 버퍼가 가득 차면 연결된 리더 중 가장 느린 리더가 가장 오래된 프레임을 보낼 때까지 생성 일시 정지
+  (느린 클라이언트도 끝까지 받음, 연결된 리더가 없으면 오래된 프레임부터 밀려남)
+- 연결이 끊긴 뒤 유예 시간 안에 재연결이 없으면 생성 작업 취소
+"""
+
+import asyncio
+import hmac
+import itertools
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterator, Optional
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_END = object()
+
+# 전체 스트림 누적 통계
+_stats = {
+    "streams": 0,
+    "completed": 0,
+    "abandoned": 0,
+    "disconnected": 0,
+    "resumed": 0,
+    "resume_misses": 0,
+    "events": 0,
+    "token_events": 0,
+    "frames": 0,
+    "replayed_frames": 0,
+    "heartbeats": 0,
+    "bytes": 0,
+}
+
+
+def _encode_data(data: Any) -> str:
+    if isinstance(data, (dict, list)):
+        return json.dumps(data, ensure_ascii=False)
+    return "" if data is None else str(data)
+
+
+class SSEEmitter:
+    """
+    에이전트 이벤트({"type", "data"}) 스트림 → SSE dict 스트림
+
+    생성(에이전트 → 큐 → 토큰 병합 → 프레임 버퍼)은 응답 연결과 분리된 작업으로 실행되고,
+    stream()은 버퍼에서 읽어 보내는 리더이므로 같은 응답을 재연결로 이어 읽을 수 있음
+    """
+
+    def __init__(
+        self,
+        events: AsyncIterator[dict],
+        owner: str = "",
+        max_delay: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        heartbeat: Optional[float] = None,
+        queue_size: Optional[int] = None,
+        replay_frames: Optional[int] = None,
+        grace: Optional[float] = None,
+    ):
+        self.events = events
+        self.owner = owner  # 재연결 허용 대상 (토큰 지문)
+        self.stream_id = uuid.uuid4().hex
+        self.max_delay = settings.sse_coalesce_delay if max_delay is None else max_delay
+        self.max_bytes = settings.sse_coalesce_bytes if max_bytes is None else max_bytes
+        self.heartbeat = settings.sse_heartbeat_interval if heartbeat is None else heartbeat
+        self.grace = settings.sse_resume_grace if grace is None else grace
+        self._queue: asyncio.Queue = asyncio.Queue(
+            maxsize=settings.sse_queue_size if queue_size is None else queue_size
+        )
+        # 최근 프레임 (seq, frame), 오래된 프레임부터 밀려남
+        self._frames: deque = deque(maxlen=settings.sse_resume_max_frames if replay_frames is None else replay_frames)
+        self._next_seq = 1
+        self._changed = asyncio.Event()
+        self._cursors: dict[int, int] = {}  # 연결된 리더 → 마지막으로 보낸 seq
+        self._reader_ids = itertools.count()
+        self._advanced: Optional[asyncio.Event] = None  # 생성 작업이 느린 리더를 기다리는 중
+        self._pump: Optional[asyncio.Task] = None
+        self._abandon_handle: Optional[asyncio.TimerHandle] = None
+        self.readers = 0
+        self.done = False
+        self.expires_at = float("inf")  # 완료 후 재연결 허용 기한 (registry가 사용)
+        self.frames = 0
+        self.token_events = 0
+
+    async def _produce(self):
+        """에이전트 이벤트를 큐로 전달 (큐가 가득 차면 대기 → 생성도 멈춤)"""
+        try:
+            async for event in self.events:
+                await self._queue.put(event)
+                if event.get("type") in ("done", "error"):
+                    break
+        except asyncio.CancelledError:
+            # 병합 단계가 이미 종료됨 → 에이전트 제너레이터만 정리
+            await self._close_events()
+            raise
+        except Exception as e:
+            logger.error(f"SSE producer error: {e}")
+            await self._queue.put({"type": "error", "data": str(e)})
+        await self._close_events()
+        await self._queue.put(_END)
+
+    async def _close_events(self):
+        aclose = getattr(self.events, "aclose", None)
+        if aclose is not None:
+            try:
+                await aclose()
+            except Exception as e:
+                logger.debug(f"SSE event source close failed: {e}")
+
+    def _frame(self, event: str, data: str) -> dict:
+        self.frames += 1
+        _stats["frames"] += 1
+        _stats["bytes"] += len(data.encode())
+        return {"event": event, "data": data}
+
+    async def _coalesce(self) -> AsyncIterator[dict]:
+        """큐의 이벤트를 프레임으로 변환 (토큰은 병합)"""
+        producer = asyncio.create_task(self._produce())
+        pending: list[str] = []
+        pending_bytes = 0
+        flush_at = 0.0
+        finished = False
+        try:
+            while not finished:
+                if pending:
+                    # 병합 마감 시각까지 한 번만 대기 후 그동안 쌓인 이벤트를 한꺼번에 처리 (토큰마다 깨어나지 않음)
+                    delay = flush_at - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    batch = []
+                    while not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                else:
+                    batch = [await self._queue.get()]
+
+                for event in batch:
+                    if event is _END:
+                        finished = True
+                        break
+                    _stats["events"] += 1
+
+                    event_type = event.get("type", "token")
+                    if event_type == "token":
+                        data = event.get("data") or ""
+                        if not data:
+                            continue
+                        self.token_events += 1
+                        _stats["token_events"] += 1
+                        if not pending:
+                            flush_at = time.monotonic() + self.max_delay
+                        pending.append(data)
+                        pending_bytes += len(data)
+                        if pending_bytes >= self.max_bytes:
+                            yield self._frame("token", "".join(pending))
+                            pending.clear()
+                            pending_bytes = 0
+                        continue
+
+                    # 토큰 외 이벤트는 순서 유지를 위해 모아둔 토큰부터 전송
+                    if pending:
+                        yield self._frame("token", "".join(pending))
+                        pending.clear()
+                        pending_bytes = 0
+                    yield self._frame(event_type, _encode_data(event.get("data", "")))
+                    if event_type in ("done", "error"):
+                        finished = True
+                        break
+
+                if pending and (finished or time.monotonic() >= flush_at):
+                    yield self._frame("token", "".join(pending))
+                    pending.clear()
+                    pending_bytes = 0
+        finally:
+            # 생성 작업이 취소되면 에이전트 제너레이터도 중단
+            if not producer.done():
+                producer.cancel()
+
+    async def _run(self):
+        """생성 작업: 병합된 프레임에 id를 붙여 버퍼에 기록"""
+        _stats["streams"] += 1
+        completed = False
+        try:
+            async for frame in self._coalesce():
+                await self._wait_for_readers()
+                frame["id"] = f"{self.stream_id}:{self._next_seq}"
+                self._frames.append((self._next_seq, frame))
+                self._next_seq += 1
+                self._notify()
+            completed = True
+        finally:
+            self.done = True
+            # 중단된 응답은 이어받아도 끝이 없으므로 바로 만료
+            self.expires_at = time.monotonic() + (settings.sse_resume_ttl if completed else 0)
+            _stats["completed" if completed else "abandoned"] += 1
+            self._notify()
+
+    async def _wait_for_readers(self):
+        """
+        버퍼가 가득 찼고 연결된 리더가 가장 오래된 프레임을 아직 보내지 않았으면 대기 (백프레셔)
+        대기 중에는 병합 단계도 멈추므로 큐가 차고 에이전트 생성도 멈춤
+        """
+        while (
+            self._cursors
+            and self._frames
+            and len(self._frames) == self._frames.maxlen
+            and min(self._cursors.values()) < self._frames[0][0]
+        ):
+            self._advanced = asyncio.Event()
+            await self._advanced.wait()
+        self._advanced = None
+
+    def _advance(self, reader: int, seq: Optional[int]):
+        """리더 진행 기록 (seq가 None이면 연결 종료) → 기다리는 생성 작업 깨우기"""
+        if seq is None:
+            self._cursors.pop(reader, None)
+        else:
+            self._cursors[reader] = seq
+        if self._advanced is not None:
+            self._advanced.set()
+
+    def _notify(self):
+        """대기 중인 리더 전원 깨우기"""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def start(self):
+        if self._pump is None:
+            self._pump = asyncio.create_task(self._run())
+
+    def _release(self):
+        """리더가 모두 떠나면 유예 시간 후 생성 작업 취소 (그 사이 재연결하면 계속 진행)"""
+        if self.readers or self.done or self._pump is None:
+            return
+        if self.grace <= 0:
+            self._abandon()
+        else:
+            self._abandon_handle = asyncio.get_running_loop().call_later(self.grace, self._abandon)
+
+    def _abandon(self):
+        self._abandon_handle = None
+        if self.readers == 0 and self._pump is not None and not self._pump.done():
+            logger.info(f"SSE stream {self.stream_id} abandoned after {self.frames} frames")
+            self._pump.cancel()
+
+    async def stream(self, after: int = 0) -> AsyncIterator[dict]:
+        """
+        EventSourceResponse에 넘길 SSE dict 제너레이터
+
+        Args:
+            after: 이미 받은 마지막 프레임 번호 (재연결 시 Last-Event-ID의 seq)
+        """
+        self.start()
+        self.readers += 1
+        if self._abandon_handle is not None:
+            self._abandon_handle.cancel()
+            self._abandon_handle = None
+        cursor = after
+        reader = next(self._reader_ids)
+        self._advance(reader, cursor)
+        try:
+            while True:
+                first = self._frames[0][0] if self._frames else self._next_seq
+                if cursor + 1 < first:
+                    # 재연결 지점이 버퍼에서 이미 밀려남
+                    yield {"event": "error", "data": "이전 응답을 이어받을 수 없습니다. 다시 질문해주세요."}
+                    break
+                for seq, frame in list(itertools.islice(self._frames, cursor + 1 - first, None)):
+                    if after:
+                        _stats["replayed_frames"] += 1
+                    yield frame
+                    cursor = seq
+                    self._advance(reader, cursor)
+                if cursor + 1 < self._next_seq:
+                    continue  # 보내는 동안 추가된 프레임 (알림은 이미 지나감)
+                if self.done:
+                    break
+
+                changed = self._changed
+                try:
+                    async with asyncio.timeout(self.heartbeat):
+                        await changed.wait()
+                except TimeoutError:
+                    _stats["heartbeats"] += 1
+                    yield {"comment": "heartbeat"}
+        finally:
+            self.readers -= 1
+            self._advance(reader, None)
+            if not self.done:
+                _stats["disconnected"] += 1
+                self._release()
+
+
+class StreamRegistry:
+    """
+    재연결용 스트림 보관소
+
+    - 진행 중인 스트림 + 완료 후 ttl 동안의 스트림을 stream_id로 조회
+    - 최대 개수 초과 시 오래된 스트림부터 제외 (제외된 스트림은 끝까지 전송되지만 이어받기 불가)
+    """
+
+    def __init__(self, maxsize: int = 5000):
+        self.maxsize = maxsize
+        self._streams: OrderedDict[str, SSEEmitter] = OrderedDict()
+        self.evictions = 0
+
+    def register(self, emitter: SSEEmitter) -> SSEEmitter:
+        self.purge_expired()
+        self._streams[emitter.stream_id] = emitter
+        while len(self._streams) > self.maxsize:
+            self._streams.popitem(last=False)
+            self.evictions += 1
+        return emitter
+
+    def resume(self, last_event_id: str, owner: str) -> Optional[tuple[SSEEmitter, int]]:
+        """
+        Last-Event-ID("{stream_id}:{seq}")로 스트림 조회
+
+        Returns:
+            (emitter, 마지막으로 받은 seq) 또는 None (만료/다른 사용자/형식 오류)
+        """
+        stream_id, _, seq = last_event_id.strip().partition(":")
+        emitter = self._streams.get(stream_id)
+        if (
+            emitter is None
+            or not seq.isdigit()
+            or emitter.expires_at <= time.monotonic()
+            or not hmac.compare_digest(emitter.owner, owner)
+        ):
+            _stats["resume_misses"] += 1
+            return None
+        _stats["resumed"] += 1
+        return emitter, int(seq)
+
+    def purge_expired(self) -> int:
+        """만료된 스트림 정리 (앞쪽부터, 진행 중인 스트림을 만나면 중단)"""
+        now = time.monotonic()
+        removed = 0
+        while self._streams:
+            stream_id, emitter = next(iter(self._streams.items()))
+            if emitter.expires_at > now:
+                break
+            del self._streams[stream_id]
+            removed += 1
+        return removed
+
+    def get_stats(self) -> dict:
+        self.purge_expired()
+        return {
+            "retained_streams": len(self._streams),
+            "running_streams": sum(1 for e in self._streams.values() if not e.done),
+            "max_streams": self.maxsize,
+            "evictions": self.evictions,
+        }
+
+
+# 싱글톤 인스턴스
+_stream_registry: Optional[StreamRegistry] = None
+
+
+def get_stream_registry() -> StreamRegistry:
+    global _stream_registry
+    if _stream_registry is None:
+        _stream_registry = StreamRegistry(settings.sse_resume_max_streams)
+    return _stream_registry
+
+
+def get_sse_stats() -> dict:
+    stats = dict(_stats)
+    stats["frames_per_stream"] = round(stats["frames"] / stats["streams"], 2) if stats["streams"] else 0.0
+    stats["tokens_per_frame"] = round(stats["token_events"] / stats["frames"], 2) if stats["frames"] else 0.0
+    stats["registry"] = get_stream_registry().get_stats()
+    return stats
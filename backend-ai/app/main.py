@@ -9,6 +9,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import get_settings
+from app.core.http import init_spring_client, close_spring_client
 
 # 로깅 설정 (Railway에서 로그 출력)
 logging.basicConfig(
@@ -16,7 +17,13 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 from app.db.database import init_db
-from app.api import chat, health
+from app.api import chat, health, payroll
+from app.services.llm import get_tiered_llm
+from app.services.tools import TOOL_SETS
+from app.services.usage_writer import get_usage_writer
+from app.services.usage_meter import get_usage_meter
+from app.services.chat_history import get_history_writer
+from app.services.session_backend import get_session_sync
 
 settings = get_settings()
 
@@ -30,8 +37,40 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         import logging
         logging.warning(f"DB 초기화 실패 (서비스는 계속): {e}")
+
+    # 티어 × 도구 세트 바인딩 사전 생성 (요청마다 스키마 재직렬화 방지)
+    try:
+        get_tiered_llm().prebind_tools(TOOL_SETS)
+    except Exception as e:
+        logging.warning(f"Tool 바인딩 사전 생성 실패: {e}")
+
+    # Spring API 공용 커넥션 풀
+    await init_spring_client()
+
+    # 토큰 사용량 배치 기록 시작
+    usage_writer = get_usage_writer()
+    usage_writer.start()
+
+    # 대화 히스토리 DB 기록 시작
+    history_writer = get_history_writer()
+    history_writer.start()
+
+    # 공유 세션 백엔드 (SESSION_BACKEND 설정 시)
+    session_sync = get_session_sync()
+    if session_sync is not None:
+        session_sync.start()
+
+    # AI_CHAT 사용량 리스 정산 시작
+    usage_meter = get_usage_meter()
+    usage_meter.start()
     yield
-    # 종료 시 정리 작업
+    # 종료 시 정리 작업: 미사용 리스 반환, 남은 대화/토큰 사용량 기록, 커넥션 풀 종료
+    await usage_meter.stop()
+    if session_sync is not None:
+        await session_sync.stop()
+    await history_writer.stop()
+    await usage_writer.stop()
+    await close_spring_client()
 
 
 app = FastAPI(
@@ -54,6 +93,7 @@ app.add_middleware(
 # 라우터 등록
 app.include_router(health.router, tags=["Health"])
 app.include_router(chat.router, prefix="/api/v1/chat", tags=["Chat"])
+app.include_router(payroll.router, prefix="/api/v1/payroll", tags=["Payroll"])
 
 
 @app.get("/")
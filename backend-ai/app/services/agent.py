@@ -3,20 +3,29 @@ LangGraph Agent 서비스
 스트리밍 응답 처리 + RAG (법령 검색) + Tool Calling + 대화 히스토리
 """
 
+import asyncio
 import logging
 import json
-import httpx
-from typing import AsyncGenerator, Optional
-from collections import defaultdict
+import time
+import uuid
+from typing import AsyncGenerator, Optional, Union
 from dataclasses import dataclass, field
 
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage, ToolMessage
 
 from app.services.llm import get_tiered_llm
-from app.services.prompts import SYSTEM_PROMPT
-from app.services.rag import get_rag_service
-from app.services.tools import ALL_TOOLS, GENERAL_TOOLS, USER_DATA_TOOLS, set_user_token
+from app.services.prompts import SYSTEM_PROMPT, STATIC_PROMPT_MEMBER, STATIC_PROMPT_GUEST
+from app.services.rag import get_rag_service, RAGContext
+from app.services.summarizer import get_summarizer
+from app.services.session_store import UserSession, get_session_store, session_key
+from app.services.chat_history import get_history_writer
+from app.services.session_backend import get_session_sync
+from app.services.fast_path import try_fast_path
+from app.services.usage_writer import set_usage_user
+from app.services.user_profile import get_user_profile, verified_user_id
+from app.services.tools import ALL_TOOLS, GENERAL_TOOLS, TOOL_MAP, set_user_token
 from app.core.config import get_settings
+from app.core.security import token_fingerprint
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -24,87 +33,316 @@ settings = get_settings()
 
 # ==================== 세션 관리 ====================
 
-@dataclass
-class UserSession:
-    """사용자 세션 정보"""
-    user_name: str = ""
-    user_email: str = ""
-    messages: list = field(default_factory=list)  # [(role, content), ...]
-
-# 세션 저장소 (메모리 기반, 추후 Redis/DB로 전환 가능)
-_sessions: dict[str, UserSession] = defaultdict(UserSession)
+# 세션 저장소: LRU + 유휴 TTL (services/session_store.py)
+# 로그인 사용자의 대화는 services/chat_history.py에서 DB에 write-behind 기록
 MAX_HISTORY = 10  # 최대 대화 히스토리 수
 
 
-async def _fetch_user_info(token: str) -> tuple[str, str]:
-    """사용자 기본 정보 (이름, 이메일) 조회"""
-    try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(
-                f"{settings.spring_api_url}/api/v1/auth/me",
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            if resp.status_code == 200:
-                data = resp.json().get("data", {})
-                return data.get("name", ""), data.get("email", "")
-    except Exception as e:
-        logger.warning(f"User info fetch failed: {e}")
-    return "", ""
+def _session_owner(user_id: Optional[uuid.UUID], user_token: Optional[str]) -> Union[uuid.UUID, str, None]:
+    """
+    세션 소유자 (Spring이 인증한 user_id)
+    인증되지 않은 토큰은 토큰별 워커 메모리 세션만 사용 (토큰 sub만으로는 다른 사용자 대화에 접근 불가)
+    """
+    if user_id is not None:
+        return user_id
+    return f"token:{token_fingerprint(user_token)}" if user_token else None
+
+
+async def _get_session(
+    session_id: Optional[str],
+    user_id: Optional[uuid.UUID],
+    user_token: Optional[str],
+) -> UserSession:
+    """
+    세션 조회 순서
+    1. 워커 메모리 (공유 백엔드 사용 시 갱신 알림이 있거나 오래된 사본만 버전 확인)
+    2. 공유 세션 백엔드 (다른 워커가 처리한 대화)
+    3. DB 대화 기록 (로그인 + session_id가 있을 때)
+
+    user_id는 verified_user_id()로 확인된 값만 전달
+    """
+    store = get_session_store()
+    # 공유 백엔드는 소유자가 확인되는 로그인 세션만 사용
+    sync = get_session_sync() if session_id and user_id is not None else None
+    key = session_key(session_id, _session_owner(user_id, user_token))
+    session = store.get(key)
+    if session is not None:
+        if sync is not None:
+            session = await sync.refresh(user_id, session_id, session)
+        return session
+
+    loaded = await sync.load(user_id, session_id) if sync is not None else None
+    if loaded is None and session_id and user_id is not None:
+        loaded = await get_history_writer().load(session_id, user_id, MAX_HISTORY * 2)
+
+    # 로드 중 다른 요청이 먼저 등록한 세션이 있으면 그대로 사용
+    session = store.get(key)
+    if session is not None:
+        return session
+    if loaded is not None:
+        return store.put(key, loaded)
+    return store.get_or_create(key)
+
+
+def _save_exchange(
+    session: UserSession,
+    session_id: Optional[str],
+    user_id: Optional[uuid.UUID],
+    message: str,
+    answer: str,
+):
+    """대화 한 턴 저장: 메모리 히스토리 → 공유 세션/DB 기록 큐 → 요약 예약 (모두 즉시 반환)"""
+    session.add_exchange(message, answer, MAX_HISTORY * 2)
+
+    sync = get_session_sync() if session_id and user_id is not None else None
+    if sync is not None:
+        sync.persist(user_id, session_id, session, session.messages[-2:], MAX_HISTORY * 2)
+
+    if session_id and user_id is not None:
+        get_history_writer().record(session_id, user_id, session.messages[-2:])
+
+    # 오래된 대화는 백그라운드에서 요약으로 접기
+    get_summarizer().schedule(session)
+
+
+def _build_messages(
+    static_prompt: str,
+    session: UserSession,
+    message: str,
+    context_text: str = "",
+    user_name: str = "",
+) -> list:
+    """
+    LLM 메시지 구성 (프로바이더 프롬프트 캐시 친화적 순서)
+
+    1. 고정 시스템 프롬프트 (모든 요청에서 동일 → 캐시 프리픽스)
+    2. 사용자/세션 정보 (사용자 이름, 이전 대화 요약)
+    3. 최근 대화 히스토리 (최대 MAX_HISTORY개)
+    4. 이번 턴 법령 컨텍스트 (RAG)
+    5. 현재 사용자 메시지
+    """
+    messages = [SystemMessage(content=static_prompt)]
+
+    session_parts = []
+    if user_name:
+        session_parts.append(f"현재 사용자: {user_name}님")
+    if session.summary:
+        session_parts.append(f"[이전 대화 요약]\n{session.summary}")
+    if session_parts:
+        messages.append(SystemMessage(content="\n\n".join(session_parts)))
+
+    for role, content in session.messages[-MAX_HISTORY:]:
+        if role == "user":
+            messages.append(HumanMessage(content=content))
+        else:
+            messages.append(AIMessage(content=content))
+
+    if context_text:
+        messages.append(SystemMessage(content=context_text))
+
+    messages.append(HumanMessage(content=message))
+    return messages
 
 
 async def _execute_tool(tool_name: str, tool_args: dict) -> str:
     """Tool 실행 및 결과 반환"""
-    tool_map = {t.name: t for t in ALL_TOOLS}
-
-    if tool_name not in tool_map:
+    if tool_name not in TOOL_MAP:
         return json.dumps({"error": f"Unknown tool: {tool_name}"})
 
     try:
-        tool = tool_map[tool_name]
-        result = await tool.ainvoke(tool_args)
+        tool = TOOL_MAP[tool_name]
+        result = await asyncio.wait_for(tool.ainvoke(tool_args), timeout=settings.tool_timeout)
         return json.dumps(result, ensure_ascii=False, default=str)
+    except asyncio.TimeoutError:
+        logger.error(f"Tool timeout ({tool_name}) after {settings.tool_timeout}s")
+        return json.dumps({"error": f"{tool_name} 응답 시간 초과"}, ensure_ascii=False)
     except Exception as e:
         logger.error(f"Tool execution error ({tool_name}): {e}")
         return json.dumps({"error": str(e)})
 
 
-async def _invoke_with_fallback(tiered_llm, messages: list, tools: list):
-    """LLM 호출 with fallback (Tool Calling 지원)"""
-    logger.info(f"_invoke_with_fallback called, tiers: {[n for n,_ in tiered_llm.tiers]}, messages: {len(messages)}")
+async def _execute_indexed(index: int, tool_name: str, tool_args: dict) -> tuple[int, str]:
+    """동시 실행용 래퍼 (완료 순서와 무관하게 원래 위치를 함께 반환)"""
+    return index, await _execute_tool(tool_name, tool_args)
+
+
+async def _stream_tier(tiered_llm, name: str, messages: list, tools: list) -> AsyncGenerator:
+    """단일 티어 스트리밍 호출 (Circuit Breaker + 첫 청크 지연시간 기록)"""
+    cb = tiered_llm.circuit_breakers[name]
+    started = time.monotonic()
+    first = True
+    try:
+        llm_with_tools = tiered_llm.bind_tools(name, tools)
+        async for chunk in llm_with_tools.astream(messages):
+            if first:
+                tiered_llm.latency[name].record(time.monotonic() - started)
+                first = False
+            tiered_llm.record_usage(name, chunk)
+            yield chunk
+    except Exception:
+        cb.record_failure()
+        raise
+    cb.record_success()
+    logger.info(f"LLM stream from {name} finished in {time.monotonic() - started:.2f}s")
+
+
+async def _open_stream(tiered_llm, name: str, messages: list, tools: list):
+    """스트림을 열고 첫 청크까지 수신 (빈 스트림이면 첫 청크 None)"""
+    stream = _stream_tier(tiered_llm, name, messages, tools)
+    try:
+        return stream, await anext(stream, None)
+    except BaseException:
+        await stream.aclose()
+        raise
+
+
+async def _stream_hedged(tiered_llm, primary: tuple, secondary: tuple, messages: list, tools: list):
+    """
+    헤지 스트리밍: 1순위 티어의 첫 청크가 지연 백분위 안에 오지 않으면 다음 티어에 동시 요청
+    먼저 첫 청크를 보낸 스트림을 끝까지 사용하고 나머지 요청은 취소
+
+    Returns:
+        (stream, first_chunk)
+    """
+    p_name, _ = primary
+    s_name, _ = secondary
+    tiered_llm.hedge_budget.on_request()
+    delay = tiered_llm.hedge_delay(p_name)
+
+    primary_task = asyncio.create_task(_open_stream(tiered_llm, p_name, messages, tools))
+    pending = {primary_task}
+    try:
+        done, pending = await asyncio.wait(pending, timeout=delay)
+        if done:
+            try:
+                return primary_task.result()
+            except Exception as e:
+                logger.warning(f"{p_name} failed: {e}")
+                return await _open_stream(tiered_llm, s_name, messages, tools)
+
+        if not tiered_llm.hedge_budget.try_acquire():
+            logger.info(f"Hedge budget exhausted, waiting for {p_name}")
+            try:
+                return await primary_task
+            except Exception as e:
+                logger.warning(f"{p_name} failed: {e}")
+                return await _open_stream(tiered_llm, s_name, messages, tools)
+
+        logger.info(f"Hedging {p_name} -> {s_name} after {delay:.1f}s")
+        pending.add(asyncio.create_task(_open_stream(tiered_llm, s_name, messages, tools)))
+        last_error = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            winner = None
+            for task in done:
+                if task.exception() is not None:
+                    last_error = task.exception()
+                    logger.warning(f"Hedged request failed: {last_error}")
+                elif winner is None:
+                    winner = task.result()
+                else:
+                    await task.result()[0].aclose()  # 동시에 도착한 나머지 스트림 정리
+            if winner is not None:
+                return winner
+        raise last_error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _stream_with_fallback(tiered_llm, messages: list, tools: list) -> AsyncGenerator:
+    """
+    LLM 스트리밍 with fallback (Tool Calling 지원, 선택적 헤지)
+    첫 청크를 받기 전 실패만 다음 티어로 넘김 (이미 보낸 토큰은 되돌릴 수 없음)
+    """
+    logger.info(f"_stream_with_fallback called, tiers: {[n for n,_ in tiered_llm.tiers]}, messages: {len(messages)}")
     last_error = None
 
+    candidates = []
     for name, llm in tiered_llm.tiers:
-        cb = tiered_llm.circuit_breakers[name]
-        if not cb.can_execute():
+        if tiered_llm.circuit_breakers[name].can_execute():
+            candidates.append((name, llm))
+        else:
             logger.debug(f"Skipping {name} (circuit open)")
-            continue
+
+    i = 0
+    while i < len(candidates):
+        name, _ = candidates[i]
 
         try:
-            llm_with_tools = llm.bind_tools(tools)
-            response = await llm_with_tools.ainvoke(messages)
-            cb.record_success()
-
-            # 상세 로깅
-            content = getattr(response, 'content', '')
-            tool_calls = getattr(response, 'tool_calls', [])
-            logger.info(f"LLM response from {name}: content_len={len(content) if content else 0}, tool_calls={len(tool_calls)}")
-            if content:
-                logger.debug(f"Content preview: {content[:100]}...")
-
-            return response
+            # 헤지 모드: 현재 티어와 다음 티어를 한 쌍으로 호출
+            if settings.llm_hedge_enabled and i + 1 < len(candidates):
+                step = 2
+                stream, first = await _stream_hedged(tiered_llm, candidates[i], candidates[i + 1], messages, tools)
+            else:
+                step = 1
+                stream, first = await _open_stream(tiered_llm, name, messages, tools)
         except Exception as e:
-            cb.record_failure()
             last_error = e
             logger.warning(f"{name} failed: {e}")
+            i += step
             continue
 
+        try:
+            if first is not None:
+                yield first
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await stream.aclose()
+        return
+
     raise RuntimeError(f"All LLM tiers failed: {last_error}")
 
 
+@dataclass
+class PreparedContext:
+    """LLM 호출 전 준비 데이터 (사용자 이름 + RAG 컨텍스트)"""
+    user_name: str
+    rag_context: RAGContext
+    timings: dict = field(default_factory=dict)  # 단계별 소요 시간 (ms)
+
+
+async def _timed(coro, timings: dict, stage: str):
+    """코루틴 실행 시간을 timings[stage]에 ms 단위로 기록"""
+    started = time.monotonic()
+    try:
+        return await coro
+    finally:
+        timings[stage] = round((time.monotonic() - started) * 1000)
+
+
+async def prepare_context(
+    message: str,
+    session_id: Optional[str] = None,
+    user_token: Optional[str] = None,
+) -> PreparedContext:
+    """사용자 정보 조회와 RAG 검색을 동시에 실행 (서로 독립적인 네트워크 구간)"""
+    timings: dict = {}
+    rag_task = asyncio.ensure_future(_timed(get_rag_service().get_context(message), timings, "rag"))
+    try:
+        # 세션 소유자 확인에 프로필이 필요하므로 프로필 → 세션 순서 (RAG는 그동안 진행)
+        profile = await _timed(get_user_profile(user_token), timings, "user_info")
+        user_id = profile.user_id if profile is not None else None
+        session = await _timed(_get_session(session_id, user_id, user_token), timings, "session")
+    except BaseException:
+        rag_task.cancel()
+        raise
+
+    if profile is not None and not session.user_name:
+        session.user_name = profile.name
+        session.user_email = profile.email
+        logger.info(f"User info loaded: {profile.name}")
+    rag_context = await rag_task
+
+    return PreparedContext(user_name=session.user_name, rag_context=rag_context, timings=timings)
+
+
 async def get_agent_response(
     message: str,
     session_id: Optional[str] = None,
     user_token: Optional[str] = None,
+    prepared: Optional[asyncio.Task] = None,
 ) -> AsyncGenerator[dict, None]:
     """
     에이전트 응답 스트리밍 (Tool Calling + 대화 히스토리)
@@ -113,129 +351,121 @@ async def get_agent_response(
         message: 사용자 메시지
         session_id: 세션 ID (대화 컨텍스트용)
         user_token: JWT 토큰 (사용자 데이터 조회용)
+        prepared: 미리 시작된 prepare_context 작업 (없으면 여기서 실행)
 
     Yields:
         {"type": "token"|"citation"|"tool_call"|"done"|"error", "data": ...}
     """
     try:
         tiered_llm = get_tiered_llm()
-        rag_service = get_rag_service()
 
         # 사용자 토큰 설정 (Tool에서 사용)
         set_user_token(user_token)
 
-        # 세션 관리 (session_id가 없으면 새 세션)
-        session_key = session_id or "default"
-        session = _sessions[session_key]
-
-        # 사용자 정보 조회 (세션에 없으면 API 호출)
-        user_name = session.user_name
-        if user_token and not user_name:
-            user_name, user_email = await _fetch_user_info(user_token)
-            session.user_name = user_name
-            session.user_email = user_email
-            logger.info(f"User info loaded: {user_name}")
-
-        # RAG: 관련 법령 컨텍스트 조회
-        rag_context = await rag_service.get_context(message)
-
-        # 시스템 프롬프트 구성
-        system_content = SYSTEM_PROMPT
-
-        # 사용자 이름 추가
-        if user_name:
-            system_content += f"\n\n현재 사용자: {user_name}님"
-
-        # Tool 사용 가능 여부 안내
-        if user_token:
-            system_content += """
-
-[사용 가능한 도구]
-로그인된 사용자이므로 다음 도구를 사용할 수 있습니다:
-- get_my_employees: 직원 목록 조회 ("직원 누구야", "직원 명단" 등)
-- get_employee_detail: 특정 직원 상세 조회 ("김철수 정보", "홍길동 급여" 등)
-- get_payroll_summary: 급여대장 요약 ("이번달 인건비", "급여 총액" 등)
-- get_monthly_labor_cost: 특정 월 인건비 조회
-- salary_calculator: 급여 계산 시뮬레이션
-- insurance_calculator: 4대보험 계산
-
-사용자가 직원이나 급여 데이터를 물어보면 반드시 도구를 사용하세요.
-"""
+        # 세션 관리 (session_id가 없으면 새 세션, 소유자는 Spring이 인증한 사용자)
+        user_id = await verified_user_id(user_token)
+        set_usage_user(user_id)
+        session = await _get_session(session_id, user_id, user_token)
+
+        # 계산기 질문은 LLM 없이 바로 처리 (모호하면 LLM 경로)
+        fast = await try_fast_path(message)
+        if fast:
+            if prepared is not None:
+                prepared.cancel()
+            yield {"type": "tool_call", "data": {"tool": fast.tool, "status": "start"}}
+            yield {
+                "type": "tool_call",
+                "data": {"tool": fast.tool, "status": "end", "result": json.dumps(fast.result, ensure_ascii=False)[:200]},
+            }
+            for line in fast.answer.splitlines(keepends=True):
+                yield {"type": "token", "data": line}
+            yield {"type": "citation", "data": fast.citations}
+
+            _save_exchange(session, session_id, user_id, message, fast.answer)
+
+            yield {"type": "done", "data": ""}
+            return
+
+        # 사용자 정보 + RAG 컨텍스트 (chat API에서 사용량 체크와 동시에 시작된 작업)
+        if prepared is None:
+            context = await prepare_context(message, session_id, user_token)
         else:
-            system_content += """
-
-[중요 안내]
-현재 로그인되어 있지 않습니다.
-직원 목록 조회, 급여대장 확인, 개인화된 급여 계산 등의 기능을 이용하시려면 로그인이 필요합니다.
-일반적인 노동법 상담, 급여 계산 시뮬레이션, 4대 보험 계산은 로그인 없이도 이용 가능합니다.
+            context = await prepared
+        user_name = context.user_name
+        rag_context = context.rag_context
+        logger.info(f"Preflight timings (ms): {context.timings}")
 
-비로그인 사용자에게는 면책 조항 대신 다음 문구를 사용하세요:
-"💡 로그인하시면 직원 관리, 급여대장 조회 등 더 많은 기능을 이용할 수 있습니다."
-"""
-
-        # 법령 컨텍스트 추가
+        # 프롬프트 구성 (고정 프리픽스 → 사용자/세션 → 히스토리 → 턴별 컨텍스트 → 질문)
+        static_prompt = STATIC_PROMPT_MEMBER if user_token else STATIC_PROMPT_GUEST
         if rag_context.context_text:
-            system_content += f"\n\n{rag_context.context_text}"
             logger.info(f"RAG: {len(rag_context.relevant_articles)} articles added")
-
-        # 메시지 구성 (시스템 + 이전 대화 + 현재 메시지)
-        messages = [SystemMessage(content=system_content)]
-
-        # 이전 대화 히스토리 추가 (최대 MAX_HISTORY개)
-        for role, content in session.messages[-MAX_HISTORY:]:
-            if role == "user":
-                messages.append(HumanMessage(content=content))
-            else:
-                messages.append(AIMessage(content=content))
-
-        # 현재 사용자 메시지 추가
-        messages.append(HumanMessage(content=message))
+        messages = _build_messages(static_prompt, session, message, rag_context.context_text, user_name)
 
         # Tool 바인딩 (로그인된 경우 전체, 아니면 일반 도구만)
         tools = ALL_TOOLS if user_token else GENERAL_TOOLS
 
         # Tool Calling 루프 (최대 3회)
         max_iterations = 3
-        full_response = ""
+        parts: list[str] = []
 
-        # Tool 결과에서 주요 응답 저장
+        # Tool 결과에서 주요 응답 저장 (최종 답변 토큰 앞에 먼저 전송)
         tool_summaries = []
 
         for iteration in range(max_iterations):
             logger.info(f"Tool loop iteration {iteration + 1}/{max_iterations}")
 
-            # LLM 호출 (fallback 지원)
-            response = await _invoke_with_fallback(tiered_llm, messages, tools)
+            # LLM 스트리밍 호출 (fallback 지원)
+            # 도구 호출 청크는 본문 뒤에 올 수도 있으므로 턴이 끝나 도구 호출이 없다고 확인된 뒤에만 본문 전송
+            # ("계산해 보겠습니다" 같은 도구 호출 턴의 서두는 전송/저장하지 않음)
+            response = None
+            pending: list[str] = []
+            async for chunk in _stream_with_fallback(tiered_llm, messages, tools):
+                response = chunk if response is None else response + chunk
+                if chunk.content:
+                    pending.append(chunk.content)
 
             # 응답 상태 로깅
-            has_tool_calls = hasattr(response, "tool_calls") and response.tool_calls and len(response.tool_calls) > 0
-            has_content = hasattr(response, "content") and response.content
+            has_tool_calls = response is not None and bool(response.tool_calls)
+            has_content = response is not None and bool(response.content)
             logger.info(f"Response: has_tool_calls={has_tool_calls}, has_content={has_content}")
 
-            # Tool Call이 있는지 확인 (빈 리스트 체크 추가)
             if has_tool_calls:
                 messages.append(response)  # AI 메시지 추가
 
-                for tool_call in response.tool_calls:
-                    tool_name = tool_call.get("name", "")
-                    tool_args = tool_call.get("args", {})
-                    tool_id = tool_call.get("id", "")
-
-                    logger.info(f"Tool call: {tool_name}({tool_args})")
+                tool_calls = response.tool_calls
+                for tool_call in tool_calls:
+                    logger.info(f"Tool call: {tool_call.get('name', '')}({tool_call.get('args', {})})")
 
                     # Tool 호출 알림
                     yield {
                         "type": "tool_call",
-                        "data": {"tool": tool_name, "status": "start"}
+                        "data": {"tool": tool_call.get("name", ""), "status": "start"}
                     }
 
-                    # Tool 실행
-                    result = await _execute_tool(tool_name, tool_args)
-                    logger.info(f"Tool result: {result[:200]}...")
-
+                # 독립적인 Tool 호출은 동시에 실행 (턴 비용 = 가장 느린 도구)
+                results: list[Optional[str]] = [None] * len(tool_calls)
+                tasks = [
+                    asyncio.create_task(_execute_indexed(i, tc.get("name", ""), tc.get("args", {})))
+                    for i, tc in enumerate(tool_calls)
+                ]
+                try:
+                    for finished in asyncio.as_completed(tasks):
+                        idx, result = await finished
+                        results[idx] = result
+                        logger.info(f"Tool result: {result[:200]}...")
+
+                        yield {
+                            "type": "tool_call",
+                            "data": {"tool": tool_calls[idx].get("name", ""), "status": "end", "result": result[:200]}
+                        }
+                finally:
+                    for task in tasks:
+                        task.cancel()
+
+                # Tool 결과 메시지는 원래 호출 순서대로 추가
+                for tool_call, result in zip(tool_calls, results):
                     # Tool 결과에서 summary/answer/message 추출
                     try:
-                        import json
                         result_data = json.loads(result)
                         if "summary" in result_data:
                             tool_summaries.append(result_data["summary"])
@@ -246,48 +476,30 @@ async def get_agent_response(
                     except (json.JSONDecodeError, TypeError):
                         pass
 
-                    # Tool 결과 메시지 추가
-                    messages.append(ToolMessage(content=result, tool_call_id=tool_id))
-
-                    yield {
-                        "type": "tool_call",
-                        "data": {"tool": tool_name, "status": "end", "result": result[:200]}
-                    }
+                    messages.append(ToolMessage(content=result, tool_call_id=tool_call.get("id", "")))
 
                 continue  # 다시 LLM 호출
 
-            # Tool Call이 없으면 최종 응답
+            # Tool Call이 없으면 최종 응답 (Tool 결과 요약 → 본문, 프레임 병합은 SSE 송신기가 처리)
             if has_content:
-                # Tool 결과 요약이 있으면 앞에 추가
                 if tool_summaries:
-                    full_response = "\n\n".join(tool_summaries) + "\n\n" + response.content
-                else:
-                    full_response = response.content
-                logger.info(f"Final response length: {len(full_response)}")
+                    pending.insert(0, "\n\n".join(tool_summaries) + "\n\n")
+                for part in pending:
+                    parts.append(part)
+                    yield {"type": "token", "data": part}
                 break
-            else:
-                logger.warning(f"No content in response at iteration {iteration + 1}")
-
-        # 스트리밍 출력 (토큰 단위가 아닌 문장 단위)
-        if full_response:
-            # 문장 단위로 나눠서 스트리밍 효과
-            sentences = full_response.replace(".", ".|").replace("!", "!|").replace("?", "?|").split("|")
-            for sentence in sentences:
-                if sentence.strip():
-                    yield {"type": "token", "data": sentence}
-        else:
+            logger.warning(f"No content in response at iteration {iteration + 1}")
+
+        full_response = "".join(parts)
+        logger.info(f"Final response length: {len(full_response)}")
+        if not full_response:
             # Tool 호출 후 응답이 없는 경우 기본 메시지 제공
             logger.warning("No response generated after tool calls")
             full_response = "요청하신 정보를 처리했습니다. 추가 질문이 있으시면 말씀해주세요."
             yield {"type": "token", "data": full_response}
 
-        # 대화 히스토리에 저장
-        session.messages.append(("user", message))
-        session.messages.append(("assistant", full_response))
-
-        # 히스토리 최대 크기 제한
-        if len(session.messages) > MAX_HISTORY * 2:
-            session.messages = session.messages[-MAX_HISTORY * 2:]
+        # 대화 히스토리 저장 (메모리 + DB 기록 큐)
+        _save_exchange(session, session_id, user_id, message, full_response)
 
         yield {"type": "done", "data": ""}
 
@@ -296,6 +508,10 @@ async def get_agent_response(
         # 사용자 친화적 에러 메시지
         user_message = "죄송합니다. 일시적인 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
         yield {"type": "error", "data": user_message}
+    finally:
+        # 빠른 경로/오류/연결 종료로 쓰지 않은 준비 작업 정리 (이미 완료된 작업이면 영향 없음)
+        if prepared is not None:
+            prepared.cancel()
 
 
 async def get_agent_response_streaming(
@@ -312,49 +528,25 @@ async def get_agent_response_streaming(
         rag_service = get_rag_service()
 
         # 세션 관리
-        session_key = session_id or "default"
-        session = _sessions[session_key]
+        user_id = await verified_user_id(user_token)
+        set_usage_user(user_id)
+        session = await _get_session(session_id, user_id, user_token)
 
         # RAG 컨텍스트
         rag_context = await rag_service.get_context(message)
 
-        # 시스템 프롬프트
-        system_content = SYSTEM_PROMPT
-        if rag_context.context_text:
-            system_content += f"\n\n{rag_context.context_text}"
-
         # 메시지 구성
-        messages = [SystemMessage(content=system_content)]
-        for role, content in session.messages[-MAX_HISTORY:]:
-            if role == "user":
-                messages.append(HumanMessage(content=content))
-            else:
-                messages.append(AIMessage(content=content))
-        messages.append(HumanMessage(content=message))
-
-        # 스트리밍 응답
-        buffer = ""
-        full_response = ""
-        flush_chars = {" ", ".", ",", "!", "?", "\n", ":", ";", ")", "]", "}", "※"}
+        messages = _build_messages(SYSTEM_PROMPT, session, message, rag_context.context_text)
 
+        # 스트리밍 응답 (프레임 병합은 SSE 송신기가 시간/크기 기준으로 처리)
+        parts: list[str] = []
         async for chunk in tiered_llm.astream(messages):
             if hasattr(chunk, "content") and chunk.content:
-                buffer += chunk.content
-                full_response += chunk.content
-
-                if buffer and buffer[-1] in flush_chars:
-                    yield {"type": "token", "data": buffer}
-                    buffer = ""
-
-        if buffer:
-            yield {"type": "token", "data": buffer}
+                parts.append(chunk.content)
+                yield {"type": "token", "data": chunk.content}
 
         # 히스토리 저장
-        session.messages.append(("user", message))
-        session.messages.append(("assistant", full_response))
-
-        if len(session.messages) > MAX_HISTORY * 2:
-            session.messages = session.messages[-MAX_HISTORY * 2:]
+        _save_exchange(session, session_id, user_id, message, "".join(parts))
 
         yield {"type": "done", "data": ""}
 
@@ -0,0 +1,319 @@
+"""
+대화 히스토리 영속화 서비스
+응답이 끝난 대화를 메모리 큐에 쌓아 두고 주기적으로 chat_sessions / chat_messages에 일괄 기록 (write-behind)
+메모리 세션이 없을 때만 DB에서 최근 대화를 지연 로드
+"""
+
+import asyncio
+import base64
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.database import engine
+from app.services.session_store import SessionMessage, UserSession
+from app.services.summarizer import estimate_tokens
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# 세션은 (user_id, session_key)로 식별 → 다른 사용자가 같은 session_id를 써도 각자의 행에 기록
+UPSERT_SESSION_SQL = text("""
+    INSERT INTO chat_sessions (id, user_id, session_key, title, created_at, updated_at)
+    VALUES (:id, :user_id, :session_key, :title, :updated_at, :updated_at)
+    ON CONFLICT (user_id, session_key) DO UPDATE
+    SET updated_at = GREATEST(chat_sessions.updated_at, EXCLUDED.updated_at)
+""")
+
+INSERT_MESSAGE_SQL = text("""
+    INSERT INTO chat_messages (id, session_id, role, content, token_count, created_at)
+    SELECT CAST(:id AS uuid), s.id, :role, :content,
+           CAST(:token_count AS integer), CAST(:created_at AS timestamp)
+    FROM chat_sessions s
+    WHERE s.user_id = CAST(:user_id AS uuid) AND s.session_key = :session_key
+""")
+
+LOAD_MESSAGES_SQL = text("""
+    SELECT m.role, m.content, m.created_at
+    FROM chat_messages m
+    JOIN chat_sessions s ON s.id = m.session_id
+    WHERE s.user_id = :user_id AND s.session_key = :session_key
+    ORDER BY m.created_at DESC, m.id DESC
+    LIMIT :limit
+""")
+
+
+# 목록 조회: (정렬 키, id) 키셋 페이지네이션 (OFFSET 없이 인덱스 범위 스캔)
+LIST_SESSIONS_SQL = """
+    SELECT id, session_key, title, created_at, updated_at
+    FROM chat_sessions
+    WHERE user_id = :user_id {keyset}
+    ORDER BY updated_at DESC, id DESC
+    LIMIT :limit
+"""
+SESSIONS_KEYSET = "AND (updated_at, id) < (CAST(:cursor_time AS timestamp), CAST(:cursor_id AS uuid))"
+
+LIST_MESSAGES_SQL = """
+    SELECT m.id, m.role, m.content, m.created_at
+    FROM chat_messages m
+    JOIN chat_sessions s ON s.id = m.session_id
+    WHERE s.user_id = :user_id AND s.session_key = :session_key {keyset}
+    ORDER BY m.created_at, m.id
+    LIMIT :limit
+"""
+MESSAGES_KEYSET = "AND (m.created_at, m.id) > (CAST(:cursor_time AS timestamp), CAST(:cursor_id AS uuid))"
+
+
+def session_uuid(session_key: str, user_id: uuid.UUID) -> uuid.UUID:
+    """(사용자, 클라이언트 세션 ID) → chat_sessions.id (결정적 UUID, 사용자마다 다른 값)"""
+    return uuid.uuid5(uuid.NAMESPACE_URL, f"paytools-chat:{user_id}:{session_key}")
+
+
+def _to_db_time(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+def _from_db_time(value: datetime) -> float:
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+def encode_cursor(sort_time: datetime, row_id: uuid.UUID) -> str:
+    """페이지 커서 (정렬 시각 + id, 클라이언트에는 불투명 문자열)"""
+    raw = f"{sort_time.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """커서 해석 (형식이 잘못되면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        sort_time, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(sort_time), uuid.UUID(row_id)
+    except Exception as e:
+        raise ValueError(f"invalid cursor: {cursor}") from e
+
+
+async def _fetch_page(db: AsyncSession, sql: str, keyset: str, params: dict, cursor: Optional[str], limit: int):
+    if cursor:
+        cursor_time, cursor_id = decode_cursor(cursor)
+        params = {**params, "cursor_time": cursor_time, "cursor_id": cursor_id}
+    result = await db.execute(text(sql.format(keyset=keyset if cursor else "")), {**params, "limit": limit + 1})
+    rows = result.fetchall()
+    return rows[:limit], len(rows) > limit
+
+
+async def list_sessions(
+    db: AsyncSession, user_id: uuid.UUID, limit: int, cursor: Optional[str] = None
+) -> tuple[list[dict], Optional[str]]:
+    """사용자 세션 목록 (최근 대화 순)"""
+    rows, has_more = await _fetch_page(
+        db, LIST_SESSIONS_SQL, SESSIONS_KEYSET, {"user_id": user_id}, cursor, limit
+    )
+    sessions = [
+        {
+            "session_id": row.session_key,
+            "title": row.title,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+            "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+        }
+        for row in rows
+    ]
+    next_cursor = encode_cursor(rows[-1].updated_at, rows[-1].id) if has_more else None
+    return sessions, next_cursor
+
+
+async def list_messages(
+    db: AsyncSession, session_key: str, user_id: uuid.UUID, limit: int, cursor: Optional[str] = None
+) -> tuple[list[dict], Optional[str]]:
+    """세션 대화 내역 (오래된 순)"""
+    rows, has_more = await _fetch_page(
+        db,
+        LIST_MESSAGES_SQL,
+        MESSAGES_KEYSET,
+        {"session_key": session_key, "user_id": user_id},
+        cursor,
+        limit,
+    )
+    messages = [
+        {"role": row.role, "content": row.content, "created_at": row.created_at.isoformat()}
+        for row in rows
+    ]
+    next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id) if has_more else None
+    return messages, next_cursor
+
+
+class ChatHistoryWriter:
+    """대화 히스토리 배치 기록기"""
+
+    def __init__(self):
+        self.flush_interval = settings.history_flush_interval
+        self.max_buffer = settings.history_max_buffer
+        # (user_id, session_key) -> {"title", "updated_at"}
+        self._sessions: dict[tuple[uuid.UUID, str], dict] = {}
+        self._messages: list[dict] = []
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._early_flush: Optional[asyncio.Task] = None
+        self._loading: dict[tuple[str, uuid.UUID], asyncio.Task] = {}
+        self.stats = {"flushed_messages": 0, "failed_flushes": 0, "dropped_messages": 0, "loads": 0}
+
+    def record(self, session_key: str, user_id: uuid.UUID, messages: list[SessionMessage]):
+        """기록할 메시지 등록 (메모리만 갱신, 즉시 반환)"""
+        key = (user_id, session_key)
+        latest = max(m.created_at for m in messages)
+        entry = self._sessions.get(key)
+        if entry is None:
+            first_user = next((m.content for m in messages if m.role == "user"), "")
+            self._sessions[key] = {"title": first_user[:200], "updated_at": latest}
+        else:
+            entry["updated_at"] = max(entry["updated_at"], latest)
+
+        for m in messages:
+            self._messages.append({
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "session_key": session_key,
+                "role": m.role,
+                "content": m.content,
+                "created_at": m.created_at,
+            })
+        # 배치 크기를 넘으면 주기를 기다리지 않고 flush
+        if len(self._messages) >= settings.history_batch_size and (
+            self._early_flush is None or self._early_flush.done()
+        ):
+            self._early_flush = asyncio.create_task(self.flush())
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """백그라운드 작업 종료 후 남은 큐 flush (graceful shutdown)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self):
+        """큐를 비우고 세션 upsert → 메시지 insert를 한 트랜잭션으로 실행 (실패 시 큐에 되돌림)"""
+        async with self._lock:
+            if not self._messages and not self._sessions:
+                return
+            sessions, self._sessions = self._sessions, {}
+            messages, self._messages = self._messages, []
+
+            session_rows = [
+                {
+                    "id": session_uuid(session_key, user_id),
+                    "user_id": user_id,
+                    "session_key": session_key,
+                    "title": entry["title"],
+                    "updated_at": _to_db_time(entry["updated_at"]),
+                }
+                for (user_id, session_key), entry in sessions.items()
+            ]
+            message_rows = [
+                {**m, "created_at": _to_db_time(m["created_at"]), "token_count": estimate_tokens(m["content"])}
+                for m in messages
+            ]
+            try:
+                async with engine.begin() as conn:
+                    if session_rows:
+                        await conn.execute(UPSERT_SESSION_SQL, session_rows)
+                    if message_rows:
+                        await conn.execute(INSERT_MESSAGE_SQL, message_rows)
+                self.stats["flushed_messages"] += len(message_rows)
+                logger.debug(f"Chat history flushed: {len(session_rows)} sessions, {len(message_rows)} messages")
+            except Exception as e:
+                self.stats["failed_flushes"] += 1
+                logger.warning(f"Chat history flush failed ({len(message_rows)} messages kept): {e}")
+                self._requeue(sessions, messages)
+
+    def _requeue(self, sessions: dict, messages: list[dict]):
+        for key, entry in sessions.items():
+            current = self._sessions.get(key)
+            if current is None:
+                self._sessions[key] = entry
+            else:
+                current["updated_at"] = max(current["updated_at"], entry["updated_at"])
+                current["title"] = entry["title"]
+        self._messages[:0] = messages
+
+        # DB 장애가 길어지면 오래된 메시지부터 버림 (메모리 상한)
+        overflow = len(self._messages) - self.max_buffer
+        if overflow > 0:
+            del self._messages[:overflow]
+            self.stats["dropped_messages"] += overflow
+            logger.error(f"Chat history buffer full, dropped {overflow} oldest messages")
+
+    async def load(self, session_key: str, user_id: uuid.UUID, limit: int) -> Optional[UserSession]:
+        """
+        DB에서 최근 대화 로드 (같은 사용자의 같은 세션 동시 로드는 한 번만 실행)
+
+        Returns:
+            UserSession 또는 None (저장된 대화 없음/조회 실패)
+        """
+        # 사용자별로 분리 → 다른 사용자가 같은 session_id로 동시에 요청해도 그 결과를 공유하지 않음
+        key = (session_key, user_id)
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(session_key, user_id, limit))
+            self._loading[key] = task
+            task.add_done_callback(lambda _: self._loading.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _load(self, session_key: str, user_id: uuid.UUID, limit: int) -> Optional[UserSession]:
+        try:
+            async with engine.connect() as conn:
+                result = await asyncio.wait_for(
+                    conn.execute(
+                        LOAD_MESSAGES_SQL,
+                        {"session_key": session_key, "user_id": user_id, "limit": limit},
+                    ),
+                    timeout=settings.history_load_timeout,
+                )
+                rows = result.fetchall()
+        except Exception as e:
+            logger.warning(f"Chat history load failed: {e}")
+            return None
+
+        self.stats["loads"] += 1
+        if not rows:
+            return None
+        session = UserSession()
+        session.messages = [
+            SessionMessage(role, content, _from_db_time(created_at)) for role, content, created_at in reversed(rows)
+        ]
+        return session
+
+    def get_stats(self) -> dict:
+        return {
+            **self.stats,
+            "queued_messages": len(self._messages),
+            "queued_sessions": len(self._sessions),
+        }
+
+
+# 싱글톤 인스턴스
+_history_writer: Optional[ChatHistoryWriter] = None
+
+
+def get_history_writer() -> ChatHistoryWriter:
+    global _history_writer
+    if _history_writer is None:
+        _history_writer = ChatHistoryWriter()
+    return _history_writer
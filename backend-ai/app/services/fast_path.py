@@ -0,0 +1,233 @@
+"""
+계산기 질문 Fast Path
+규칙 기반 의도 분류(classify_intent) → 해당 의도의 금액/시간 추출로 LLM 없이 계산 도구를 바로 실행
+모호한 질문은 None을 반환하여 LLM 경로로 넘김
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.services.payroll_rates import RATES
+from app.services.tools import TOOL_MAP
+
+logger = logging.getLogger(__name__)
+
+DISCLAIMER = "※ 본 답변은 참고용이며, 실제 적용 시 노무사 또는 세무사와 상담하시기 바랍니다."
+
+# 키워드 기반 의도 분류 (우선순위 순서, 구체적인 계산기 키워드가 일반적인 급여 키워드보다 먼저)
+# 예: "월급 300만원 4대보험 얼마" → insurance
+INTENT_KEYWORDS = {
+    "insurance": ["보험", "국민연금", "건강보험", "고용보험", "4대보험"],
+    "salary_calc": ["급여", "실수령", "월급", "연봉", "세후"],
+    "overtime": ["연장", "야간", "휴일", "수당", "가산"],
+    "minimum_wage": ["최저임금", "최저시급", "시급"],
+    "law_search": ["법", "조문", "규정", "근로기준법"],
+}
+
+# 사용자 데이터/대화 맥락이 필요한 표현 → 항상 LLM 경로
+_CONTEXT_WORDS = ["직원", "우리", "급여대장", "인건비", "그럼", "그거", "아까", "위에", "방금", "말고"]
+
+# 금액: 300만원, 9,500원, 1억 2천만원, 2.5만원
+_MONEY_PATTERN = re.compile(
+    r"(?:\d[\d,]*(?:\.\d+)?\s*(?:억|천만|백만|십만|만|천)\s*)+(?:\d[\d,]*\s*)?원?"
+    r"|\d[\d,]*\s*원"
+)
+_MONEY_PART = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*(억|천만|백만|십만|만|천)?")
+_MONEY_UNITS = {"억": 100_000_000, "천만": 10_000_000, "백만": 1_000_000, "십만": 100_000, "만": 10_000, "천": 1_000}
+
+# 시간: 2시간, 1.5시간, 2시간 반, 2시간 30분, 30분
+_HOURS_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*시간(?:\s*(반|(\d+)\s*분))?|(\d+)\s*분")
+
+# 연도: 2025년, 2025 년
+_YEAR_PATTERN = re.compile(r"(20\d{2})\s*년")
+
+
+@dataclass
+class FastPathResult:
+    """Fast Path 처리 결과"""
+    tool: str
+    args: dict
+    result: dict
+    answer: str
+    citations: list = field(default_factory=list)
+
+
+def classify_intent(message: str) -> str:
+    """키워드 기반 의도 분류 (첫 매칭 카테고리, 없으면 general)"""
+    for intent_type, words in INTENT_KEYWORDS.items():
+        if any(word in message for word in words):
+            return intent_type
+    return "general"
+
+
+def parse_money(text: str) -> list[int]:
+    """한국어 금액 표현을 원 단위 정수로 추출 (예: "300만원" → 3000000)"""
+    amounts = []
+    for match in _MONEY_PATTERN.finditer(text):
+        expr = match.group(0)
+        total = 0.0
+        for number, unit in _MONEY_PART.findall(expr):
+            value = float(number.replace(",", ""))
+            total += value * _MONEY_UNITS[unit] if unit else value
+        if total > 0:
+            amounts.append(int(round(total)))
+    return amounts
+
+
+def parse_hours(text: str) -> list[float]:
+    """한국어 시간 표현을 시간(float)으로 추출 (예: "2시간 반" → 2.5)"""
+    hours = []
+    for match in _HOURS_PATTERN.finditer(text):
+        whole, half, minutes, only_minutes = match.groups()
+        if whole is not None:
+            value = float(whole)
+            if half == "반":
+                value += 0.5
+            elif minutes:
+                value += int(minutes) / 60
+        else:
+            value = int(only_minutes) / 60
+        hours.append(round(value, 2))
+    return hours
+
+
+def _is_ambiguous(message: str) -> bool:
+    if len(message) > 80:
+        return True
+    return any(word in message for word in _CONTEXT_WORDS)
+
+
+def _company_size(message: str) -> str:
+    return "UNDER_5" if re.search(r"5\s*인\s*미만", message) else "OVER_5"
+
+
+def _match_minimum_wage(message: str) -> Optional[tuple[str, dict]]:
+    if not any(word in message for word in ("최저임금", "최저시급")):
+        return None
+    if parse_hours(message):
+        return None
+    amounts = parse_money(message)
+    if len(amounts) != 1 or not 1_000 <= amounts[0] <= 100_000:
+        return None
+    args = {"hourly_rate": amounts[0]}
+    # 연도를 언급하면 그 해 최저임금과 비교 (요율이 없는 연도/여러 연도는 LLM 경로)
+    years = {int(y) for y in _YEAR_PATTERN.findall(message)}
+    if len(years) > 1 or (years and not years <= RATES.keys()):
+        return None
+    if years:
+        args["year"] = years.pop()
+    return "minimum_wage_check", args
+
+
+def _match_insurance(message: str) -> Optional[tuple[str, dict]]:
+    if not any(word in message for word in ("4대보험", "4대 보험", "사대보험", "보험료")):
+        return None
+    # 연봉/시급 환산이나 실수령액(세금 포함) 질문은 LLM 경로
+    if any(word in message for word in ("연봉", "시급", "일당", "실수령", "세후")):
+        return None
+    amounts = parse_money(message)
+    if len(amounts) != 1 or not 100_000 <= amounts[0] <= 100_000_000:
+        return None
+    return "insurance_calculator", {"monthly_salary": amounts[0]}
+
+
+def _match_overtime(message: str) -> Optional[tuple[str, dict]]:
+    kinds = [k for k in ("연장", "야간", "휴일") if k in message]
+    if len(kinds) != 1 or not any(word in message for word in ("수당", "가산", "얼마")):
+        return None
+    amounts = parse_money(message)
+    hours = parse_hours(message)
+    if len(amounts) != 1 or len(hours) != 1 or not 1_000 <= amounts[0] <= 100_000:
+        return None
+    if "시급" not in message and "통상" not in message:
+        return None
+    hours_arg = {"연장": "overtime_hours", "야간": "night_hours", "휴일": "holiday_hours"}[kinds[0]]
+    args = {"hourly_rate": amounts[0], "overtime_hours": 0, hours_arg: hours[0]}
+    args["company_size"] = _company_size(message)
+    return "overtime_calculator", args
+
+
+# 의도 → 인자 추출 (계산기 의도만 Fast Path, 나머지는 LLM 경로)
+_MATCHERS = {
+    "minimum_wage": _match_minimum_wage,
+    "insurance": _match_insurance,
+    "overtime": _match_overtime,
+}
+
+
+def _render_answer(tool: str, result: dict) -> tuple[str, list]:
+    """도구 결과를 템플릿 답변 + 인용 조문으로 변환"""
+    if tool == "minimum_wage_check":
+        lines = [
+            result["message"],
+            "",
+            f"- 입력 시급: {result['hourly_rate']:,}원",
+            f"- {result['year']}년 최저시급: {result['minimum_wage']:,}원",
+            f"- 차액: {result['difference']:+,}원",
+        ]
+        if not result["is_compliant"]:
+            lines.append("")
+            lines.append("⚠️ 최저임금 미만 지급은 최저임금법 위반으로 3년 이하 징역 또는 2천만원 이하 벌금 대상입니다.")
+        citations = [{"law": "최저임금법", "article": "제6조", "title": "최저임금의 효력"}]
+    elif tool == "insurance_calculator":
+        lines = [
+            f"월 급여 {result['monthly_salary']:,}원 기준 4대보험 근로자 부담분입니다.",
+            "",
+            f"- 국민연금 (4.75%): {result['national_pension']:,}원",
+            f"- 건강보험 (3.595%): {result['health_insurance']:,}원",
+            f"- 장기요양보험 (건강보험 × 13.14%): {result['long_term_care']:,}원",
+            f"- 고용보험 (0.9%): {result['employment_insurance']:,}원",
+            f"- **합계: {result['total']:,}원**",
+        ]
+        citations = [
+            {"law": "국민연금법", "article": "제88조", "title": "연금보험료의 부과·징수"},
+            {"law": "국민건강보험법", "article": "제69조", "title": "보험료"},
+            {"law": "고용보험법", "article": "제13조", "title": "보험료"},
+        ]
+    else:
+        lines = [
+            f"통상시급 {result['hourly_rate']:,}원 기준 가산수당 계산 결과입니다.",
+            "",
+        ]
+        for key, label in (("overtime", "연장근로"), ("night", "야간근로 가산분"), ("holiday", "휴일근로")):
+            item = result[key]
+            if item["hours"]:
+                lines.append(f"- {label}: {item['hours']}시간 × {item['rate']}배 = {item['pay']:,}원")
+        lines.append(f"- **합계: {result['total_extra_pay']:,}원**")
+        citations = [{"law": "근로기준법", "article": "제56조", "title": "연장·야간 및 휴일 근로"}]
+
+    citation_text = ", ".join(f"{c['law']} {c['article']}" for c in citations)
+    lines.extend(["", f"근거: {citation_text}", "", DISCLAIMER])
+    return "\n".join(lines), citations
+
+
+async def try_fast_path(message: str) -> Optional[FastPathResult]:
+    """
+    계산기 질문이면 도구를 직접 실행하고 템플릿 답변 반환
+
+    Returns:
+        FastPathResult 또는 None (모호하거나 해당 없음 → LLM 경로)
+    """
+    text = message.strip()
+    if _is_ambiguous(text):
+        return None
+
+    matcher = _MATCHERS.get(classify_intent(text))
+    match = matcher(text) if matcher else None
+    if match is None:
+        return None
+
+    tool, args = match
+    try:
+        result = await TOOL_MAP[tool].ainvoke(args)
+    except Exception as e:
+        logger.warning(f"Fast path tool failed ({tool}): {e}")
+        return None
+    if "error" in result:
+        return None
+
+    answer, citations = _render_answer(tool, result)
+    logger.info(f"Fast path hit: {tool}({args})")
+    return FastPathResult(tool=tool, args=args, result=result, answer=answer, citations=citations)
@@ -14,6 +14,7 @@ from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from app.services.llm import get_tiered_llm
 from app.services.tools import ALL_TOOLS
 from app.services.prompts import SYSTEM_PROMPT
+from app.services.fast_path import classify_intent
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +31,7 @@ def create_agent_graph():
     """LangGraph Agent 생성"""
 
     llm = get_tiered_llm()
-    llm_with_tools = llm.get_llm_with_fallback().bind_tools(ALL_TOOLS)
+    tool_node = ToolNode(ALL_TOOLS)  # 그래프 생성 시 1회만 구성
 
     # 노드 정의
     async def router_node(state: AgentState) -> dict:
@@ -38,20 +39,8 @@ def create_agent_graph():
         messages = state["messages"]
         last_message = messages[-1].content if messages else ""
 
-        # 간단한 키워드 기반 라우팅
-        intent = "general"
-        keywords = {
-            "salary_calc": ["급여", "실수령", "월급", "연봉", "세후"],
-            "insurance": ["보험", "국민연금", "건강보험", "고용보험", "4대보험"],
-            "overtime": ["연장", "야간", "휴일", "수당", "가산"],
-            "minimum_wage": ["최저임금", "최저시급", "시급"],
-            "law_search": ["법", "조문", "규정", "근로기준법"],
-        }
-
-        for intent_type, words in keywords.items():
-            if any(word in last_message for word in words):
-                intent = intent_type
-                break
+        # 간단한 키워드 기반 라우팅 (Fast Path와 동일 규칙)
+        intent = classify_intent(last_message)
 
         logger.info(f"Intent classified: {intent}")
         return {"intent": intent}
@@ -60,13 +49,13 @@ def create_agent_graph():
         """도구 사용 여부 결정"""
         messages = [SystemMessage(content=SYSTEM_PROMPT)] + state["messages"]
 
-        response = await llm_with_tools.ainvoke(messages)
+        # 티어별 캐시된 바인딩 사용 (에이전트 경로와 같은 도구 스키마, 그래프 생성 때마다 재바인딩하지 않음)
+        response = await llm.get_bound_with_fallback(ALL_TOOLS).ainvoke(messages)
 
         return {"messages": [response]}
 
     async def tool_executor_node(state: AgentState) -> dict:
         """도구 실행"""
-        tool_node = ToolNode(ALL_TOOLS)
         result = await tool_node.ainvoke(state)
         return result
 
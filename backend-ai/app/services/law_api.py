@@ -13,7 +13,7 @@ from app.core.config import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-BASE_URL = "http://www.law.go.kr/DRF"
+BASE_URL = settings.law_api_base_url
 
 
 @dataclass
@@ -6,14 +6,17 @@ Tier 2: Groq Llama (fallback)
 
 import logging
 import time
+from collections import deque
 from typing import Optional
 from dataclasses import dataclass, field
 
 from langchain_groq import ChatGroq
 from langchain_openai import ChatOpenAI
 from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import Runnable
 
 from app.core.config import get_settings
+from app.services.usage_writer import get_usage_writer
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -51,13 +54,86 @@ class CircuitBreaker:
         return False
 
 
+@dataclass
+class LatencyTracker:
+    """티어별 응답 지연시간 추적 (최근 window건)"""
+    window: int = 200
+    min_samples: int = 20
+    samples: deque = field(default_factory=deque, init=False)
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+        if len(self.samples) > self.window:
+            self.samples.popleft()
+
+    def percentile(self, p: float) -> Optional[float]:
+        """p 백분위 지연시간 (샘플 부족 시 None)"""
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        idx = min(len(ordered) - 1, int(p * len(ordered)))
+        return ordered[idx]
+
+
+@dataclass
+class HedgeBudget:
+    """
+    헤지 요청 예산 (토큰 버킷)
+    요청마다 ratio만큼 적립되고 헤지 1회당 1만큼 차감되므로
+    추가 호출 비용이 전체 요청의 ratio 비율을 넘지 않음
+    """
+    ratio: float = 0.1
+    burst: float = 5.0
+    tokens: float = field(default=0.0, init=False)
+    hedged: int = field(default=0, init=False)
+    denied: int = field(default=0, init=False)
+
+    def on_request(self):
+        self.tokens = min(self.burst, self.tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            self.hedged += 1
+            return True
+        self.denied += 1
+        return False
+
+
+@dataclass
+class UsageStats:
+    """티어별 토큰 사용량 (프로바이더 응답의 usage_metadata 기준)"""
+    calls: int = 0
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """입력 토큰 중 프롬프트 캐시에서 읽힌 비율"""
+        if not self.input_tokens:
+            return 0.0
+        return self.cached_input_tokens / self.input_tokens
+
+
 class TieredLLM:
     """Tiered LLM with Fallback Chain"""
 
     def __init__(self):
         self.tiers: list[tuple[str, BaseChatModel]] = []
         self.circuit_breakers: dict[str, CircuitBreaker] = {}
+        self.latency: dict[str, LatencyTracker] = {}  # 스트리밍 첫 청크까지 지연 (헤지 기준)
+        self.call_latency: dict[str, LatencyTracker] = {}  # ainvoke 전체 응답 지연 (요약 등, 헤지와 무관)
+        self.tier_costs: dict[str, float] = {}  # USD / 1M input tokens
+        self.usage: dict[str, UsageStats] = {}
+        self.models: dict[str, str] = {}  # 티어 이름 → 모델명 (token_usage.model)
+        self.hedge_budget = HedgeBudget(ratio=settings.llm_hedge_budget_ratio)
+        self._bound_tools: dict[tuple[str, tuple[str, ...]], Runnable] = {}
         self._init_tiers()
+        for name, _ in self.tiers:
+            self.latency[name] = LatencyTracker()
+            self.call_latency[name] = LatencyTracker()
+            self.usage[name] = UsageStats()
 
     def _init_tiers(self):
         # Tier 1: OpenAI (tool calling 정확도 우수)
@@ -66,10 +142,14 @@ class TieredLLM:
                 model="gpt-4o-mini",
                 temperature=settings.llm_temperature,
                 openai_api_key=settings.openai_api_key,
+                base_url=settings.openai_base_url or None,
                 timeout=settings.llm_timeout,
+                stream_usage=True,  # 스트리밍 시에도 토큰 사용량 수신
             )
             self.tiers.append(("openai", llm))
             self.circuit_breakers["openai"] = CircuitBreaker()
+            self.tier_costs["openai"] = 0.15
+            self.models["openai"] = "gpt-4o-mini"
             logger.info("Tier 1 (OpenAI) initialized")
 
         # Tier 2: Groq (fallback)
@@ -78,15 +158,91 @@ class TieredLLM:
                 model="llama-3.1-8b-instant",
                 temperature=settings.llm_temperature,
                 groq_api_key=settings.groq_api_key,
+                base_url=settings.groq_base_url or None,
                 timeout=settings.llm_timeout,
             )
             self.tiers.append(("groq", llm))
             self.circuit_breakers["groq"] = CircuitBreaker()
+            self.tier_costs["groq"] = 0.05
+            self.models["groq"] = "llama-3.1-8b-instant"
             logger.info("Tier 2 (Groq) initialized")
 
         if not self.tiers:
             raise ValueError("No LLM API keys configured")
 
+    def bind_tools(self, name: str, tools: list) -> Runnable:
+        """
+        (티어, 도구 세트)별 bind_tools 결과 반환
+        도구 JSON 스키마 변환은 최초 1회만 수행하고 이후에는 캐시 사용
+        """
+        key = (name, tuple(t.name for t in tools))
+        bound = self._bound_tools.get(key)
+        if bound is None:
+            llm = dict(self.tiers)[name]
+            bound = llm.bind_tools(tools)
+            self._bound_tools[key] = bound
+        return bound
+
+    def prebind_tools(self, tool_sets: list[list]):
+        """앱 시작 시 모든 티어 × 도구 세트 조합을 미리 바인딩"""
+        for name, _ in self.tiers:
+            for tools in tool_sets:
+                self.bind_tools(name, tools)
+        logger.info(f"Tool bindings ready: {len(self._bound_tools)} (tier x tool set)")
+
+    def record_usage(self, name: str, message):
+        """
+        응답(또는 스트리밍 청크)의 토큰 사용량 기록 (캐시 적중 토큰 포함)
+        사용자별 집계는 TokenUsageWriter 버퍼에 추가 (DB 기록은 백그라운드)
+        """
+        usage = getattr(message, "usage_metadata", None)
+        if not usage:
+            return
+        input_tokens = usage.get("input_tokens", 0) or 0
+        output_tokens = usage.get("output_tokens", 0) or 0
+        details = usage.get("input_token_details") or {}
+
+        stats = self.usage[name]
+        stats.calls += 1
+        stats.input_tokens += input_tokens
+        stats.output_tokens += output_tokens
+        stats.cached_input_tokens += details.get("cache_read", 0) or 0
+
+        get_usage_writer().add(self.models.get(name, name), input_tokens, output_tokens)
+
+    def get_usage_stats(self) -> dict:
+        return {
+            name: {
+                "calls": stats.calls,
+                "input_tokens": stats.input_tokens,
+                "cached_input_tokens": stats.cached_input_tokens,
+                "output_tokens": stats.output_tokens,
+                "cache_hit_rate": round(stats.cache_hit_rate, 4),
+            }
+            for name, stats in self.usage.items()
+        }
+
+    def hedge_delay(self, name: str) -> float:
+        """헤지 요청 전 대기 시간 (1순위 티어의 첫 청크 지연 백분위 기준)"""
+        observed = self.latency[name].percentile(settings.llm_hedge_percentile)
+        if observed is None:
+            return settings.llm_hedge_default_delay
+        return max(settings.llm_hedge_min_delay, observed)
+
+    def get_bound_with_fallback(self, tools: list) -> Runnable:
+        """
+        도구가 바인딩된 Fallback 체인 (티어별 bind_tools 캐시 사용 → 에이전트 경로와 같은 도구 스키마)
+        Circuit Breaker가 열린 티어는 제외하므로 호출 시점마다 구성
+        """
+        available = [name for name, _ in self.tiers if self.circuit_breakers[name].can_execute()]
+        if not available:
+            logger.warning("All circuit breakers open, forcing first tier")
+            available = [self.tiers[0][0]]
+        bound = [self.bind_tools(name, tools) for name in available]
+        if len(bound) == 1:
+            return bound[0]
+        return bound[0].with_fallbacks(bound[1:])
+
     def get_llm_with_fallback(self) -> BaseChatModel:
         """Fallback이 설정된 LLM 반환"""
         available_llms = []
@@ -107,17 +263,29 @@ class TieredLLM:
         fallbacks = available_llms[1:]
         return primary.with_fallbacks(fallbacks)
 
-    async def ainvoke(self, messages, **kwargs):
-        """비동기 호출 with Circuit Breaker"""
-        for name, llm in self.tiers:
+    async def ainvoke(self, messages, cheapest_first: bool = False, **kwargs):
+        """
+        비동기 호출 with Circuit Breaker
+
+        Args:
+            cheapest_first: True면 비용이 낮은 티어부터 시도 (요약 등 백그라운드 작업용)
+        """
+        tiers = self.tiers
+        if cheapest_first:
+            tiers = sorted(self.tiers, key=lambda t: self.tier_costs.get(t[0], 0))
+
+        for name, llm in tiers:
             cb = self.circuit_breakers[name]
             if not cb.can_execute():
                 logger.debug(f"Skipping {name} (circuit open)")
                 continue
 
             try:
+                started = time.monotonic()
                 response = await llm.ainvoke(messages, **kwargs)
                 cb.record_success()
+                self.call_latency[name].record(time.monotonic() - started)
+                self.record_usage(name, response)
                 logger.info(f"Response from {name}")
                 return response
             except Exception as e:
@@ -136,6 +304,7 @@ class TieredLLM:
 
             try:
                 async for chunk in llm.astream(messages, **kwargs):
+                    self.record_usage(name, chunk)
                     yield chunk
                 cb.record_success()
                 logger.info(f"Streamed from {name}")
@@ -0,0 +1,958 @@
+"""
+급여 계산 엔진
+backend-spring domain(SalaryCalculator 및 하위 계산기)을 그대로 옮긴 인프로세스 계산기
+
+- 4대보험, 간이세액표 소득세/지방소득세
+- 연장/야간/휴일 가산수당, 주휴수당, 결근 공제, 포괄임금제
+- 급여 유형: MONTHLY(_FIXED), HOURLY(_MONTHLY), HOURLY_BASED_MONTHLY
+
+금액은 Decimal로 계산 후 원 단위 반올림(ROUND_HALF_UP), 나눗셈은 Spring과 같이 소수 10자리 반올림
+요율/세액표는 services/payroll_rates.py 레지스트리에서 조회
+calculate_salary_request()는 Spring /api/v1/salary/calculate와 같은 요청/응답 JSON을 사용 (scripts/verify_parity.py로 대조)
+"""
+
+import functools
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, time, timedelta
+from decimal import ROUND_HALF_UP, Context, Decimal, localcontext
+from typing import Optional
+
+from app.services.payroll_rates import PayrollRates, get_rates
+
+# 중간 계산에서 반올림이 생기지 않도록 충분한 정밀도 사용 (Java BigDecimal 곱셈은 정확 계산)
+_CTX = Context(prec=60)
+_ONE = Decimal(1)
+_SCALE10 = Decimal("1e-10")
+_EIGHT = Decimal(8)
+_FORTY = Decimal(40)
+_FIFTEEN = Decimal(15)
+
+_NIGHT_START = 22 * 60  # 22:00
+_NIGHT_END = 6 * 60  # 06:00
+_DAY = 24 * 60
+
+# 하위 호환 급여 유형 → 실제 유형
+WAGE_TYPES = {
+    "MONTHLY": "MONTHLY_FIXED",
+    "HOURLY": "HOURLY_MONTHLY",
+    "MONTHLY_FIXED": "MONTHLY_FIXED",
+    "HOURLY_MONTHLY": "HOURLY_MONTHLY",
+    "HOURLY_BASED_MONTHLY": "HOURLY_BASED_MONTHLY",
+}
+
+
+def _exact(func):
+    """공개 계산 함수는 고정밀 Decimal 컨텍스트에서 실행"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with localcontext(_CTX):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def won(amount: Decimal) -> int:
+    """원 단위 반올림 (Money.roundToWon)"""
+    return int(amount.quantize(_ONE, rounding=ROUND_HALF_UP))
+
+
+def _div(a, b) -> Decimal:
+    """소수 10자리 반올림 나눗셈 (Money.div, BigDecimal.divide(x, 10, HALF_UP))"""
+    return (Decimal(a) / Decimal(b)).quantize(_SCALE10, rounding=ROUND_HALF_UP)
+
+
+def _scaled(value: Decimal, places: int) -> str:
+    """BigDecimal.setScale(places, HALF_UP).toString()"""
+    return str(value.quantize(Decimal(1).scaleb(-places), rounding=ROUND_HALF_UP))
+
+
+def decimal_hours(minutes: int) -> Decimal:
+    """분 → 시간 (WorkingHours.toDecimalHours)"""
+    return Decimal(minutes // 60) + _div(minutes % 60, 60)
+
+
+def format_hours(minutes: int) -> str:
+    """WorkingHours.format()"""
+    hours, rest = divmod(minutes, 60)
+    return f"{hours}시간" if rest == 0 else f"{hours}시간 {rest}분"
+
+
+def _week_start(d: date) -> date:
+    """일요일 시작 주의 첫날 (WeekFields.of(Locale.KOREA))"""
+    return d - timedelta(days=d.isoweekday() % 7)
+
+
+def _calendar_week_key(d: date) -> tuple[int, int]:
+    """java.util.Calendar (YEAR, WEEK_OF_YEAR) 키 (일요일 시작, 1월 1일이 포함된 주가 1주차)"""
+    start = _week_start(d)
+    if (start + timedelta(days=6)).year > d.year:
+        return d.year, 1
+    return d.year, (start - _week_start(date(d.year, 1, 1))).days // 7 + 1
+
+
+# ==================== 입력 모델 ====================
+
+@dataclass
+class Employee:
+    name: str = "시뮬레이션"
+    dependents_count: int = 1
+    children_under_20: int = 0
+    employment_type: str = "FULL_TIME"
+    company_size: str = "OVER_5"
+    scheduled_work_days: int = 5
+    daily_work_hours: int = 8
+
+    def __post_init__(self):
+        if self.dependents_count < 0:
+            raise ValueError(f"Dependents count cannot be negative: {self.dependents_count}")
+        if self.children_under_20 < 0:
+            raise ValueError(f"Children under 20 cannot be negative: {self.children_under_20}")
+        if self.children_under_20 > self.dependents_count:
+            raise ValueError(
+                f"Children under 20 ({self.children_under_20}) cannot exceed dependents count ({self.dependents_count})"
+            )
+        if not 1 <= self.scheduled_work_days <= 7:
+            raise ValueError(f"Scheduled work days must be between 1 and 7: {self.scheduled_work_days}")
+        if not 1 <= self.daily_work_hours <= 24:
+            raise ValueError(f"Daily work hours must be between 1 and 24: {self.daily_work_hours}")
+
+    @property
+    def weekly_contract_hours(self) -> int:
+        return self.scheduled_work_days * self.daily_work_hours
+
+
+@dataclass
+class Allowance:
+    name: str
+    amount: int
+    is_taxable: bool = True
+    is_includable_in_minimum_wage: bool = True
+    is_fixed: bool = True
+    is_included_in_regular_wage: bool = True
+
+    def __post_init__(self):
+        if self.amount < 0:
+            raise ValueError(f"Allowance amount cannot be negative: {self.amount}")
+
+
+@dataclass
+class WorkShift:
+    date: date
+    start_time: time
+    end_time: time
+    break_minutes: int = 0
+    is_holiday_work: bool = False
+
+    def _span(self) -> tuple[int, int]:
+        """(시작 분, 총 분) - 퇴근이 출근보다 빠르거나 같으면 다음날 퇴근"""
+        start = self.start_time.hour * 60 + self.start_time.minute
+        end = self.end_time.hour * 60 + self.end_time.minute
+        return start, (end - start) if end > start else (end - start + _DAY)
+
+    def working_minutes(self) -> int:
+        """실근로시간 (휴게시간 제외)"""
+        _, total = self._span()
+        net = total - self.break_minutes
+        if net < 0:
+            raise ValueError(f"Break time ({self.break_minutes}분) exceeds total work time ({total}분)")
+        return net
+
+    def night_minutes(self) -> int:
+        """야간근로시간 (22:00~06:00, 휴게시간 미차감)"""
+        start, total = self._span()
+        end = start + total
+        minutes = 0
+        cursor = start
+        while cursor < end:
+            day = cursor - cursor % _DAY
+            segment_end = min(end, day + _DAY)
+            # 00:00~06:00, 22:00~24:00 구간과 겹치는 분
+            minutes += max(0, min(segment_end, day + _NIGHT_END) - cursor)
+            minutes += max(0, segment_end - max(cursor, day + _NIGHT_START))
+            cursor = segment_end
+        return minutes
+
+
+@dataclass(frozen=True)
+class InsuranceOptions:
+    apply_national_pension: bool = True
+    apply_health_insurance: bool = True
+    apply_long_term_care: bool = True  # 건강보험 적용 시에만 유효
+    apply_employment_insurance: bool = True
+
+
+@dataclass(frozen=True)
+class InclusiveWageOptions:
+    """포괄임금제 (연장수당 고정 지급)"""
+    enabled: bool = False
+    fixed_overtime_hourly_rate: int = 0
+    monthly_expected_overtime_hours: Decimal = Decimal(0)
+
+    def monthly_fixed_overtime_pay(self) -> int:
+        if not self.enabled or self.fixed_overtime_hourly_rate <= 0:
+            return 0
+        # BigDecimal.toLong(): 소수점 이하 버림
+        return int(Decimal(self.fixed_overtime_hourly_rate) * self.monthly_expected_overtime_hours)
+
+
+# ==================== 계산 결과 ====================
+
+@dataclass
+class InsuranceResult:
+    national_pension: int
+    national_pension_base: int
+    health_insurance: int
+    health_insurance_base: int
+    long_term_care: int
+    employment_insurance: int
+    employment_insurance_base: int
+    base_amount: int
+    applied_options: InsuranceOptions = InsuranceOptions()
+
+    @property
+    def total(self) -> int:
+        return self.national_pension + self.health_insurance + self.long_term_care + self.employment_insurance
+
+
+@dataclass
+class TaxResult:
+    income_tax: int
+    local_income_tax: int
+    taxable_income: int
+    dependents_count: int
+    children_under_20: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.income_tax + self.local_income_tax
+
+
+@dataclass
+class OvertimeResult:
+    overtime_pay: int = 0
+    night_pay: int = 0
+    holiday_pay: int = 0
+    overtime_minutes: int = 0
+    night_minutes: int = 0
+    holiday_minutes: int = 0
+    hourly_wage: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.overtime_pay + self.night_pay + self.holiday_pay
+
+
+@dataclass
+class WeeklyHolidayPayResult:
+    weekly_holiday_pay: int
+    weekly_minutes: int
+    daily_avg_hours: Decimal
+    hourly_wage: int
+    is_proportional: bool
+    calculation: str
+
+
+@dataclass
+class AbsenceResult:
+    scheduled_days: int
+    actual_work_days: int
+    absent_days: int
+    daily_wage: int
+    wage_deduction: int
+    holiday_pay_loss: int
+    total_deduction: int
+    absent_weeks: int
+
+
+@dataclass
+class SalaryResult:
+    employee: Employee
+    base_salary: int
+    allowances: list[Allowance]
+    regular_wage: int
+    hourly_wage: int
+    overtime: OvertimeResult
+    weekly_holiday: WeeklyHolidayPayResult
+    total_gross: int
+    insurance: InsuranceResult
+    tax: TaxResult
+    total_deductions: int
+    net_pay: int
+    wage_type: str = "MONTHLY"
+    calculation_month: str = ""
+    absence: Optional[AbsenceResult] = None
+    inclusive_wage_options: InclusiveWageOptions = InclusiveWageOptions()
+    inclusive_overtime_pay: int = 0
+    applied_wage_mode: Optional[str] = None
+    contract_vs_actual_diff: Optional[int] = None
+    contract_guarantee_allowance: int = 0
+    shifts: list[WorkShift] = field(default_factory=list)
+
+
+# ==================== 개별 계산기 ====================
+
+@_exact
+def calculate_insurance(
+    gross_income: int,
+    options: InsuranceOptions = InsuranceOptions(),
+    rates: Optional[PayrollRates] = None,
+) -> InsuranceResult:
+    """4대보험 근로자 부담분 (국민연금 상하한, 고용보험 상한 적용)"""
+    rates = rates or get_rates()
+    income = Decimal(gross_income)
+
+    pension_base = min(max(gross_income, rates.national_pension_min), rates.national_pension_max)
+    national_pension = won(pension_base * rates.national_pension_rate) if options.apply_national_pension else 0
+
+    health = won(income * rates.health_insurance_rate) if options.apply_health_insurance else 0
+    long_term_care = (
+        won(health * rates.long_term_care_rate)
+        if options.apply_health_insurance and options.apply_long_term_care
+        else 0
+    )
+
+    employment_base = min(gross_income, rates.employment_insurance_max)
+    employment = won(employment_base * rates.employment_insurance_rate) if options.apply_employment_insurance else 0
+
+    return InsuranceResult(
+        national_pension=national_pension,
+        national_pension_base=pension_base if options.apply_national_pension else 0,
+        health_insurance=health,
+        health_insurance_base=gross_income if options.apply_health_insurance else 0,
+        long_term_care=long_term_care,
+        employment_insurance=employment,
+        employment_insurance_base=employment_base if options.apply_employment_insurance else 0,
+        base_amount=gross_income,
+        applied_options=options,
+    )
+
+
+@_exact
+def calculate_tax(
+    taxable_income: int,
+    dependents_count: int,
+    children_under_20: int = 0,
+    rates: Optional[PayrollRates] = None,
+) -> TaxResult:
+    """간이세액표 소득세 + 지방소득세 (20세 이하 자녀 1명당 공제대상 가족 1명 추가)"""
+    rates = rates or get_rates()
+    income_tax = rates.income_tax(taxable_income, dependents_count + children_under_20)
+    return TaxResult(
+        income_tax=income_tax,
+        local_income_tax=won(income_tax * rates.local_tax_rate),
+        taxable_income=taxable_income,
+        dependents_count=dependents_count,
+        children_under_20=children_under_20,
+    )
+
+
+def _premium(hourly_wage: int, minutes: int, rate: Decimal) -> int:
+    return won(hourly_wage * decimal_hours(minutes) * rate)
+
+
+def _holiday_shift_pay(hourly_wage: int, minutes: int, company_size: str, rates: PayrollRates) -> int:
+    """휴일근로 1일분 (5인 이상: 8시간 초과분 2.0배)"""
+    hours = decimal_hours(minutes)
+    if company_size == "OVER_5" and hours > _EIGHT:
+        base = hourly_wage * _EIGHT * rates.holiday_rate
+        extra = hourly_wage * (hours - _EIGHT) * rates.holiday_overtime_rate
+        return won(base + extra)
+    return won(hourly_wage * hours * rates.holiday_rate)
+
+
+@_exact
+def calculate_overtime(
+    shifts: list[WorkShift],
+    hourly_wage: int,
+    company_size: str,
+    scheduled_work_days: int = 5,
+    daily_work_hours: int = 8,
+    rates: Optional[PayrollRates] = None,
+) -> OvertimeResult:
+    """
+    연장/야간/휴일 가산수당 (근로기준법 제56조, 5인 미만은 가산 의무 없음)
+
+    연장: 주별로 소정근로일 내 1일 소정시간 초과분 + 소정근로일 외 근무 + 주 40시간(또는 소정시간) 초과분
+    """
+    rates = rates or get_rates()
+    if company_size == "UNDER_5":
+        return OvertimeResult(hourly_wage=hourly_wage)
+
+    weekly_limit = min(scheduled_work_days * daily_work_hours, 40) * 60
+    daily_limit = daily_work_hours * 60
+
+    weeks: dict[tuple[int, int], list[WorkShift]] = {}
+    for shift in sorted(shifts, key=lambda s: s.date):
+        weeks.setdefault(_calendar_week_key(shift.date), []).append(shift)
+
+    overtime_minutes = 0
+    for week in weeks.values():
+        scheduled = excess = 0
+        for i, shift in enumerate(s for s in week if not s.is_holiday_work):
+            minutes = shift.working_minutes()
+            if i >= scheduled_work_days:
+                excess += minutes
+            elif minutes > daily_limit:
+                scheduled += daily_limit
+                excess += minutes - daily_limit
+            else:
+                scheduled += minutes
+        if scheduled > weekly_limit:
+            excess += scheduled - weekly_limit
+        overtime_minutes += excess
+
+    night_minutes = sum(s.night_minutes() for s in shifts)
+
+    holiday_minutes = 0
+    holiday_pay = 0
+    for shift in shifts:
+        if shift.is_holiday_work:
+            minutes = shift.working_minutes()
+            holiday_minutes += minutes
+            holiday_pay += _holiday_shift_pay(hourly_wage, minutes, company_size, rates)
+
+    return OvertimeResult(
+        overtime_pay=_premium(hourly_wage, overtime_minutes, rates.overtime_rate),
+        night_pay=_premium(hourly_wage, night_minutes, rates.night_rate),
+        holiday_pay=holiday_pay,
+        overtime_minutes=overtime_minutes,
+        night_minutes=night_minutes,
+        holiday_minutes=holiday_minutes,
+        hourly_wage=hourly_wage,
+    )
+
+
+@_exact
+def calculate_overtime_hours(
+    hourly_wage: int,
+    overtime_hours: float = 0,
+    night_hours: float = 0,
+    holiday_hours: float = 0,
+    company_size: str = "OVER_5",
+    rates: Optional[PayrollRates] = None,
+) -> OvertimeResult:
+    """시프트 없이 월 시간 합계로 가산수당 계산 (시뮬레이션용, 휴일근로는 1일 8시간 이내로 간주)"""
+    rates = rates or get_rates()
+    if company_size == "UNDER_5":
+        return OvertimeResult(hourly_wage=hourly_wage)
+
+    # WorkingHours.fromDecimalHours: 분 단위 버림
+    overtime, night, holiday = (int(Decimal(str(h)) * 60) for h in (overtime_hours, night_hours, holiday_hours))
+    return OvertimeResult(
+        overtime_pay=_premium(hourly_wage, overtime, rates.overtime_rate),
+        night_pay=_premium(hourly_wage, night, rates.night_rate),
+        holiday_pay=_premium(hourly_wage, holiday, rates.holiday_rate),
+        overtime_minutes=overtime,
+        night_minutes=night,
+        holiday_minutes=holiday,
+        hourly_wage=hourly_wage,
+    )
+
+
+def _average_weekly_minutes(regular: list[WorkShift]) -> int:
+    if not regular:
+        return 0
+    total = sum(s.working_minutes() for s in regular)
+    dates = [s.date for s in regular]
+    days = (max(dates) - min(dates)).days + 1
+    weeks = max(_div(days, 7), _ONE)
+    return won(Decimal(total) / weeks)
+
+
+def _count_qualifying_weeks(regular: list[WorkShift], scheduled_work_days: int) -> tuple[int, int]:
+    """(개근한 주, 주 15시간 이상 근무한 주) - 월 경계에 걸친 주는 해당 월 안의 소정근로일만 요구"""
+    if not regular:
+        return 0, 0
+
+    week_dates: dict[date, set[date]] = {}
+    week_minutes: dict[date, int] = {}
+    for shift in regular:
+        key = _week_start(shift.date)
+        week_dates.setdefault(key, set()).add(shift.date)
+        week_minutes[key] = week_minutes.get(key, 0) + shift.working_minutes()
+
+    # 가장 많이 근무한 달 (동률이면 먼저 나온 달)
+    months = Counter((s.date.year, s.date.month) for s in regular)
+    year, month = max(months, key=months.__getitem__)
+    first_day = date(year, month, 1)
+    last_day = (first_day.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+
+    qualifying = total = 0
+    for start, dates in week_dates.items():
+        if week_minutes[start] < 900:
+            continue
+        possible = sum(
+            1
+            for i in range(7)
+            if (d := start + timedelta(days=i)).isoweekday() <= scheduled_work_days and first_day <= d <= last_day
+        )
+        total += 1
+        if len(dates) >= min(possible, scheduled_work_days):
+            qualifying += 1
+    return qualifying, total
+
+
+@_exact
+def calculate_weekly_holiday_pay(
+    shifts: list[WorkShift],
+    hourly_wage: int,
+    scheduled_work_days: int = 5,
+    contract_weekly_hours: int = 0,
+    rates: Optional[PayrollRates] = None,
+) -> WeeklyHolidayPayResult:
+    """
+    주휴수당 (근로기준법 제55조)
+    주휴시간 = min(1일 소정근로시간, 8시간), 주 15시간 미만은 없음, 개근한 주 비율만큼 지급
+    시프트가 없으면 계약 소정근로시간으로 전 주 개근 가정
+    """
+    rates = rates or get_rates()
+
+    if not shifts and contract_weekly_hours > 0:
+        daily = _div(contract_weekly_hours, scheduled_work_days)
+        if contract_weekly_hours < 15:
+            return WeeklyHolidayPayResult(
+                weekly_holiday_pay=0,
+                weekly_minutes=contract_weekly_hours * 60,
+                daily_avg_hours=daily,
+                hourly_wage=hourly_wage,
+                is_proportional=contract_weekly_hours < 40,
+                calculation=f"주 {contract_weekly_hours}시간 미만 15시간 - 주휴수당 없음",
+            )
+        holiday_hours = min(daily, _EIGHT)
+        return WeeklyHolidayPayResult(
+            weekly_holiday_pay=won(hourly_wage * holiday_hours * rates.weeks_per_month),
+            weekly_minutes=contract_weekly_hours * 60,
+            daily_avg_hours=daily,
+            hourly_wage=hourly_wage,
+            is_proportional=daily < _EIGHT,
+            calculation=(
+                f"min({_scaled(daily, 1)}h, 8h) = {_scaled(holiday_hours, 1)}h × "
+                f"{hourly_wage}원 × {rates.weeks_per_month}주 (계약기준)"
+            ),
+        )
+
+    regular = [s for s in shifts if not s.is_holiday_work]
+    weekly_minutes = _average_weekly_minutes(regular)
+    weekly_hours = decimal_hours(weekly_minutes)
+    daily = _div(weekly_hours, scheduled_work_days)
+    holiday_hours = min(daily, _EIGHT)
+
+    def no_pay(reason: str) -> WeeklyHolidayPayResult:
+        return WeeklyHolidayPayResult(0, weekly_minutes, daily, hourly_wage, daily < _EIGHT, reason)
+
+    if weekly_hours < _FIFTEEN:
+        return no_pay("주 15시간 미만 - 주휴수당 없음")
+
+    qualifying, total = _count_qualifying_weeks(regular, scheduled_work_days)
+    if qualifying == 0:
+        return no_pay("개근한 주 없음 - 주휴수당 없음")
+
+    ratio = _div(qualifying, total) if total > 0 else _ONE
+    effective_weeks = rates.weeks_per_month * ratio
+    return WeeklyHolidayPayResult(
+        weekly_holiday_pay=won(hourly_wage * holiday_hours * effective_weeks),
+        weekly_minutes=weekly_minutes,
+        daily_avg_hours=daily,
+        hourly_wage=hourly_wage,
+        is_proportional=daily < _EIGHT,
+        calculation=(
+            f"min({_scaled(daily, 1)}h, 8h) = {_scaled(holiday_hours, 1)}h × "
+            f"{hourly_wage}원 × {_scaled(effective_weeks, 3)}주"
+        ),
+    )
+
+
+def _scheduled_dates(year: int, month: int, scheduled_work_days: int, is_over5: bool, rates: PayrollRates) -> set[date]:
+    """월 소정근로일 (월요일부터 주 소정근로일수만큼, 유급휴일 제외)"""
+    holidays = rates.holidays | {rates.labor_day} if is_over5 else {rates.labor_day}
+    weekdays = scheduled_work_days if 1 <= scheduled_work_days <= 7 else 5
+    first = date(year, month, 1)
+    dates = set()
+    d = first
+    while d.month == month:
+        if d.isoweekday() <= weekdays and d not in holidays:
+            dates.add(d)
+        d += timedelta(days=1)
+    return dates
+
+
+@_exact
+def calculate_absence(
+    shifts: list[WorkShift],
+    scheduled_work_days: int,
+    calculation_month: str,
+    base_salary: int,
+    absence_policy: str,
+    is_over5: bool,
+    rates: Optional[PayrollRates] = None,
+) -> AbsenceResult:
+    """
+    결근 공제 (월급제)
+    STRICT: 일급 × 결근일 공제, MODERATE/LENIENT: 기본급 공제 없음
+    """
+    year, month = (int(p) for p in calculation_month.split("-"))
+    rates = rates or get_rates(year)
+
+    scheduled = _scheduled_dates(year, month, scheduled_work_days, is_over5, rates)
+    worked = {s.date for s in shifts if not s.is_holiday_work}
+    actual = len(worked & scheduled)
+    absent = max(0, len(scheduled) - actual)
+    daily_wage = won(_div(base_salary, len(scheduled))) if scheduled else 0
+
+    wage_deduction = daily_wage * absent if absence_policy == "STRICT" and absent else 0
+    # Spring도 결근 주 주휴수당 손실은 통상시급 없이 호출되어 항상 0
+    holiday_pay_loss = 0
+
+    weeks: dict[date, list[date]] = {}
+    for d in scheduled:
+        weeks.setdefault(_week_start(d), []).append(d)
+    absent_weeks = sum(1 for days in weeks.values() if len(worked.intersection(days)) < len(days))
+
+    return AbsenceResult(
+        scheduled_days=len(scheduled),
+        actual_work_days=actual,
+        absent_days=absent,
+        daily_wage=daily_wage,
+        wage_deduction=wage_deduction,
+        holiday_pay_loss=holiday_pay_loss,
+        total_deduction=wage_deduction + holiday_pay_loss,
+        absent_weeks=absent_weeks,
+    )
+
+
+def monthly_regular_hours(weekly_hours: int, hours_mode: str = "174", rates: Optional[PayrollRates] = None) -> int:
+    """월 소정근로시간 (174: 주휴 분리, 209: 주휴 포함)"""
+    rates = rates or get_rates()
+    capped = Decimal(min(weekly_hours, 40))
+    with localcontext(_CTX):
+        if hours_mode == "209":
+            capped += _div(capped, _FORTY) * _EIGHT
+        return won(capped * rates.weeks_per_month)
+
+
+# ==================== 급여 계산 ====================
+
+@_exact
+def calculate_salary(
+    employee: Employee,
+    base_salary: int = 0,
+    allowances: Optional[list[Allowance]] = None,
+    shifts: Optional[list[WorkShift]] = None,
+    wage_type: str = "MONTHLY",
+    hourly_wage_input: int = 0,
+    calculation_month: str = "",
+    absence_policy: str = "STRICT",
+    hours_mode: str = "174",
+    insurance_options: InsuranceOptions = InsuranceOptions(),
+    inclusive_wage_options: InclusiveWageOptions = InclusiveWageOptions(),
+    contract_monthly_salary: Optional[int] = None,
+    extra_hours: Optional[tuple[float, float, float]] = None,
+) -> SalaryResult:
+    """
+    급여 계산 (SalaryCalculator.calculate)
+
+    기본급 결정 → 통상시급 → 연장/야간/휴일 수당 → 주휴수당 → 총 지급액 → 4대보험/세금 → 실수령액
+
+    Args:
+        extra_hours: 시프트 대신 월 (연장, 야간, 휴일) 시간 합계로 가산수당 계산 (시뮬레이션용)
+    """
+    allowances = allowances or []
+    shifts = shifts or []
+    if wage_type not in WAGE_TYPES:
+        raise ValueError(f"Unknown wage type: {wage_type}")
+    normalized = WAGE_TYPES[wage_type]
+    is_over5 = employee.company_size == "OVER_5"
+    days = employee.scheduled_work_days
+
+    if not calculation_month and shifts:
+        first = min(s.date for s in shifts)
+        calculation_month = f"{first.year}-{first.month:02d}"
+    rates = get_rates(int(calculation_month[:4]) if calculation_month else None)
+
+    # 1. 유형별 기본급/통상시급
+    absence = None
+    hourly_overtime = None
+    if normalized == "MONTHLY_FIXED":
+        effective_base = base_salary
+        if calculation_month and shifts:
+            absence = calculate_absence(shifts, days, calculation_month, base_salary, absence_policy, is_over5, rates)
+            effective_base = base_salary - absence.total_deduction
+        regular_wage = base_salary + sum(a.amount for a in allowances if a.is_included_in_regular_wage)
+        hours = monthly_regular_hours(employee.weekly_contract_hours, hours_mode, rates)
+        hourly_wage = won(_div(regular_wage, hours))
+    else:
+        hourly_wage = hourly_wage_input
+        hourly_overtime = calculate_overtime(
+            shifts, hourly_wage, employee.company_size, days, employee.daily_work_hours, rates
+        )
+        base_shifts = [s for s in shifts if not s.is_holiday_work] if is_over5 else shifts
+        regular_minutes = sum(s.working_minutes() for s in base_shifts)
+        if is_over5:
+            regular_minutes -= hourly_overtime.overtime_minutes
+        effective_base = won(hourly_wage * _div(regular_minutes, 60))
+        regular_wage = effective_base
+
+    # 2. 연장/야간/휴일 수당 (포괄임금제 분기)
+    inclusive_pay = 0
+    if inclusive_wage_options.enabled and normalized == "MONTHLY_FIXED":
+        inclusive_pay = inclusive_wage_options.monthly_fixed_overtime_pay()
+        actual = calculate_overtime(shifts, hourly_wage, employee.company_size, days, employee.daily_work_hours, rates)
+        overtime = OvertimeResult(
+            overtime_pay=0,
+            night_pay=actual.night_pay,
+            holiday_pay=actual.holiday_pay,
+            overtime_minutes=int(inclusive_wage_options.monthly_expected_overtime_hours * 60),
+            night_minutes=actual.night_minutes,
+            holiday_minutes=actual.holiday_minutes,
+            hourly_wage=hourly_wage,
+        )
+    elif extra_hours is not None and not shifts:
+        overtime = calculate_overtime_hours(hourly_wage, *extra_hours, company_size=employee.company_size, rates=rates)
+    else:
+        overtime = hourly_overtime or calculate_overtime(
+            shifts, hourly_wage, employee.company_size, days, employee.daily_work_hours, rates
+        )
+
+    # 3. 주휴수당 (209 모드 월급제는 기본급에 포함)
+    if hours_mode == "209" and normalized == "MONTHLY_FIXED":
+        weekly_holiday = WeeklyHolidayPayResult(
+            weekly_holiday_pay=0,
+            weekly_minutes=employee.weekly_contract_hours * 60,
+            daily_avg_hours=Decimal(employee.daily_work_hours),
+            hourly_wage=hourly_wage,
+            is_proportional=False,
+            calculation="209시간 모드: 주휴수당이 기본급에 포함됨",
+        )
+    else:
+        weekly_holiday = calculate_weekly_holiday_pay(shifts, hourly_wage, days, employee.weekly_contract_hours, rates)
+
+    # 4. 시급기반 월급제: MAX(계약월급, 실제시간×시급+주휴수당), 부족분은 계약보전수당
+    applied_mode = None
+    contract_diff = None
+    guarantee = 0
+    if normalized == "HOURLY_BASED_MONTHLY" and contract_monthly_salary is not None:
+        actual_total = effective_base + weekly_holiday.weekly_holiday_pay
+        if actual_total > contract_monthly_salary:
+            applied_mode, contract_diff = "ACTUAL_CALCULATION", actual_total - contract_monthly_salary
+        else:
+            applied_mode, contract_diff = "CONTRACT_SALARY", contract_monthly_salary - actual_total
+            guarantee = contract_diff
+
+    # 5. 총 지급액
+    total_gross = (
+        effective_base
+        + sum(a.amount for a in allowances)
+        + overtime.total
+        + inclusive_pay
+        + weekly_holiday.weekly_holiday_pay
+        + guarantee
+    )
+
+    # 6. 4대보험/세금 (비과세 수당 제외)
+    taxable = total_gross - sum(a.amount for a in allowances if not a.is_taxable)
+    insurance = calculate_insurance(taxable, insurance_options, rates)
+    tax = calculate_tax(taxable, employee.dependents_count, employee.children_under_20, rates)
+    total_deductions = insurance.total + tax.total
+
+    return SalaryResult(
+        employee=employee,
+        base_salary=effective_base,
+        allowances=allowances,
+        regular_wage=regular_wage,
+        hourly_wage=hourly_wage,
+        overtime=overtime,
+        weekly_holiday=weekly_holiday,
+        total_gross=total_gross,
+        insurance=insurance,
+        tax=tax,
+        total_deductions=total_deductions,
+        net_pay=total_gross - total_deductions,
+        wage_type=wage_type,
+        calculation_month=calculation_month,
+        absence=absence,
+        inclusive_wage_options=inclusive_wage_options,
+        inclusive_overtime_pay=inclusive_pay,
+        applied_wage_mode=applied_mode,
+        contract_vs_actual_diff=contract_diff,
+        contract_guarantee_allowance=guarantee,
+        shifts=shifts,
+    )
+
+
+# ==================== Spring API 형식 변환 ====================
+
+def _money(amount: int) -> dict:
+    return {"amount": amount, "formatted": f"{amount:,}원"}
+
+
+def _hours(minutes: int) -> dict:
+    hours, rest = divmod(minutes, 60)
+    return {"hours": hours, "minutes": rest, "totalMinutes": minutes, "formatted": format_hours(minutes)}
+
+
+def parse_salary_request(payload: dict) -> dict:
+    """Spring SalaryCalculationRequest JSON → calculate_salary 인자"""
+    emp = payload.get("employee") or {}
+    insurance = payload.get("insuranceOptions") or {}
+    inclusive = payload.get("inclusiveWageOptions") or {}
+    hours_mode = str(payload.get("hoursMode") or "174").removeprefix("MODE_")
+    return {
+        "employee": Employee(
+            name=emp.get("name", "시뮬레이션"),
+            dependents_count=int(emp.get("dependentsCount", 1)),
+            children_under_20=int(emp.get("childrenUnder20", 0)),
+            employment_type=emp.get("employmentType", "FULL_TIME"),
+            company_size=emp.get("companySize", "OVER_5"),
+            scheduled_work_days=int(emp.get("scheduledWorkDays", 5)),
+            daily_work_hours=int(emp.get("dailyWorkHours", 8)),
+        ),
+        "base_salary": int(payload.get("baseSalary", 0)),
+        "allowances": [
+            Allowance(
+                name=a["name"],
+                amount=int(a["amount"]),
+                is_taxable=bool(a.get("isTaxable", True)),
+                is_includable_in_minimum_wage=bool(a.get("isIncludableInMinimumWage", True)),
+                is_fixed=bool(a.get("isFixed", True)),
+                is_included_in_regular_wage=bool(a.get("isIncludedInRegularWage", True)),
+            )
+            for a in payload.get("allowances") or []
+        ],
+        "shifts": [
+            WorkShift(
+                date=date.fromisoformat(s["date"]),
+                start_time=time.fromisoformat(s["startTime"]),
+                end_time=time.fromisoformat(s["endTime"]),
+                break_minutes=int(s.get("breakMinutes", 0)),
+                is_holiday_work=bool(s.get("isHolidayWork", False)),
+            )
+            for s in payload.get("workShifts") or []
+        ],
+        "wage_type": payload.get("wageType", "MONTHLY"),
+        "hourly_wage_input": int(payload.get("hourlyWage", 0)),
+        "calculation_month": payload.get("calculationMonth", "") or "",
+        "absence_policy": payload.get("absencePolicy", "STRICT"),
+        "hours_mode": "209" if hours_mode == "209" else "174",
+        "insurance_options": InsuranceOptions(
+            apply_national_pension=insurance.get("applyNationalPension", True),
+            apply_health_insurance=insurance.get("applyHealthInsurance", True),
+            apply_long_term_care=insurance.get("applyLongTermCare", True),
+            apply_employment_insurance=insurance.get("applyEmploymentInsurance", True),
+        ),
+        "inclusive_wage_options": InclusiveWageOptions(
+            enabled=bool(inclusive.get("enabled", False)),
+            fixed_overtime_hourly_rate=int(inclusive.get("fixedOvertimeHourlyRate", 0)),
+            monthly_expected_overtime_hours=Decimal(str(inclusive.get("monthlyExpectedOvertimeHours", 0.0))),
+        ),
+        "contract_monthly_salary": payload.get("contractMonthlySalary"),
+    }
+
+
+def salary_response(result: SalaryResult, absence_policy: str = "STRICT") -> dict:
+    """SalaryResult → Spring SalaryCalculationResponse JSON"""
+    overtime = result.overtime
+    insurance = result.insurance
+    options = insurance.applied_options
+    today = date.today()
+
+    total_minutes = sum(s.working_minutes() for s in result.shifts)
+    regular_minutes = max(0, total_minutes - overtime.overtime_minutes - overtime.holiday_minutes)
+    inclusive = result.inclusive_wage_options
+
+    return {
+        "employeeName": result.employee.name,
+        "grossBreakdown": {
+            "baseSalary": _money(result.base_salary),
+            "regularWage": _money(result.regular_wage),
+            "hourlyWage": _money(result.hourly_wage),
+            "taxableAllowances": _money(sum(a.amount for a in result.allowances if a.is_taxable)),
+            "nonTaxableAllowances": _money(sum(a.amount for a in result.allowances if not a.is_taxable)),
+            "overtimeAllowances": {
+                "overtimeHours": _hours(overtime.overtime_minutes),
+                "overtimePay": _money(overtime.overtime_pay),
+                "nightHours": _hours(overtime.night_minutes),
+                "nightPay": _money(overtime.night_pay),
+                "holidayHours": _hours(overtime.holiday_minutes),
+                "holidayPay": _money(overtime.holiday_pay),
+                "total": _money(overtime.total),
+            },
+            "weeklyHolidayPay": {
+                "amount": _money(result.weekly_holiday.weekly_holiday_pay),
+                "weeklyHours": _hours(result.weekly_holiday.weekly_minutes),
+                "isProportional": result.weekly_holiday.is_proportional,
+                "calculation": result.weekly_holiday.calculation,
+            },
+            "inclusiveOvertimePay": _money(result.inclusive_overtime_pay) if inclusive.enabled else None,
+            "total": _money(result.total_gross),
+        },
+        "deductionsBreakdown": {
+            "insurance": {
+                "nationalPension": _money(insurance.national_pension),
+                "healthInsurance": _money(insurance.health_insurance),
+                "longTermCare": _money(insurance.long_term_care),
+                "employmentInsurance": _money(insurance.employment_insurance),
+                "total": _money(insurance.total),
+                "appliedOptions": {
+                    "applyNationalPension": options.apply_national_pension,
+                    "applyHealthInsurance": options.apply_health_insurance,
+                    "applyLongTermCare": options.apply_long_term_care,
+                    "applyEmploymentInsurance": options.apply_employment_insurance,
+                },
+            },
+            "tax": {
+                "incomeTax": _money(result.tax.income_tax),
+                "localIncomeTax": _money(result.tax.local_income_tax),
+                "total": _money(result.tax.total),
+            },
+            "total": _money(result.total_deductions),
+        },
+        "netPay": _money(result.net_pay),
+        "workSummary": {
+            "calculationMonth": result.calculation_month,
+            "wageType": result.wage_type,
+            "scheduledDays": result.employee.scheduled_work_days * 4,
+            "actualWorkDays": len(result.shifts),
+            "absentDays": result.absence.absent_days if result.absence else 0,
+            "totalWorkHours": _hours(total_minutes),
+            "regularHours": _hours(regular_minutes),
+            "overtimeHours": _hours(overtime.overtime_minutes),
+            "nightHours": _hours(overtime.night_minutes),
+            "holidayHours": _hours(overtime.holiday_minutes),
+            "weeklyHolidayWeeks": result.weekly_holiday.weekly_minutes // 60 // 40,
+            "totalWeeks": 4,
+        },
+        "absenceBreakdown": {
+            "scheduledDays": result.absence.scheduled_days,
+            "actualWorkDays": result.absence.actual_work_days,
+            "absentDays": result.absence.absent_days,
+            "dailyWage": _money(result.absence.daily_wage),
+            "wageDeduction": _money(result.absence.wage_deduction),
+            "holidayPayLoss": _money(result.absence.holiday_pay_loss),
+            "totalDeduction": _money(result.absence.total_deduction),
+            "absencePolicy": absence_policy,
+        } if result.absence else None,
+        "inclusiveWageOptions": {
+            "enabled": True,
+            "fixedOvertimeHourlyRate": inclusive.fixed_overtime_hourly_rate,
+            "monthlyExpectedOvertimeHours": float(inclusive.monthly_expected_overtime_hours),
+            "monthlyFixedOvertimePay": _money(result.inclusive_overtime_pay),
+        } if inclusive.enabled else None,
+        "warnings": [],
+        "appliedWageMode": result.applied_wage_mode,
+        "contractVsActualDiff": _money(result.contract_vs_actual_diff) if result.contract_vs_actual_diff is not None else None,
+        "contractGuaranteeAllowance": _money(result.contract_guarantee_allowance) if result.contract_guarantee_allowance > 0 else None,
+        "calculationMetadata": {
+            "calculation_date": today.isoformat(),
+            "tax_year": today.year,
+            "insurance_year": today.year,
+            "wage_type": result.wage_type,
+            "calculation_month": result.calculation_month,
+        },
+    }
+
+
+def calculate_salary_request(payload: dict) -> dict:
+    """Spring /api/v1/salary/calculate와 같은 JSON 요청 → 같은 형식의 응답"""
+    kwargs = parse_salary_request(payload)
+    result = calculate_salary(**kwargs)
+    return salary_response(result, kwargs["absence_policy"])
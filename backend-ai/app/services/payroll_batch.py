@@ -0,0 +1,274 @@
+"""
+급여 일괄 시뮬레이션 (NumPy 벡터 연산)
+직원 수천 명의 기본급/주 소정근로시간/부양가족 배열로 4대보험, 소득세, 가산수당, 주휴수당, 실수령액을 한 번에 계산
+
+- 계산 순서와 반올림은 payroll.calculate_salary(월급제, 시간 합계 기반 가산수당)와 동일
+- 요율은 정수 분수로 바꿔 int64 정수 연산으로 원 단위 반올림(ROUND_HALF_UP) → 부동소수점 오차 없음
+  (insurance_calculator / salary_calculator 결과와 1원 단위까지 일치)
+- 인상률은 소수 4자리(%)로 반올림해 적용 (분모 10^6 고정 → int64 범위 안에서 계산)
+"""
+
+import math
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from app.services.payroll_rates import PayrollRates, get_rates
+
+ArrayLike = Union[int, float, Sequence[int], Sequence[float], np.ndarray]
+
+_HOUR_SCALE = 10**10  # WorkingHours.toDecimalHours 소수 10자리
+_SPLIT_DAYS = (5, 6, 4, 3, 7, 2, 1)  # tools._split_weekly_hours와 같은 우선순위
+COMPANY_SIZES = ("OVER_5", "UNDER_5")  # Spring CompanySize
+RAISE_PERCENT_STEP = Decimal("0.0001")  # 인상률 적용 단위 (%)
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+def _ratio(value: Decimal) -> tuple[int, int]:
+    """Decimal 요율 → (분자, 분모)"""
+    return value.as_integer_ratio()
+
+
+def _check_range(amount: np.ndarray, multiplier: int, addend: int = 0):
+    """amount × multiplier + addend가 int64를 넘으면 ValueError (넘치면 조용히 틀린 값이 나오므로)"""
+    if amount.size and int(amount.max()) * multiplier + addend > _INT64_MAX:
+        raise ValueError("금액이 계산 가능한 범위를 넘습니다")
+
+
+def _round_mul(amount: np.ndarray, rate: Decimal) -> np.ndarray:
+    """won(amount × rate), amount ≥ 0"""
+    num, den = _ratio(rate)
+    _check_range(amount, 2 * num, den)
+    return (2 * amount * num + den) // (2 * den)
+
+
+def _round_div(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """won(a / b), a ≥ 0, b > 0 (분모가 작아 소수 10자리 중간 반올림과 결과 동일)"""
+    return (2 * a + b) // (2 * b)
+
+
+def _premium(hourly: np.ndarray, minutes: np.ndarray, rate: Decimal) -> np.ndarray:
+    """won(hourly × decimal_hours(minutes) × rate) 정수 연산 (int64 범위 안에서 분할 계산)"""
+    num, den = _ratio(rate)
+    whole = minutes // 60
+    frac = (2 * (minutes % 60) * _HOUR_SCALE + 60) // 120  # _div(m % 60, 60) × 10^10
+    _check_range(hourly, num * max(int(whole.max(initial=0)), 2 * int(frac.max(initial=0))), 3 * den * _HOUR_SCALE)
+    # hourly × rate × (whole + frac / 10^10) = q + (r × 10^10 + hourly × num × frac) / (den × 10^10)
+    q, r = np.divmod(hourly * num * whole, den)
+    scale = den * _HOUR_SCALE
+    return q + (2 * (r * _HOUR_SCALE + hourly * num * frac) + scale) // (2 * scale)
+
+
+def _to_minutes(hours: np.ndarray) -> np.ndarray:
+    """시간 → 분 (분 미만 버림, 10진 표기 기준이 되도록 부동소수점 잔차 제거)"""
+    return np.floor(np.round(np.asarray(hours, dtype=np.float64) * 60, 9)).astype(np.int64)
+
+
+def _split_weekly_hours(weekly_hours: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """주 소정근로시간 → (주 소정근로일수, 1일 소정근로시간), 주 5일 우선"""
+    days = np.zeros_like(weekly_hours)
+    for d in _SPLIT_DAYS:
+        fits = (days == 0) & (weekly_hours % d == 0) & (weekly_hours // d >= 1) & (weekly_hours // d <= 24)
+        days[fits] = d
+    unmatched = days == 0
+    fallback = np.where(weekly_hours >= 5, 5, 1)
+    days[unmatched] = fallback[unmatched]
+    daily = np.where(
+        unmatched,
+        np.clip(np.round(weekly_hours / np.maximum(days, 1)), 1, 24).astype(np.int64),
+        weekly_hours // np.maximum(days, 1),
+    )
+    return days, daily
+
+
+def _broadcast(value: Optional[ArrayLike], size: int, default, dtype) -> np.ndarray:
+    if value is None:
+        value = default
+    array = np.asarray(value, dtype=dtype)
+    if array.ndim == 0:
+        return np.full(size, array, dtype=dtype)
+    if array.shape != (size,):
+        raise ValueError(f"배열 길이가 기본급 배열과 다릅니다: {array.shape[0]} != {size}")
+    return array
+
+
+@dataclass
+class BatchResult:
+    """직원별 계산 결과 배열 (모두 int64, 원/분 단위)"""
+    base_salary: np.ndarray
+    hourly_wage: np.ndarray
+    overtime_pay: np.ndarray
+    night_pay: np.ndarray
+    holiday_pay: np.ndarray
+    weekly_holiday_pay: np.ndarray
+    total_gross: np.ndarray
+    national_pension: np.ndarray
+    health_insurance: np.ndarray
+    long_term_care: np.ndarray
+    employment_insurance: np.ndarray
+    income_tax: np.ndarray
+    local_income_tax: np.ndarray
+    total_deductions: np.ndarray
+    net_pay: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.base_salary)
+
+    @property
+    def insurance_total(self) -> np.ndarray:
+        return self.national_pension + self.health_insurance + self.long_term_care + self.employment_insurance
+
+    def totals(self) -> dict:
+        """항목별 합계"""
+        return {name: int(getattr(self, name).sum()) for name in self.__dataclass_fields__ if name != "hourly_wage"}
+
+    def rows(self, limit: Optional[int] = None) -> list[dict]:
+        """직원별 결과 (dict 목록)"""
+        n = len(self) if limit is None else min(limit, len(self))
+        columns = {name: getattr(self, name)[:n].tolist() for name in self.__dataclass_fields__}
+        return [{name: values[i] for name, values in columns.items()} for i in range(n)]
+
+
+def insurance_batch(
+    monthly_salary: ArrayLike, rates: Optional[PayrollRates] = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """4대보험 근로자 부담분 (국민연금, 건강보험, 장기요양, 고용보험) - payroll.calculate_insurance와 동일"""
+    rates = rates or get_rates()
+    income = np.asarray(monthly_salary, dtype=np.int64)
+    if (income < 0).any():
+        raise ValueError("월 급여는 0 이상이어야 합니다")
+    pension_base = np.clip(income, rates.national_pension_min, rates.national_pension_max)
+    health = _round_mul(income, rates.health_insurance_rate)
+    return (
+        _round_mul(pension_base, rates.national_pension_rate),
+        health,
+        _round_mul(health, rates.long_term_care_rate),
+        _round_mul(np.minimum(income, rates.employment_insurance_max), rates.employment_insurance_rate),
+    )
+
+
+def income_tax_batch(
+    taxable_income: ArrayLike, dependents: ArrayLike, rates: Optional[PayrollRates] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """간이세액표 소득세 + 지방소득세 (공제대상 가족 수는 20세 이하 자녀 포함)"""
+    rates = rates or get_rates()
+    income = np.asarray(taxable_income, dtype=np.int64)
+    mins = np.array([b.min_income for b in rates.tax_table], dtype=np.int64)
+    table = np.array([b.tax_by_dependents for b in rates.tax_table], dtype=np.int64)
+    last = len(mins) - 1
+
+    bracket = np.searchsorted(mins, income, side="right") - 1
+    # 세액표 범위 밖은 최고 구간 (PayrollRates.income_tax와 동일)
+    out_of_range = (income < mins[0]) | (income >= rates.tax_table[-1].max_income)
+    bracket = np.where(out_of_range, last, np.clip(bracket, 0, last))
+    key = np.clip(np.asarray(dependents, dtype=np.int64), 1, 11) - 1
+
+    income_tax = table[bracket, key]
+    return income_tax, _round_mul(income_tax, rates.local_tax_rate)
+
+
+def simulate_batch(
+    base_salary: ArrayLike,
+    weekly_hours: Optional[ArrayLike] = None,
+    dependents: Optional[ArrayLike] = None,
+    children_under_20: Optional[ArrayLike] = None,
+    overtime_hours: Optional[ArrayLike] = None,
+    night_hours: Optional[ArrayLike] = None,
+    holiday_hours: Optional[ArrayLike] = None,
+    company_size: str = "OVER_5",
+    raise_percent: float = 0,
+    rates: Optional[PayrollRates] = None,
+) -> BatchResult:
+    """
+    월급제 급여 일괄 계산 (174시간 모드, 시프트 없이 계약 소정근로시간 + 월 가산시간 기준)
+
+    Args:
+        base_salary: 직원별 기본급
+        weekly_hours: 주 소정근로시간 (스칼라면 전원 동일, 기본 40)
+        dependents: 부양가족 수 (본인 포함, 기본 1)
+        children_under_20: 20세 이하 자녀 수 (기본 0)
+        overtime_hours / night_hours / holiday_hours: 월 연장/야간/휴일 근로시간
+        company_size: 사업장 규모 (UNDER_5는 가산수당 없음)
+        raise_percent: 기본급 인상률(%) - 소수 4자리로 반올림해 적용, 인상 후 기본급은 원 단위 반올림
+
+    Returns:
+        BatchResult (직원별 결과 배열)
+    """
+    rates = rates or get_rates()
+    base = np.atleast_1d(np.asarray(base_salary, dtype=np.int64))
+    n = base.shape[0]
+    weekly = _broadcast(weekly_hours, n, 40, np.int64)
+    deps = _broadcast(dependents, n, 1, np.int64)
+    children = _broadcast(children_under_20, n, 0, np.int64)
+    if (base < 0).any():
+        raise ValueError("기본급은 0 이상이어야 합니다")
+    if (deps < 0).any() or (children < 0).any() or (children > deps).any():
+        raise ValueError("부양가족 수는 0 이상, 20세 이하 자녀 수는 부양가족 수 이하여야 합니다")
+    if (weekly < 1).any():
+        raise ValueError("주 소정근로시간은 1시간 이상이어야 합니다")
+    extra_hours = [
+        _broadcast(hours, n, 0, np.float64) for hours in (overtime_hours, night_hours, holiday_hours)
+    ]
+    if not all((hours >= 0).all() for hours in extra_hours):  # NaN도 거절
+        raise ValueError("연장/야간/휴일 근로시간은 0 이상이어야 합니다")
+    if company_size not in COMPANY_SIZES:
+        raise ValueError(f"사업장 규모는 {', '.join(COMPANY_SIZES)} 중 하나여야 합니다: {company_size}")
+    if not math.isfinite(raise_percent):
+        raise ValueError("인상률은 유한한 숫자여야 합니다")
+    try:
+        percent = Decimal(str(raise_percent)).quantize(RAISE_PERCENT_STEP, rounding=ROUND_HALF_UP)
+    except InvalidOperation:
+        raise ValueError("인상률이 계산 가능한 범위를 넘습니다") from None
+    if percent <= -100:
+        raise ValueError("인상률은 -100%보다 커야 합니다")
+    if percent:
+        base = _round_mul(base, 1 + percent / 100)
+
+    # 통상시급 = 기본급 / 월 소정근로시간 (174 모드: min(주 소정, 40) × 4.345)
+    days, daily = _split_weekly_hours(weekly)
+    contract = days * daily
+    monthly_hours = _round_mul(np.minimum(contract, 40), rates.weeks_per_month)
+    hourly = _round_div(base, monthly_hours)
+
+    # 가산수당 (월 시간 합계 기준)
+    if company_size == "UNDER_5":
+        overtime_pay = night_pay = holiday_pay = np.zeros(n, dtype=np.int64)
+    else:
+        overtime, night, holiday = (_to_minutes(hours) for hours in extra_hours)
+        overtime_pay = _premium(hourly, overtime, rates.overtime_rate)
+        night_pay = _premium(hourly, night, rates.night_rate)
+        holiday_pay = _premium(hourly, holiday, rates.holiday_rate)
+
+    # 주휴수당 (계약 기준 전 주 개근, 주 15시간 미만 없음)
+    num, den = _ratio(rates.weeks_per_month)
+    holiday_hours_per_week = np.minimum(daily, 8)
+    weekly_holiday = np.where(
+        contract >= 15,
+        (2 * hourly * holiday_hours_per_week * num + den) // (2 * den),
+        0,
+    )
+
+    gross = base + overtime_pay + night_pay + holiday_pay + weekly_holiday
+    pension, health, long_term_care, employment = insurance_batch(gross, rates)
+    income_tax, local_tax = income_tax_batch(gross, deps + children, rates)
+    deductions = pension + health + long_term_care + employment + income_tax + local_tax
+
+    return BatchResult(
+        base_salary=base,
+        hourly_wage=hourly,
+        overtime_pay=overtime_pay,
+        night_pay=night_pay,
+        holiday_pay=holiday_pay,
+        weekly_holiday_pay=weekly_holiday,
+        total_gross=gross,
+        national_pension=pension,
+        health_insurance=health,
+        long_term_care=long_term_care,
+        employment_insurance=employment,
+        income_tax=income_tax,
+        local_income_tax=local_tax,
+        total_deductions=deductions,
+        net_pay=gross - deductions,
+    )
@@ -0,0 +1,122 @@
+"""
+급여 계산 요율 레지스트리
+연도별 4대보험 요율/상하한, 가산율, 간이세액표, 공휴일 (backend-spring domain과 동일한 값)
+
+새 연도 요율은 RATES에 PayrollRates 하나를 추가하면 계산기/도구 전체에 반영됨
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class TaxBracket:
+    """간이세액표 1구간 (min_income 이상 max_income 미만)"""
+    min_income: int
+    max_income: int
+    tax_by_dependents: tuple[int, ...]  # 공제대상 가족 수 1~11명
+
+
+@dataclass(frozen=True)
+class PayrollRates:
+    """한 해의 급여 계산 요율"""
+    year: int
+
+    # 4대보험 (근로자 부담분)
+    national_pension_rate: Decimal
+    national_pension_min: int  # 기준소득월액 하한
+    national_pension_max: int  # 기준소득월액 상한
+    health_insurance_rate: Decimal
+    long_term_care_rate: Decimal  # 건강보험료 대비
+    employment_insurance_rate: Decimal
+    employment_insurance_max: int  # 고용보험 기준임금 상한
+
+    # 세금
+    local_tax_rate: Decimal  # 지방소득세 = 소득세 × 10%
+    tax_table: tuple[TaxBracket, ...]
+
+    # 가산율 (근로기준법 제56조)
+    overtime_rate: Decimal
+    night_rate: Decimal  # 가산분만
+    holiday_rate: Decimal
+    holiday_overtime_rate: Decimal  # 휴일근로 8시간 초과분
+
+    weeks_per_month: Decimal
+    minimum_wage: int
+
+    # 결근 계산용 유급휴일
+    labor_day: date  # 근로자의 날 (5인 미만 포함 전 사업장)
+    holidays: frozenset  # 공휴일 (5인 이상 사업장)
+
+    def income_tax(self, monthly_income: int, dependents: int) -> int:
+        """간이세액표 소득세 (범위 밖 소득은 Spring과 같이 최고 구간 적용)"""
+        key = min(max(dependents, 1), 11) - 1
+        for bracket in self.tax_table:
+            if bracket.min_income <= monthly_income < bracket.max_income:
+                return bracket.tax_by_dependents[key]
+        return self.tax_table[-1].tax_by_dependents[key]
+
+
+RATES_2026 = PayrollRates(
+    year=2026,
+    national_pension_rate=Decimal("0.0475"),  # 4.75% (연금개혁)
+    national_pension_min=390_000,
+    national_pension_max=5_900_000,
+    health_insurance_rate=Decimal("0.03595"),
+    long_term_care_rate=Decimal("0.1314"),
+    employment_insurance_rate=Decimal("0.009"),
+    employment_insurance_max=13_500_000,
+    local_tax_rate=Decimal("0.1"),
+    tax_table=(
+        TaxBracket(0, 1_060_000, (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)),
+        TaxBracket(1_060_000, 1_510_000, (6_880, 4_170, 1_460, 0, 0, 0, 0, 0, 0, 0, 0)),
+        TaxBracket(1_510_000, 2_060_000, (17_490, 11_670, 5_840, 0, 0, 0, 0, 0, 0, 0, 0)),
+        TaxBracket(2_060_000, 2_560_000, (31_290, 22_920, 14_550, 6_180, 0, 0, 0, 0, 0, 0, 0)),
+        TaxBracket(2_560_000, 3_060_000, (49_090, 38_170, 27_250, 16_330, 5_410, 0, 0, 0, 0, 0, 0)),
+        TaxBracket(3_060_000, 3_560_000, (70_890, 57_420, 43_950, 30_480, 17_010, 3_540, 0, 0, 0, 0, 0)),
+        TaxBracket(3_560_000, 4_060_000, (96_690, 80_670, 64_650, 48_630, 32_610, 16_590, 570, 0, 0, 0, 0)),
+        TaxBracket(4_060_000, 4_560_000, (126_490, 107_920, 89_350, 70_780, 52_210, 33_640, 15_070, 0, 0, 0, 0)),
+        TaxBracket(4_560_000, 5_060_000, (160_290, 139_170, 118_050, 96_930, 75_810, 54_690, 33_570, 12_450, 0, 0, 0)),
+        TaxBracket(5_060_000, 6_060_000, (204_090, 179_420, 154_750, 130_080, 105_410, 80_740, 56_070, 31_400, 6_730, 0, 0)),
+        TaxBracket(6_060_000, 7_060_000, (273_890, 244_670, 215_450, 186_230, 157_010, 127_790, 98_570, 69_350, 40_130, 10_910, 0)),
+        TaxBracket(7_060_000, 8_060_000, (353_690, 319_920, 286_150, 252_380, 218_610, 184_840, 151_070, 117_300, 83_530, 49_760, 15_990)),
+        TaxBracket(8_060_000, 9_060_000, (443_490, 405_170, 366_850, 328_530, 290_210, 251_890, 213_570, 175_250, 136_930, 98_610, 60_290)),
+        TaxBracket(9_060_000, 10_000_000, (543_290, 500_420, 457_550, 414_680, 371_810, 328_940, 286_070, 243_200, 200_330, 157_460, 114_590)),
+        TaxBracket(10_000_000, 100_000_000, (643_090, 595_670, 548_250, 500_830, 453_410, 405_990, 358_570, 311_150, 263_730, 216_310, 168_890)),
+    ),
+    overtime_rate=Decimal("1.5"),
+    night_rate=Decimal("0.5"),
+    holiday_rate=Decimal("1.5"),
+    holiday_overtime_rate=Decimal("2.0"),
+    weeks_per_month=Decimal("4.345"),
+    minimum_wage=10_320,
+    labor_day=date(2026, 5, 1),
+    holidays=frozenset({
+        date(2026, 1, 1),  # 신정
+        date(2026, 2, 16), date(2026, 2, 17), date(2026, 2, 18),  # 설날 연휴
+        date(2026, 3, 1),  # 삼일절
+        date(2026, 5, 5),  # 어린이날
+        date(2026, 5, 24),  # 석가탄신일
+        date(2026, 6, 6),  # 현충일
+        date(2026, 8, 15),  # 광복절
+        date(2026, 9, 24), date(2026, 9, 25), date(2026, 9, 26),  # 추석 연휴
+        date(2026, 10, 3),  # 개천절
+        date(2026, 10, 9),  # 한글날
+        date(2026, 12, 25),  # 성탄절
+    }),
+)
+
+# 연도 → 요율 (해당 연도가 없으면 그 이전 가장 최근 연도 요율 사용)
+RATES: dict[int, PayrollRates] = {
+    2026: RATES_2026,
+}
+
+
+def get_rates(year: Optional[int] = None) -> PayrollRates:
+    """연도별 요율 조회 (None이면 최신)"""
+    if year is None or year in RATES:
+        return RATES[year if year is not None else max(RATES)]
+    earlier = [y for y in RATES if y <= year]
+    return RATES[max(earlier) if earlier else min(RATES)]
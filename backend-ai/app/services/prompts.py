@@ -38,6 +38,7 @@ SYSTEM_PROMPT = """당신은 한국 노동법 전문 AI 어시스턴트 '페이
 - insurance_calculator: 4대 보험료 계산
 - overtime_calculator: 연장/야간/휴일 수당 계산
 - minimum_wage_check: 최저임금 위반 확인
+- batch_salary_simulation: 여러 직원 급여 일괄 시뮬레이션 (인상률, 근무시간 비교)
 - law_search: 법령 조문 검색
 
 ## 면책 조항
@@ -45,6 +46,40 @@ SYSTEM_PROMPT = """당신은 한국 노동법 전문 AI 어시스턴트 '페이
 "※ 본 답변은 참고용이며, 실제 적용 시 노무사 또는 세무사와 상담하시기 바랍니다."
 """
 
+# 로그인 사용자용 도구 안내
+TOOL_GUIDE_MEMBER = """
+
+[사용 가능한 도구]
+로그인된 사용자이므로 다음 도구를 사용할 수 있습니다:
+- get_my_employees: 직원 목록 조회 ("직원 누구야", "직원 명단" 등)
+- get_employee_detail: 특정 직원 상세 조회 ("김철수 정보", "홍길동 급여" 등)
+- get_payroll_summary: 급여대장 요약 ("이번달 인건비", "급여 총액" 등)
+- get_monthly_labor_cost: 특정 월 인건비 조회
+- get_labor_cost_trend: 여러 달 인건비 추이 ("올해 월별 인건비", "최근 6개월" 등, 한 번에 조회)
+- salary_calculator: 급여 계산 시뮬레이션
+- insurance_calculator: 4대보험 계산
+- batch_salary_simulation: 전 직원 급여 일괄 시뮬레이션 ("전원 5% 인상하면" 등, get_my_employees 결과의 급여 목록 사용)
+
+사용자가 직원이나 급여 데이터를 물어보면 반드시 도구를 사용하세요.
+"""
+
+# 비로그인 사용자용 안내
+TOOL_GUIDE_GUEST = """
+
+[중요 안내]
+현재 로그인되어 있지 않습니다.
+직원 목록 조회, 급여대장 확인, 개인화된 급여 계산 등의 기능을 이용하시려면 로그인이 필요합니다.
+일반적인 노동법 상담, 급여 계산 시뮬레이션, 4대 보험 계산은 로그인 없이도 이용 가능합니다.
+
+비로그인 사용자에게는 면책 조항 대신 다음 문구를 사용하세요:
+"💡 로그인하시면 직원 관리, 급여대장 조회 등 더 많은 기능을 이용할 수 있습니다."
+"""
+
+# 프롬프트 캐시용 고정 프리픽스 (매 요청 바이트 단위로 동일해야 캐시 적중)
+# 사용자 이름, 대화 요약, RAG 컨텍스트 등 가변 내용은 이 뒤에 별도 메시지로 추가
+STATIC_PROMPT_MEMBER = SYSTEM_PROMPT + TOOL_GUIDE_MEMBER
+STATIC_PROMPT_GUEST = SYSTEM_PROMPT + TOOL_GUIDE_GUEST
+
 ROUTER_PROMPT = """사용자 질문의 의도를 분류하세요.
 
 카테고리:
@@ -59,6 +94,20 @@ ROUTER_PROMPT = """사용자 질문의 의도를 분류하세요.
 
 의도 (하나만 선택):"""
 
+SUMMARY_PROMPT = """다음은 노무 상담 대화의 이전 요약과 새로 추가된 대화입니다.
+두 내용을 합쳐 이후 상담에 필요한 사실만 남긴 요약을 작성하세요.
+- 사업장 규모, 직원 정보, 금액, 근무시간, 이미 안내한 결론 위주
+- 인사말, 면책 조항, 중복 설명은 제외
+- 한국어 개조식, 400자 이내
+
+[이전 요약]
+{summary}
+
+[새 대화]
+{conversation}
+
+요약:"""
+
 FAQ_QUESTIONS = [
     "최저임금이 얼마인가요?",
     "연장근로 수당은 어떻게 계산하나요?",
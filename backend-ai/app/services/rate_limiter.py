@@ -1,90 +1,246 @@
 """
 Rate Limiter 서비스
-사용자별 요청 제한 관리
+사용자별 요청 제한 관리 (슬라이딩 윈도우 카운터, 사용자당 O(1) 시간/메모리)
+
+여러 워커가 같은 한도를 공유하도록 RateLimitBackend(Postgres 원자적 upsert)를 붙일 수 있음
+공유 모드에서는 요청마다 저장소에 가지 않고, 한도 안에서 미리 확보한 허용량(allowance)을 로컬에서 차감
 """
 
+import asyncio
+import logging
+import math
 import time
-from collections import defaultdict
-from dataclasses import dataclass, field
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Optional
 
+from sqlalchemy import text
+
 from app.core.config import get_settings
+from app.db.database import engine
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
+WINDOW_SECONDS = 3600  # 1시간
+
+# pro 한도를 적용할 Spring 요금제 (유료 플랜, 나머지는 free 한도)
+PRO_SUBSCRIPTION_TIERS = frozenset({"BASIC", "PRO", "ENTERPRISE"})
+
+
+def rate_limit_tier(subscription_tier: Optional[str]) -> str:
+    """Spring 요금제(SubscriptionTier) → Rate Limit 등급 ("free" or "pro")"""
+    return "pro" if (subscription_tier or "").upper() in PRO_SUBSCRIPTION_TIERS else "free"
+
 
-@dataclass
 class UserRateLimit:
-    """사용자별 Rate Limit 상태"""
-    requests: list = field(default_factory=list)
-    tier: str = "free"  # "free" or "pro"
+    """
+    사용자별 Rate Limit 상태 (슬라이딩 윈도우 카운터)
+
+    현재 고정 윈도우 요청 수 + 직전 윈도우 요청 수 × (직전 윈도우가 슬라이딩 윈도우와 겹치는 비율)
+    요청 타임스탬프를 보관하지 않으므로 요청 수와 무관하게 상수 크기
+    """
+    __slots__ = ("window_start", "current", "previous", "tier", "last_seen", "allowance")
+
+    def __init__(self, tier: str = "free", now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        self.window_start = now - now % WINDOW_SECONDS
+        self.current = 0
+        self.previous = 0
+        self.tier = tier  # "free" or "pro"
+        self.last_seen = now
+        self.allowance = 0  # 공유 모드: 저장소에 이미 기록된, 아직 쓰지 않은 요청 수
 
     def get_limit(self) -> int:
         if self.tier == "pro":
             return settings.pro_tier_requests_per_hour
         return settings.free_tier_requests_per_hour
 
-    def can_request(self) -> tuple[bool, int]:
+    def _advance(self, now: float):
+        """현재 시각 기준으로 윈도우 이동"""
+        elapsed_windows = int((now - self.window_start) // WINDOW_SECONDS)
+        if elapsed_windows <= 0:
+            return
+        self.previous = self.current if elapsed_windows == 1 else 0
+        self.current = 0
+        self.window_start += elapsed_windows * WINDOW_SECONDS
+
+    def count(self, now: float) -> float:
+        """최근 1시간 요청 수 추정치"""
+        self._advance(now)
+        overlap = 1 - (now - self.window_start) / WINDOW_SECONDS
+        return self.previous * overlap + self.current
+
+    def can_request(self, now: Optional[float] = None) -> tuple[bool, int]:
         """
         요청 가능 여부 및 남은 요청 수 반환
 
         Returns:
             (can_request, remaining_requests)
         """
-        now = time.time()
-        hour_ago = now - 3600
+        now = time.monotonic() if now is None else now
+        remaining = self.get_limit() - math.ceil(self.count(now))
+        return remaining > 0, max(0, remaining)
 
-        # 1시간 이내 요청만 유지
-        self.requests = [t for t in self.requests if t > hour_ago]
+    def record_request(self, now: Optional[float] = None):
+        """요청 기록"""
+        now = time.monotonic() if now is None else now
+        self._advance(now)
+        self.current += 1
+        self.last_seen = now
 
-        limit = self.get_limit()
-        remaining = limit - len(self.requests)
+    def reset_seconds(self, now: Optional[float] = None) -> int:
+        """다음 요청이 허용될 때까지 남은 시간 (초, 추정 요청 수가 limit - 1 이하가 되는 시점)"""
+        now = time.monotonic() if now is None else now
+        if self.can_request(now)[0]:
+            return 0
 
-        return remaining > 0, max(0, remaining)
+        target = self.get_limit() - 1
+        elapsed = now - self.window_start
+        if self.current <= target and self.previous > 0:
+            # 현재 윈도우 안에서 직전 윈도우 가중치가 줄어들며 풀리는 경우
+            wait = WINDOW_SECONDS * (1 - (target - self.current) / self.previous) - elapsed
+        else:
+            # 다음 윈도우로 넘어간 뒤 현재 윈도우 요청이 직전 윈도우로 밀려나며 풀리는 경우
+            wait = (WINDOW_SECONDS - elapsed) + WINDOW_SECONDS * max(0.0, 1 - target / self.current)
+        return max(0, math.ceil(wait))
 
-    def record_request(self):
-        """요청 기록"""
-        self.requests.append(time.time())
 
+class RateLimitBackend(ABC):
+    """워커 간 공유 카운터 인터페이스 (윈도우 시작 시각은 epoch 기준으로 모든 워커가 동일)"""
 
-class RateLimiter:
-    """전역 Rate Limiter"""
+    @abstractmethod
+    async def incr(self, key: str, window_start: int, amount: int) -> tuple[int, int]:
+        """
+        현재 윈도우 카운터를 amount만큼 원자적으로 증가 (음수면 반환)
+
+        Returns:
+            (현재 윈도우 카운트, 직전 윈도우 카운트)
+        """
+
+    @abstractmethod
+    async def purge(self, before_window: int) -> int:
+        """지난 윈도우 카운터 삭제"""
+
+
+class LocalRateLimitBackend(RateLimitBackend):
+    """프로세스 내 공유 카운터 (테스트/단일 워커용)"""
 
     def __init__(self):
-        self.users: dict[str, UserRateLimit] = defaultdict(UserRateLimit)
+        self._counts: dict[tuple[str, int], int] = {}
+
+    async def incr(self, key: str, window_start: int, amount: int) -> tuple[int, int]:
+        current = self._counts.get((key, window_start), 0) + amount
+        self._counts[(key, window_start)] = current
+        return current, self._counts.get((key, window_start - WINDOW_SECONDS), 0)
+
+    async def purge(self, before_window: int) -> int:
+        stale = [k for k in self._counts if k[1] < before_window]
+        for k in stale:
+            del self._counts[k]
+        return len(stale)
 
-    def check_limit(self, user_id: str, tier: str = "free") -> tuple[bool, int, int]:
+
+class PostgresRateLimitBackend(RateLimitBackend):
+    """Postgres 공유 카운터 (rate_limit_counters, migration 004)"""
+
+    INCR_SQL = text("""
+        WITH cur AS (
+            INSERT INTO rate_limit_counters (user_key, window_start, count)
+            VALUES (:key, :window_start, :amount)
+            ON CONFLICT (user_key, window_start) DO UPDATE
+                SET count = rate_limit_counters.count + EXCLUDED.count
+            RETURNING count
+        )
+        SELECT
+            (SELECT count FROM cur) AS current,
+            COALESCE((
+                SELECT count FROM rate_limit_counters
+                WHERE user_key = :key AND window_start = :previous_window
+            ), 0) AS previous
+    """)
+    PURGE_SQL = text("DELETE FROM rate_limit_counters WHERE window_start < :before_window")
+
+    async def incr(self, key: str, window_start: int, amount: int) -> tuple[int, int]:
+        params = {
+            "key": key,
+            "window_start": window_start,
+            "previous_window": window_start - WINDOW_SECONDS,
+            "amount": amount,
+        }
+        async with engine.begin() as conn:
+            row = (await conn.execute(self.INCR_SQL, params)).one()
+        return row.current, row.previous
+
+    async def purge(self, before_window: int) -> int:
+        async with engine.begin() as conn:
+            result = await conn.execute(self.PURGE_SQL, {"before_window": before_window})
+            return result.rowcount
+
+
+class RateLimiter:
+    """전역 Rate Limiter (유휴 사용자는 주기적으로 제거)"""
+
+    def __init__(
+        self,
+        idle_seconds: float = 2 * WINDOW_SECONDS,
+        evict_interval: float = 60.0,
+        backend: Optional[RateLimitBackend] = None,
+    ):
+        # 최근 사용 순서 유지 → 유휴 사용자가 항상 앞쪽에 모임
+        self.users: OrderedDict[str, UserRateLimit] = OrderedDict()
+        self.idle_seconds = idle_seconds
+        self.evict_interval = evict_interval
+        self.backend = backend
+        # 공유 모드는 워커 간 같은 윈도우 경계가 필요하므로 epoch 시각 사용
+        self._clock = time.time if backend is not None else time.monotonic
+        self._next_evict = self._clock() + evict_interval
+        self.evictions = 0
+        self._tasks: set[asyncio.Task] = set()
+        self._purged_window = 0
+        self.shared_stats = {"local_hits": 0, "local_denials": 0, "reservations": 0, "returned": 0, "errors": 0}
+
+    def _get_user(self, user_id: str, tier: Optional[str], now: float) -> UserRateLimit:
+        if now >= self._next_evict:
+            self.evict_idle(now)
+
+        user_limit = self.users.get(user_id)
+        if user_limit is None:
+            user_limit = self.users[user_id] = UserRateLimit(tier or "free", now)
+        else:
+            self.users.move_to_end(user_id)
+            if tier is not None:
+                user_limit.tier = tier
+        user_limit.last_seen = now
+        return user_limit
+
+    def check_limit(self, user_id: str, tier: Optional[str] = "free") -> tuple[bool, int, int]:
         """
         Rate limit 체크
 
         Args:
             user_id: 사용자 ID
-            tier: 요금제 ("free" or "pro")
+            tier: 요금제 ("free" or "pro", None이면 마지막으로 확인된 요금제 유지)
 
         Returns:
             (allowed, remaining, reset_seconds)
         """
-        user_limit = self.users[user_id]
-        user_limit.tier = tier
-
-        can_request, remaining = user_limit.can_request()
-
-        # Reset time 계산 (가장 오래된 요청 + 1시간)
-        reset_seconds = 0
-        if not can_request and user_limit.requests:
-            oldest = min(user_limit.requests)
-            reset_seconds = int(oldest + 3600 - time.time())
-
+        now = self._clock()
+        user_limit = self._get_user(user_id, tier, now)
+        can_request, remaining = user_limit.can_request(now)
+        reset_seconds = 0 if can_request else user_limit.reset_seconds(now)
         return can_request, remaining, reset_seconds
 
     def record_request(self, user_id: str):
         """요청 기록"""
-        self.users[user_id].record_request()
+        now = self._clock()
+        self._get_user(user_id, None, now).record_request(now)
 
     def get_usage(self, user_id: str) -> dict:
         """사용량 조회"""
-        user_limit = self.users[user_id]
-        _, remaining = user_limit.can_request()
+        now = self._clock()
+        user_limit = self._get_user(user_id, None, now)
+        _, remaining = user_limit.can_request(now)
         limit = user_limit.get_limit()
 
         return {
@@ -95,6 +251,124 @@ class RateLimiter:
             "remaining": remaining,
         }
 
+    async def acquire(self, user_id: str, tier: Optional[str] = None) -> tuple[bool, int, int]:
+        """
+        한도 체크 + 요청 기록 (공유 백엔드가 있으면 모든 워커 합산 기준)
+
+        Args:
+            user_id: 사용자 키
+            tier: 요금제 ("free" or "pro", None이면 마지막으로 확인된 요금제 유지, 처음 보는 사용자는 free)
+
+        Returns:
+            (allowed, remaining, reset_seconds)
+        """
+        if self.backend is None:
+            return self._acquire_local(user_id, tier)
+
+        now = self._clock()
+        user_limit = self._get_user(user_id, tier, now)
+        window_start = int(now - now % WINDOW_SECONDS)
+        if user_limit.window_start != window_start:
+            self._return_allowance(user_id, user_limit)
+            user_limit._advance(now)
+
+        if user_limit.allowance > 0:
+            user_limit.allowance -= 1
+            self.shared_stats["local_hits"] += 1
+            _, remaining = user_limit.can_request(now)
+            return True, remaining, 0
+
+        # 마지막으로 본 공유 카운트로도 한도 초과면 저장소 조회 없이 거절
+        # (다른 워커는 카운트를 늘리기만 하므로 실제 값은 이보다 크거나 같음)
+        can_request, remaining = user_limit.can_request(now)
+        if not can_request:
+            self.shared_stats["local_denials"] += 1
+            return False, 0, user_limit.reset_seconds(now)
+
+        # 남은 한도에 비례해 몇 건을 한 번에 확보 (한도 근처에서는 1건씩)
+        reserve = max(1, min(settings.rate_limit_local_allowance, remaining // 4))
+        try:
+            current, previous = await self.backend.incr(user_id, window_start, reserve)
+        except Exception as e:
+            self.shared_stats["errors"] += 1
+            logger.warning(f"Rate limit backend unavailable, using worker-local limit: {e}")
+            return self._acquire_local(user_id, tier)
+        self.shared_stats["reservations"] += 1
+        self._schedule_purge(window_start)
+
+        # 확보한 건 중 한도 안에 들어가는 건만 사용, 나머지는 반환
+        overlap = 1 - (now - window_start) / WINDOW_SECONDS
+        before = previous * overlap + current - reserve
+        granted = max(0, min(reserve, math.floor(user_limit.get_limit() - before)))
+        if granted < reserve:
+            self._spawn(self._return(user_id, window_start, reserve - granted))
+            current -= reserve - granted
+
+        user_limit.window_start = window_start
+        user_limit.current = current
+        user_limit.previous = previous
+        if granted == 0:
+            _, remaining = user_limit.can_request(now)
+            return False, remaining, user_limit.reset_seconds(now)
+
+        user_limit.allowance = granted - 1
+        _, remaining = user_limit.can_request(now)
+        return True, remaining, 0
+
+    def _acquire_local(self, user_id: str, tier: Optional[str]) -> tuple[bool, int, int]:
+        """워커 로컬 기준 체크 + 기록 (백엔드 미설정/장애 시)"""
+        allowed, remaining, reset_seconds = self.check_limit(user_id, tier)
+        if allowed:
+            self.record_request(user_id)
+        return allowed, max(0, remaining - 1) if allowed else 0, reset_seconds
+
+    def _return_allowance(self, user_id: str, user_limit: UserRateLimit):
+        """지난 윈도우에서 쓰지 않은 허용량 반환"""
+        if user_limit.allowance > 0:
+            self._spawn(self._return(user_id, int(user_limit.window_start), user_limit.allowance))
+            user_limit.allowance = 0
+
+    async def _return(self, user_id: str, window_start: int, amount: int):
+        try:
+            await self.backend.incr(user_id, window_start, -amount)
+            self.shared_stats["returned"] += amount
+        except Exception as e:
+            logger.warning(f"Rate limit allowance return failed ({amount}): {e}")
+
+    def _schedule_purge(self, window_start: int):
+        """윈도우가 바뀌면 워커당 한 번 지난 카운터 정리"""
+        if self._purged_window != window_start:
+            self._purged_window = window_start
+            self._spawn(self.backend.purge(window_start - WINDOW_SECONDS))
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """
+        유휴 사용자 제거 (2개 윈도우 이상 요청이 없으면 카운트가 0이므로 상태가 필요 없음)
+        앞쪽부터 유휴가 아닌 사용자를 만날 때까지만 확인
+        """
+        now = self._clock() if now is None else now
+        removed = 0
+        while self.users:
+            user_id, user_limit = next(iter(self.users.items()))
+            if now - user_limit.last_seen < self.idle_seconds:
+                break
+            del self.users[user_id]
+            removed += 1
+        self.evictions += removed
+        self._next_evict = now + self.evict_interval
+        return removed
+
+    def get_stats(self) -> dict:
+        stats = {"users": len(self.users), "evictions": self.evictions}
+        if self.backend is not None:
+            stats.update(self.shared_stats, backend=type(self.backend).__name__)
+        return stats
+
 
 # 싱글톤 인스턴스
 _rate_limiter: Optional[RateLimiter] = None
@@ -103,5 +377,12 @@ _rate_limiter: Optional[RateLimiter] = None
 def get_rate_limiter() -> RateLimiter:
     global _rate_limiter
     if _rate_limiter is None:
-        _rate_limiter = RateLimiter()
+        backend: Optional[RateLimitBackend] = None
+        if settings.rate_limit_backend == "postgres":
+            backend = PostgresRateLimitBackend()
+        elif settings.rate_limit_backend == "local":
+            backend = LocalRateLimitBackend()
+        elif settings.rate_limit_backend:
+            logger.warning(f"Unknown RATE_LIMIT_BACKEND '{settings.rate_limit_backend}', using worker-local limits")
+        _rate_limiter = RateLimiter(backend=backend)
     return _rate_limiter
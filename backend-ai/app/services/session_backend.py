@@ -0,0 +1,418 @@
+"""
+공유 세션 상태 백엔드
+여러 워커/레플리카가 같은 대화 상태(최근 히스토리, 요약, 사용자 정보)를 보도록 외부 저장소에 보관
+각 워커는 SessionStore를 로컬 캐시로 쓰고, 다른 워커의 갱신 알림이 없는 세션은 메모리에서 바로 처리
+세션은 (사용자, session_id) 단위로 저장 → 다른 사용자의 session_id로는 조회되지 않음
+
+- PostgresSessionBackend: chat_session_state 테이블 (버전 기반 낙관적 동시성 제어, LISTEN/NOTIFY 갱신 알림)
+- LocalSessionBackend: 같은 인터페이스의 프로세스 내 구현 (테스트/단일 워커 개발용)
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.db.database import engine
+from app.services.session_store import SessionMessage, UserSession, get_session_store, session_key
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+ChangeCallback = Callable[[uuid.UUID, str, int], None]  # (user_id, session_id, 새 버전)
+
+
+@dataclass
+class SessionSnapshot:
+    """저장소에 기록되는 세션 상태"""
+    version: int = 0
+    user_name: str = ""
+    user_email: str = ""
+    summary: str = ""
+    messages: list = field(default_factory=list)  # [[role, content, created_at], ...]
+
+    @classmethod
+    def from_session(cls, session: UserSession) -> "SessionSnapshot":
+        return cls(
+            version=session.version,
+            user_name=session.user_name,
+            user_email=session.user_email,
+            summary=session.summary,
+            messages=[[m.role, m.content, m.created_at] for m in session.messages],
+        )
+
+    def apply_to(self, session: UserSession):
+        """저장소 상태를 로컬 세션 객체에 반영 (객체는 유지, 내용만 교체)"""
+        session.version = self.version
+        session.user_name = self.user_name or session.user_name
+        session.user_email = self.user_email or session.user_email
+        session.summary = self.summary
+        session.messages[:] = [SessionMessage(role, content, created_at) for role, content, created_at in self.messages]
+
+
+class SessionBackend(ABC):
+    """세션 상태 저장소 인터페이스 (행은 (user_id, session_id)로 구분 → 소유자만 조회 가능)"""
+
+    @abstractmethod
+    async def version(self, user_id: uuid.UUID, key: str) -> Optional[int]:
+        """현재 버전 (없으면 None)"""
+
+    @abstractmethod
+    async def load(self, user_id: uuid.UUID, key: str) -> Optional[SessionSnapshot]:
+        """저장된 상태 (없으면 None)"""
+
+    @abstractmethod
+    async def save(self, user_id: uuid.UUID, key: str, snapshot: SessionSnapshot) -> Optional[int]:
+        """
+        snapshot.version과 저장소 버전이 같을 때만 기록 (기록 후 변경 알림)
+
+        Returns:
+            새 버전 또는 None (다른 워커가 먼저 갱신 → 충돌)
+        """
+
+    async def listen(self, on_change: ChangeCallback, on_ready: Callable[[], None]):
+        """
+        변경 알림 구독 (연결이 끊기면 예외, 취소될 때까지 대기)
+        알림을 지원하지 않는 저장소는 즉시 반환 → 신선도 TTL이 지나면 버전 조회로 확인
+        """
+
+    async def purge(self, idle_seconds: float) -> int:
+        """오래 사용되지 않은 세션 삭제"""
+        return 0
+
+
+class LocalSessionBackend(SessionBackend):
+    """프로세스 내 세션 백엔드 (직렬화된 사본 보관으로 공유 저장소와 같은 동작)"""
+
+    def __init__(self):
+        self._data: dict[tuple[uuid.UUID, str], tuple[int, str]] = {}
+        self._listeners: list[ChangeCallback] = []
+
+    async def version(self, user_id: uuid.UUID, key: str) -> Optional[int]:
+        entry = self._data.get((user_id, key))
+        return None if entry is None else entry[0]
+
+    async def load(self, user_id: uuid.UUID, key: str) -> Optional[SessionSnapshot]:
+        entry = self._data.get((user_id, key))
+        if entry is None:
+            return None
+        version, payload = entry
+        return SessionSnapshot(version=version, **json.loads(payload))
+
+    async def save(self, user_id: uuid.UUID, key: str, snapshot: SessionSnapshot) -> Optional[int]:
+        current = self._data.get((user_id, key), (0, ""))[0]
+        if current != snapshot.version:
+            return None
+        payload = json.dumps({
+            "user_name": snapshot.user_name,
+            "user_email": snapshot.user_email,
+            "summary": snapshot.summary,
+            "messages": snapshot.messages,
+        }, ensure_ascii=False)
+        self._data[(user_id, key)] = (current + 1, payload)
+        for on_change in list(self._listeners):
+            on_change(user_id, key, current + 1)
+        return current + 1
+
+    async def listen(self, on_change: ChangeCallback, on_ready: Callable[[], None]):
+        self._listeners.append(on_change)
+        try:
+            on_ready()
+            await asyncio.Event().wait()
+        finally:
+            self._listeners.remove(on_change)
+
+
+class PostgresSessionBackend(SessionBackend):
+    """Postgres 세션 백엔드 (chat_session_state, migration 003/005)"""
+
+    CHANNEL = "chat_session_state"
+    VERSION_SQL = text("SELECT version FROM chat_session_state WHERE user_id = :user_id AND session_key = :key")
+    LOAD_SQL = text("""
+        SELECT version, user_name, user_email, summary, messages
+        FROM chat_session_state WHERE user_id = :user_id AND session_key = :key
+    """)
+    SAVE_SQL = text("""
+        INSERT INTO chat_session_state (user_id, session_key, version, user_name, user_email, summary, messages, updated_at)
+        VALUES (:user_id, :key, 1, :user_name, :user_email, :summary, CAST(:messages AS jsonb), now())
+        ON CONFLICT (user_id, session_key) DO UPDATE SET
+            version = chat_session_state.version + 1,
+            user_name = EXCLUDED.user_name,
+            user_email = EXCLUDED.user_email,
+            summary = EXCLUDED.summary,
+            messages = EXCLUDED.messages,
+            updated_at = now()
+        WHERE chat_session_state.version = :expected
+        RETURNING version
+    """)
+    NOTIFY_SQL = text("SELECT pg_notify(:channel, :payload)")
+    PURGE_SQL = text("""
+        DELETE FROM chat_session_state
+        WHERE updated_at < now() - make_interval(secs => :idle_seconds)
+    """)
+
+    async def version(self, user_id: uuid.UUID, key: str) -> Optional[int]:
+        async with engine.connect() as conn:
+            result = await conn.execute(self.VERSION_SQL, {"user_id": user_id, "key": key})
+            return result.scalar_one_or_none()
+
+    async def load(self, user_id: uuid.UUID, key: str) -> Optional[SessionSnapshot]:
+        async with engine.connect() as conn:
+            row = (await conn.execute(self.LOAD_SQL, {"user_id": user_id, "key": key})).first()
+        if row is None:
+            return None
+        messages = row.messages if isinstance(row.messages, list) else json.loads(row.messages)
+        return SessionSnapshot(
+            version=row.version,
+            user_name=row.user_name or "",
+            user_email=row.user_email or "",
+            summary=row.summary or "",
+            messages=messages,
+        )
+
+    async def save(self, user_id: uuid.UUID, key: str, snapshot: SessionSnapshot) -> Optional[int]:
+        params = {
+            "user_id": user_id,
+            "key": key,
+            "expected": snapshot.version,
+            "user_name": snapshot.user_name,
+            "user_email": snapshot.user_email,
+            "summary": snapshot.summary,
+            "messages": json.dumps(snapshot.messages, ensure_ascii=False),
+        }
+        async with engine.begin() as conn:
+            version = (await conn.execute(self.SAVE_SQL, params)).scalar_one_or_none()
+            if version is not None:
+                # 커밋 시점에 다른 워커로 전달
+                payload = json.dumps({"user_id": str(user_id), "key": key, "version": version})
+                await conn.execute(self.NOTIFY_SQL, {"channel": self.CHANNEL, "payload": payload})
+            return version
+
+    async def listen(self, on_change: ChangeCallback, on_ready: Callable[[], None]):
+        """LISTEN 전용 커넥션 1개를 풀에서 점유 (끊기면 ConnectionError)"""
+        def handle(_conn, _pid, _channel, payload: str):
+            try:
+                data = json.loads(payload)
+                on_change(uuid.UUID(data["user_id"]), data["key"], int(data["version"]))
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Invalid session notification: {e}")
+
+        async with engine.connect() as conn:
+            raw = (await conn.get_raw_connection()).driver_connection  # asyncpg.Connection
+            closed = asyncio.Event()
+            raw.add_termination_listener(lambda _conn: closed.set())
+            await raw.add_listener(self.CHANNEL, handle)
+            try:
+                on_ready()
+                await closed.wait()
+                raise ConnectionError("session notification connection closed")
+            finally:
+                if not raw.is_closed():
+                    await raw.remove_listener(self.CHANNEL, handle)
+
+    async def purge(self, idle_seconds: float) -> int:
+        async with engine.begin() as conn:
+            result = await conn.execute(self.PURGE_SQL, {"idle_seconds": idle_seconds})
+            return result.rowcount
+
+
+class SessionSync:
+    """
+    로컬 세션 캐시 ↔ 공유 백엔드 동기화
+
+    - refresh: 변경 알림을 받는 중이면 알림이 없는 세션은 메모리에서 바로 사용 (DB 조회 없음)
+      알림 연결이 없으면 session_sync_fresh_seconds 동안만 로컬 사본을 신뢰하고 이후 버전만 조회
+    - persist: 응답 후 백그라운드 저장, 충돌 시 최신 상태에 이번 턴을 다시 얹어 재시도
+    """
+
+    def __init__(self, backend: SessionBackend):
+        self.backend = backend
+        self._locks: dict[tuple[uuid.UUID, str], asyncio.Lock] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._purge_task: Optional[asyncio.Task] = None
+        self._listen_task: Optional[asyncio.Task] = None
+        self._listening_since: Optional[float] = None  # 알림 구독 시작 시각 (끊기면 None)
+        self.stats = {
+            "local_hits": 0, "version_checks": 0, "reloads": 0, "saves": 0,
+            "conflicts": 0, "notifications": 0, "errors": 0,
+        }
+
+    def _is_fresh(self, session: UserSession, now: float) -> bool:
+        if session.stale:
+            return False
+        # 구독 시작 이후 확인한 사본은 알림이 없는 한 최신 (구독 전 확인분은 그 사이 알림을 놓쳤을 수 있음)
+        if self._listening_since is not None and session.synced_at >= self._listening_since:
+            return True
+        return now - session.synced_at < settings.session_sync_fresh_seconds
+
+    async def refresh(self, user_id: uuid.UUID, key: str, session: UserSession) -> UserSession:
+        """캐시된 세션이 최신인지 확인하고, 다른 워커가 갱신했으면 다시 로드"""
+        now = time.monotonic()
+        if self._is_fresh(session, now):
+            self.stats["local_hits"] += 1
+            return session
+
+        session.stale = False  # 확인 중 도착한 알림은 다시 표시됨
+        self.stats["version_checks"] += 1
+        try:
+            latest = await self.backend.version(user_id, key)
+            if latest is None or latest == session.version:
+                session.synced_at = now
+                return session
+            snapshot = await self.backend.load(user_id, key)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Session version check failed, using local copy: {e}")
+            return session
+        if snapshot is not None:
+            snapshot.apply_to(session)
+            session.synced_at = now
+            self.stats["reloads"] += 1
+        return session
+
+    async def load(self, user_id: uuid.UUID, key: str) -> Optional[UserSession]:
+        """로컬 캐시에 없을 때 저장소에서 로드"""
+        now = time.monotonic()
+        try:
+            snapshot = await self.backend.load(user_id, key)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Session load failed: {e}")
+            return None
+        if snapshot is None:
+            return None
+        session = UserSession()
+        snapshot.apply_to(session)
+        session.synced_at = now
+        self.stats["reloads"] += 1
+        return session
+
+    def persist(
+        self, user_id: uuid.UUID, key: str, session: UserSession, new_messages: list[SessionMessage], max_messages: int
+    ):
+        """이번 턴 저장 예약 (응답 경로를 막지 않음)"""
+        task = asyncio.create_task(self._persist(user_id, key, session, list(new_messages), max_messages))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _persist(
+        self, user_id: uuid.UUID, key: str, session: UserSession, new_messages: list[SessionMessage], max_messages: int
+    ):
+        lock_key = (user_id, key)
+        lock = self._locks.setdefault(lock_key, asyncio.Lock())
+        try:
+            async with lock:
+                for _ in range(3):
+                    started = time.monotonic()
+                    version = await self.backend.save(user_id, key, SessionSnapshot.from_session(session))
+                    if version is not None:
+                        session.version = version
+                        session.synced_at = started
+                        self.stats["saves"] += 1
+                        return
+
+                    # 다른 워커가 먼저 기록 → 최신 상태에 이번 턴만 다시 추가
+                    self.stats["conflicts"] += 1
+                    snapshot = await self.backend.load(user_id, key)
+                    if snapshot is None:
+                        session.version = 0
+                        continue
+                    snapshot.apply_to(session)
+                    session.messages.extend(new_messages)
+                    if len(session.messages) > max_messages:
+                        del session.messages[:-max_messages]
+                logger.warning(f"Session save gave up after repeated conflicts: {key}")
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Session save failed: {e}")
+        finally:
+            if not lock.locked() and self._locks.get(lock_key) is lock:
+                self._locks.pop(lock_key, None)
+
+    def _on_change(self, user_id: uuid.UUID, key: str, version: int):
+        """다른 워커의 저장 알림 → 이 워커의 사본이 더 오래됐으면 다음 조회 때 다시 확인"""
+        self.stats["notifications"] += 1
+        session = get_session_store().peek(session_key(key, user_id))
+        if session is not None and version > session.version:
+            session.stale = True
+
+    def _on_listening(self):
+        self._listening_since = time.monotonic()
+        logger.info("Session change notifications active")
+
+    def start(self):
+        if self._purge_task is None:
+            self._purge_task = asyncio.create_task(self._run_purge())
+        if self._listen_task is None:
+            self._listen_task = asyncio.create_task(self._run_listener())
+
+    async def stop(self):
+        """정리/구독 작업 종료 후 진행 중인 저장 완료 대기"""
+        for task in (self._purge_task, self._listen_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._purge_task = self._listen_task = None
+        self._listening_since = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run_listener(self):
+        """변경 알림 구독 유지 (끊기면 TTL 확인으로 돌아가고 5초 후 재연결)"""
+        while True:
+            try:
+                await self.backend.listen(self._on_change, self._on_listening)
+                self._listening_since = None
+                return  # 알림 미지원 저장소
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._listening_since = None
+                logger.warning(f"Session notifications unavailable, falling back to version checks: {e}")
+            await asyncio.sleep(5)
+
+    async def _run_purge(self):
+        while True:
+            await asyncio.sleep(3600)
+            try:
+                removed = await self.backend.purge(settings.session_state_ttl)
+                if removed:
+                    logger.info(f"Session state purged: {removed}")
+            except Exception as e:
+                logger.warning(f"Session state purge failed: {e}")
+
+    def get_stats(self) -> dict:
+        return {
+            **self.stats,
+            "backend": type(self.backend).__name__,
+            "notifications_active": self._listening_since is not None,
+            "pending_saves": len(self._tasks),
+        }
+
+
+# 싱글톤 인스턴스 (SESSION_BACKEND 미설정 시 None → 워커 메모리만 사용)
+_session_sync: Optional[SessionSync] = None
+_session_sync_ready = False
+
+
+def get_session_sync() -> Optional[SessionSync]:
+    global _session_sync, _session_sync_ready
+    if not _session_sync_ready:
+        _session_sync_ready = True
+        if settings.session_backend == "postgres":
+            _session_sync = SessionSync(PostgresSessionBackend())
+        elif settings.session_backend == "local":
+            _session_sync = SessionSync(LocalSessionBackend())
+        elif settings.session_backend:
+            logger.warning(f"Unknown SESSION_BACKEND '{settings.session_backend}', using worker memory only")
+    return _session_sync
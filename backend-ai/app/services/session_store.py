@@ -0,0 +1,177 @@
+"""
+대화 세션 저장소
+LRU + 유휴 TTL 기반 인메모리 저장소 (최대 세션 수 상한, 오래 쓰지 않은 세션 자동 제거)
+"""
+
+import sys
+import time
+import uuid
+from collections import OrderedDict
+from typing import Iterator, Optional, Union
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class SessionMessage:
+    """대화 메시지 1건 (__slots__로 인스턴스 dict 없이 저장)"""
+    __slots__ = ("role", "content", "created_at")
+
+    def __init__(self, role: str, content: str, created_at: Optional[float] = None):
+        self.role = role
+        self.content = content
+        self.created_at = time.time() if created_at is None else created_at
+
+    def __iter__(self) -> Iterator[str]:
+        # 기존 (role, content) 튜플 언패킹 호환
+        yield self.role
+        yield self.content
+
+    def __repr__(self) -> str:
+        return f"SessionMessage({self.role!r}, {self.content[:20]!r})"
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self) + sys.getsizeof(self.content)
+
+
+class UserSession:
+    """사용자 세션 정보"""
+    __slots__ = ("user_name", "user_email", "messages", "summary", "version", "synced_at", "stale")
+
+    def __init__(self, user_name: str = "", user_email: str = ""):
+        self.user_name = user_name
+        self.user_email = user_email
+        self.messages: list[SessionMessage] = []
+        self.summary = ""  # 요약으로 접힌 이전 대화
+        self.version = 0  # 공유 세션 백엔드의 버전 (services/session_backend.py)
+        self.synced_at = 0.0  # 공유 백엔드와 마지막으로 일치를 확인한 시각 (monotonic)
+        self.stale = False  # 다른 워커의 갱신 알림 수신
+
+    def add_exchange(self, user_message: str, assistant_message: str, max_messages: int):
+        """사용자/응답 한 턴 추가 후 최근 max_messages개만 유지"""
+        self.messages.append(SessionMessage("user", user_message))
+        self.messages.append(SessionMessage("assistant", assistant_message))
+        if len(self.messages) > max_messages:
+            del self.messages[:-max_messages]
+
+    def nbytes(self) -> int:
+        """세션이 점유한 대략적인 메모리 (바이트)"""
+        size = sys.getsizeof(self) + sys.getsizeof(self.messages)
+        size += sys.getsizeof(self.user_name) + sys.getsizeof(self.user_email) + sys.getsizeof(self.summary)
+        return size + sum(m.nbytes() for m in self.messages)
+
+
+def session_key(session_id: Optional[str], owner: Union[uuid.UUID, str, None]) -> str:
+    """
+    저장소 키 (소유자별로 분리 → 다른 사용자의 session_id를 보내도 그 대화에 접근 불가)
+    로그인: "{user_id}:{session_id}", 인증 안 된 토큰: "token:{지문}:{session_id}", 비로그인: "guest:{session_id}"
+    """
+    owner = "guest" if owner is None else str(owner)
+    return f"{owner}:{session_id or 'default'}"
+
+
+class SessionStore:
+    """
+    LRU + 유휴 TTL 세션 저장소
+
+    - 접근할 때마다 만료 시각이 연장되고 LRU 맨 뒤로 이동
+    - 최대 세션 수 초과 시 가장 오래 사용되지 않은 세션 제거
+    - 모든 세션이 같은 TTL을 쓰므로 만료 세션은 항상 앞쪽에 모여 있음 → 앞에서부터만 정리
+    """
+
+    def __init__(self, maxsize: int = 10000, idle_ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.idle_ttl = idle_ttl
+        self._data: OrderedDict[str, tuple[float, UserSession]] = OrderedDict()
+        self.created = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[UserSession]:
+        """세션 조회 (없거나 만료되면 None, 조회 시 만료 연장)"""
+        now = time.monotonic()
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, session = entry
+        if expires_at <= now:
+            del self._data[key]
+            self.expirations += 1
+            return None
+        self._data[key] = (now + self.idle_ttl, session)
+        self._data.move_to_end(key)
+        return session
+
+    def get_or_create(self, key: str) -> UserSession:
+        """세션 조회, 없으면 새로 생성"""
+        session = self.get(key)
+        if session is not None:
+            return session
+
+        return self.put(key, UserSession())
+
+    def put(self, key: str, session: UserSession) -> UserSession:
+        """세션 저장 (DB에서 로드한 세션 등록용)"""
+        self.purge_expired()
+        self._data[key] = (time.monotonic() + self.idle_ttl, session)
+        self._data.move_to_end(key)
+        self.created += 1
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+        return session
+
+    def peek(self, key: str) -> Optional[UserSession]:
+        """만료/LRU 순서를 바꾸지 않고 조회 (변경 알림 처리용)"""
+        entry = self._data.get(key)
+        return None if entry is None else entry[1]
+
+    def pop(self, key: str) -> Optional[UserSession]:
+        entry = self._data.pop(key, None)
+        return None if entry is None else entry[1]
+
+    def purge_expired(self) -> int:
+        """만료된 세션 정리 (앞쪽부터 만료되지 않은 세션을 만날 때까지)"""
+        now = time.monotonic()
+        removed = 0
+        while self._data:
+            key, (expires_at, _) = next(iter(self._data.items()))
+            if expires_at > now:
+                break
+            del self._data[key]
+            removed += 1
+        self.expirations += removed
+        return removed
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def get_stats(self) -> dict:
+        self.purge_expired()
+        sessions = [session for _, session in self._data.values()]
+        return {
+            "live_sessions": len(sessions),
+            "max_sessions": self.maxsize,
+            "idle_ttl": self.idle_ttl,
+            "created": self.created,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "messages": sum(len(s.messages) for s in sessions),
+            "bytes": sum(s.nbytes() for s in sessions),
+        }
+
+
+# 싱글톤 인스턴스
+_session_store: Optional[SessionStore] = None
+
+
+def get_session_store() -> SessionStore:
+    global _session_store
+    if _session_store is None:
+        _session_store = SessionStore(settings.session_max_sessions, settings.session_idle_ttl)
+    return _session_store
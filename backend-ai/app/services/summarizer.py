@@ -0,0 +1,134 @@
+"""
+대화 요약 서비스
+오래된 대화 턴을 누적 요약으로 접어 턴당 프롬프트 크기를 일정하게 유지
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+from langchain_core.messages import HumanMessage
+
+from app.services.llm import get_tiered_llm
+from app.services.prompts import SUMMARY_PROMPT
+
+logger = logging.getLogger(__name__)
+
+KEEP_RECENT = 4  # 원문으로 유지할 최근 메시지 수 (2턴)
+FOLD_TRIGGER = 8  # 원문 메시지가 이 수를 넘으면 요약 실행
+
+_encoding = None
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (tiktoken 사용 불가 시 문자 수 기반 근사)"""
+    global _encoding
+    if _encoding is None:
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            _encoding = False
+    if _encoding:
+        return len(_encoding.encode(text))
+    return len(text) // 2
+
+
+@dataclass
+class SummaryStats:
+    """요약 통계 (토큰 절감량 보고용)"""
+    folds: int = 0
+    failures: int = 0
+    folded_messages: int = 0
+    folded_tokens: int = 0  # 요약으로 대체된 원문 토큰 합계
+    summary_tokens: int = 0  # 요약 증가분 토큰 합계
+
+    @property
+    def saved_tokens_per_turn(self) -> int:
+        """요약 이후 매 턴 프롬프트에서 줄어든 토큰 수 (누적)"""
+        return self.folded_tokens - self.summary_tokens
+
+
+class ConversationSummarizer:
+    """세션 히스토리 누적 요약기 (응답 스트리밍 후 백그라운드 실행)"""
+
+    def __init__(self):
+        self.stats = SummaryStats()
+        self._tasks: set[asyncio.Task] = set()
+        self._running: set[int] = set()  # 요약 중인 세션 (id 기준)
+
+    def needs_fold(self, session) -> bool:
+        return len(session.messages) > FOLD_TRIGGER and id(session) not in self._running
+
+    def schedule(self, session):
+        """요약이 필요하면 백그라운드 작업 등록 (응답 경로를 막지 않음)"""
+        if not self.needs_fold(session):
+            return
+        self._running.add(id(session))
+        task = asyncio.create_task(self.fold(session))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def fold(self, session):
+        """가장 오래된 메시지를 요약에 합치고 히스토리에서 제거"""
+        try:
+            count = len(session.messages) - KEEP_RECENT
+            if count <= 0:
+                return
+            folded = session.messages[:count]
+
+            conversation = "\n".join(
+                f"{'사용자' if role == 'user' else '상담봇'}: {content}" for role, content in folded
+            )
+            prompt = SUMMARY_PROMPT.format(summary=session.summary or "(없음)", conversation=conversation)
+
+            response = await get_tiered_llm().ainvoke(
+                [HumanMessage(content=prompt)], cheapest_first=True
+            )
+            new_summary = (response.content or "").strip()
+            if not new_summary:
+                return
+
+            # 요약 중 히스토리가 잘려나갔으면 적용하지 않음
+            if session.messages[:count] != folded:
+                logger.info("Summary discarded: history changed during fold")
+                return
+
+            folded_tokens = estimate_tokens(conversation)
+            summary_delta = estimate_tokens(new_summary) - estimate_tokens(session.summary)
+
+            session.summary = new_summary
+            del session.messages[:count]
+
+            self.stats.folds += 1
+            self.stats.folded_messages += count
+            self.stats.folded_tokens += folded_tokens
+            self.stats.summary_tokens += summary_delta
+            logger.info(
+                f"Summary fold: {count} messages (~{folded_tokens} tokens) -> "
+                f"summary delta ~{summary_delta} tokens, saved ~{folded_tokens - summary_delta}/turn"
+            )
+        except Exception as e:
+            self.stats.failures += 1
+            logger.warning(f"Summary fold failed: {e}")
+        finally:
+            self._running.discard(id(session))
+
+    def get_stats(self) -> dict:
+        return {
+            **asdict(self.stats),
+            "saved_tokens_per_turn": self.stats.saved_tokens_per_turn,
+            "in_flight": len(self._tasks),
+        }
+
+
+# 싱글톤 인스턴스
+_summarizer: Optional[ConversationSummarizer] = None
+
+
+def get_summarizer() -> ConversationSummarizer:
+    global _summarizer
+    if _summarizer is None:
+        _summarizer = ConversationSummarizer()
+    return _summarizer
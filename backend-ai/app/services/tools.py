@@ -3,17 +3,33 @@ LangGraph Agent Tools
 급여계산, 법령검색, DB조회 도구
 """
 
+import asyncio
 import logging
+import re
+from contextvars import ContextVar
 from typing import Optional
-import httpx
 from langchain_core.tools import tool
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
+from app.core.http import get_spring_client
+from app.core.security import token_fingerprint
+from app.services import payroll, payroll_batch
+from app.services.payroll_rates import get_rates
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+def _split_weekly_hours(weekly_hours: int) -> tuple[int, int]:
+    """주 소정근로시간 → (주 소정근로일수, 1일 소정근로시간), 주 5일을 우선하고 나누어떨어지는 일수 선택"""
+    for days in (5, 6, 4, 3, 7, 2, 1):
+        if weekly_hours % days == 0 and 1 <= weekly_hours // days <= 24:
+            return days, weekly_hours // days
+    days = 5 if weekly_hours >= 5 else 1
+    return days, max(1, min(24, round(weekly_hours / days)))
+
+
 @tool
 async def salary_calculator(
     base_salary: int,
@@ -21,6 +37,9 @@ async def salary_calculator(
     company_size: str = "OVER_5",
     dependents_count: int = 1,
     weekly_hours: int = 40,
+    overtime_hours: float = 0,
+    night_hours: float = 0,
+    holiday_hours: float = 0,
 ) -> dict:
     """
     급여 계산 실행.
@@ -32,54 +51,58 @@ async def salary_calculator(
         company_size: 사업장 규모 (UNDER_5, OVER_5)
         dependents_count: 부양가족 수 (본인 포함)
         weekly_hours: 주 소정근로시간 (기본 40시간)
+        overtime_hours: 월 연장근로 시간
+        night_hours: 월 야간근로 시간 (22:00~06:00)
+        holiday_hours: 월 휴일근로 시간
 
     Returns:
         급여 계산 결과 (실수령액, 공제 내역, 수당 내역)
     """
+    # Spring과 같은 계산 엔진을 프로세스 안에서 실행 (네트워크 왕복 없음)
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(
-                f"{settings.spring_api_url}/api/v1/salary/calculate",
-                json={
-                    "employee": {
-                        "name": "시뮬레이션",
-                        "dependentsCount": dependents_count,
-                        "employmentType": employment_type,
-                        "companySize": company_size,
-                        "weeklyScheduledHours": weekly_hours,
-                    },
-                    "baseSalary": base_salary,
-                    "wageType": "MONTHLY",
-                },
-            )
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return {"error": f"API 오류: {response.status_code}"}
+        days, daily_hours = _split_weekly_hours(weekly_hours)
+        employee = payroll.Employee(
+            dependents_count=dependents_count,
+            employment_type=employment_type,
+            company_size=company_size,
+            scheduled_work_days=days,
+            daily_work_hours=daily_hours,
+        )
+        extra = (overtime_hours, night_hours, holiday_hours)
+        result = payroll.calculate_salary(
+            employee,
+            base_salary=base_salary,
+            wage_type="MONTHLY",
+            extra_hours=extra if any(extra) else None,
+        )
+        return payroll.salary_response(result)
     except Exception as e:
         logger.error(f"Salary calculator error: {e}")
         return {"error": str(e)}
 
 
 @tool
-async def minimum_wage_check(hourly_rate: int) -> dict:
+async def minimum_wage_check(hourly_rate: int, year: Optional[int] = None) -> dict:
     """
     최저임금 위반 여부 확인.
 
     Args:
         hourly_rate: 시간당 임금
+        year: 기준 연도 (없으면 최신 연도)
 
     Returns:
         최저임금 준수 여부 및 차액
     """
-    MIN_WAGE_2026 = 10_320  # 2026년 최저시급
+    rates = get_rates(year)
+    minimum_wage = rates.minimum_wage
 
-    is_compliant = hourly_rate >= MIN_WAGE_2026
-    difference = hourly_rate - MIN_WAGE_2026
+    is_compliant = hourly_rate >= minimum_wage
+    difference = hourly_rate - minimum_wage
 
-    return {
+    result = {
         "hourly_rate": hourly_rate,
-        "minimum_wage": MIN_WAGE_2026,
+        "year": rates.year,
+        "minimum_wage": minimum_wage,
         "is_compliant": is_compliant,
         "difference": difference,
         "message": (
@@ -88,6 +111,9 @@ async def minimum_wage_check(hourly_rate: int) -> dict:
             else f"⚠️ 최저임금 위반! {abs(difference):,}원 부족 (노동청 신고 대상)"
         ),
     }
+    if year is not None and rates.year != year:
+        result["note"] = f"{year}년 최저임금 정보가 없어 {rates.year}년 기준으로 비교했습니다."
+    return result
 
 
 @tool
@@ -142,21 +168,13 @@ async def insurance_calculator(monthly_salary: int) -> dict:
     Returns:
         4대 보험료 내역 (근로자 부담분)
     """
-    # 2026년 요율
-    NATIONAL_PENSION_RATE = 0.0475  # 4.75% (연금개혁)
-    HEALTH_INSURANCE_RATE = 0.03595  # 3.595%
-    LONG_TERM_CARE_RATE = 0.1314  # 장기요양 = 건강보험 × 13.14%
-    EMPLOYMENT_INSURANCE_RATE = 0.009  # 0.9%
-
-    # 국민연금 상하한
-    pension_base = min(max(monthly_salary, 390_000), 5_900_000)
-    national_pension = int(pension_base * NATIONAL_PENSION_RATE)
-
-    health_insurance = int(monthly_salary * HEALTH_INSURANCE_RATE)
-    long_term_care = int(health_insurance * LONG_TERM_CARE_RATE)
-    employment_insurance = int(monthly_salary * EMPLOYMENT_INSURANCE_RATE)
-
-    total = national_pension + health_insurance + long_term_care + employment_insurance
+    # 요율/상하한/원 단위 반올림은 급여 계산 엔진과 동일
+    result = payroll.calculate_insurance(monthly_salary)
+    national_pension = result.national_pension
+    health_insurance = result.health_insurance
+    long_term_care = result.long_term_care
+    employment_insurance = result.employment_insurance
+    total = result.total
 
     return {
         "monthly_salary": monthly_salary,
@@ -169,6 +187,74 @@ async def insurance_calculator(monthly_salary: int) -> dict:
     }
 
 
+@tool
+async def batch_salary_simulation(
+    base_salaries: list[int],
+    weekly_hours: Optional[list[int]] = None,
+    dependents: Optional[list[int]] = None,
+    children_under_20: Optional[list[int]] = None,
+    overtime_hours: Optional[list[float]] = None,
+    night_hours: Optional[list[float]] = None,
+    holiday_hours: Optional[list[float]] = None,
+    company_size: str = "OVER_5",
+    raise_percent: float = 0,
+) -> dict:
+    """
+    여러 직원 급여 일괄 시뮬레이션.
+    "전 직원 5% 인상", "주 40시간 vs 52시간 비교"처럼 여러 명의 실수령액/4대보험/세금/인건비를 한 번에 계산합니다.
+
+    Args:
+        base_salaries: 직원별 기본급 (월급) 목록
+        weekly_hours: 직원별 주 소정근로시간 목록 (생략 시 전원 40시간)
+        dependents: 직원별 부양가족 수 목록 (본인 포함, 생략 시 전원 1명)
+        children_under_20: 직원별 20세 이하 자녀 수 목록 (생략 시 전원 0명)
+        overtime_hours: 직원별 월 연장근로 시간 목록 (주 52시간 = 월 연장 약 52.14시간)
+        night_hours: 직원별 월 야간근로 시간 목록
+        holiday_hours: 직원별 월 휴일근로 시간 목록
+        company_size: 사업장 규모 (UNDER_5, OVER_5)
+        raise_percent: 기본급 인상률 (%, 예: 5)
+
+    Returns:
+        총 인건비/실수령액/공제 합계와 직원별 결과 (인상률 지정 시 인상 전 대비 증감 포함)
+    """
+    try:
+        if not base_salaries:
+            return {"error": "기본급 목록이 비어 있습니다."}
+        if len(base_salaries) > settings.payroll_batch_max_employees:
+            return {"error": f"한 번에 최대 {settings.payroll_batch_max_employees:,}명까지 계산할 수 있습니다."}
+
+        def run(percent: float) -> payroll_batch.BatchResult:
+            return payroll_batch.simulate_batch(
+                base_salaries, weekly_hours, dependents, children_under_20,
+                overtime_hours=overtime_hours, night_hours=night_hours, holiday_hours=holiday_hours,
+                company_size=company_size, raise_percent=percent,
+            )
+
+        result = run(raise_percent)
+        totals = result.totals()
+        response = {
+            "employee_count": len(result),
+            "totals": totals,
+            "employees": result.rows(settings.payroll_batch_tool_rows),
+            "answer": (
+                f"직원 {len(result):,}명 총 지급액 {totals['total_gross']:,}원, "
+                f"공제 {totals['total_deductions']:,}원, 실수령액 {totals['net_pay']:,}원"
+            ),
+        }
+        if len(result) > settings.payroll_batch_tool_rows:
+            response["note"] = f"직원별 결과는 앞 {settings.payroll_batch_tool_rows}명만 표시 (합계는 전체 기준)"
+        if raise_percent:
+            before = run(0).totals()
+            response["change"] = {
+                key: totals[key] - before[key] for key in ("total_gross", "total_deductions", "net_pay")
+            }
+            response["answer"] += f" (인상 전 대비 총 지급액 {response['change']['total_gross']:+,}원)"
+        return response
+    except Exception as e:
+        logger.error(f"Batch salary simulation error: {e}")
+        return {"error": str(e)}
+
+
 @tool
 async def law_search(query: str, law_name: Optional[str] = None) -> dict:
     """
@@ -236,39 +322,75 @@ async def law_search(query: str, law_name: Optional[str] = None) -> dict:
 
 # ==================== 사용자 데이터 조회 도구 ====================
 
-# 전역 토큰 컨텍스트 (런타임에 주입)
-_current_user_token: Optional[str] = None
+# 요청별 토큰 컨텍스트 (런타임에 주입, 동시 요청 간 격리)
+_current_user_token: ContextVar[Optional[str]] = ContextVar("current_user_token", default=None)
+
+# Spring 조회 결과 캐시: (토큰 지문, endpoint) → 응답
+# 한 대화에서 여러 직원/기간을 물어봐도 목록은 TTL 동안 한 번만 조회
+CACHEABLE_PREFIXES = ("/api/v1/employees", "/api/v1/payroll/periods")
+_spring_cache = TTLCache(maxsize=2048, ttl=settings.spring_cache_ttl)
 
 
 def set_user_token(token: Optional[str]):
     """사용자 토큰 설정 (Tool 호출 전 주입)"""
-    global _current_user_token
-    _current_user_token = token
+    _current_user_token.set(token)
 
 
 def get_user_token() -> Optional[str]:
     """현재 사용자 토큰 조회"""
-    return _current_user_token
+    return _current_user_token.get()
+
+
+def invalidate_spring_cache(token: Optional[str] = None, endpoint_prefix: str = "") -> int:
+    """
+    Spring 조회 캐시 무효화
+
+    Args:
+        token: 해당 사용자 캐시만 삭제 (None이면 전체 사용자)
+        endpoint_prefix: 해당 경로로 시작하는 항목만 삭제 (빈 값이면 전체 경로)
+
+    Returns:
+        삭제된 항목 수
+    """
+    fingerprint = token_fingerprint(token) if token else None
+    removed = _spring_cache.invalidate(
+        lambda key: (fingerprint is None or key[0] == fingerprint) and key[1].startswith(endpoint_prefix)
+    )
+    logger.info(f"Spring cache invalidated: {removed} entries")
+    return removed
+
+
+def get_spring_cache_stats() -> dict:
+    return _spring_cache.get_stats()
 
 
 async def _call_spring_api(endpoint: str, token: Optional[str] = None) -> dict:
-    """Spring API 호출 헬퍼"""
-    auth_token = token or _current_user_token
+    """Spring API 호출 헬퍼 (목록/급여대장 조회는 TTL 캐시)"""
+    auth_token = token or _current_user_token.get()
     if not auth_token:
         return {"error": "로그인이 필요합니다. 먼저 로그인해주세요."}
 
+    cache_key = None
+    if endpoint.startswith(CACHEABLE_PREFIXES):
+        cache_key = (token_fingerprint(auth_token), endpoint)
+        cached = _spring_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                f"{settings.spring_api_url}{endpoint}",
-                headers={"Authorization": f"Bearer {auth_token}"},
-            )
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 401:
-                return {"error": "인증 만료. 다시 로그인해주세요."}
-            else:
-                return {"error": f"API 오류: {response.status_code}"}
+        response = await get_spring_client().get(
+            endpoint,
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        if response.status_code == 200:
+            data = response.json()
+            if cache_key is not None:
+                _spring_cache.set(cache_key, data)
+            return data
+        elif response.status_code == 401:
+            return {"error": "인증 만료. 다시 로그인해주세요."}
+        else:
+            return {"error": f"API 오류: {response.status_code}"}
     except Exception as e:
         logger.error(f"Spring API error: {e}")
         return {"error": str(e)}
@@ -495,12 +617,165 @@ async def get_monthly_labor_cost(year: int, month: int) -> dict:
     }
 
 
+def _parse_year_month(value: Optional[str]) -> Optional[tuple[int, int]]:
+    """"2026-03", "2026.3", "202603" → (2026, 3)"""
+    if not value:
+        return None
+    digits = [p for p in re.split(r"\D+", value.strip()) if p]
+    if len(digits) == 1 and len(digits[0]) == 6:
+        digits = [digits[0][:4], digits[0][4:]]
+    if len(digits) < 2 or not 1 <= int(digits[1]) <= 12:
+        raise ValueError(f"기간 형식 오류: {value} (예: 2026-03)")
+    return int(digits[0]), int(digits[1])
+
+
+_TREND_EMPLOYEE_ROWS = 20  # 추이 응답의 직원별 합계 행 수 (총지급액 상위)
+
+
+@tool
+async def get_labor_cost_trend(start: Optional[str] = None, end: Optional[str] = None) -> dict:
+    """
+    기간별 인건비 추이 조회.
+    여러 달의 급여대장을 한 번에 조회하여 월별 총지급액/공제/실지급액과 직원별 합계를 반환합니다.
+    "올해 월별 인건비 추이", "최근 6개월 인건비", "1분기 급여 합계" 등의 질문에 사용하세요.
+
+    Args:
+        start: 시작 월 (예: "2026-01"). 없으면 종료 월 기준 최근 12개월
+        end: 종료 월 (예: "2026-12"). 없으면 최신 급여대장
+
+    Returns:
+        월별 인건비 표, 기간 합계, 직원별 합계 (총지급액 상위 20명)
+    """
+    try:
+        start_key, end_key = _parse_year_month(start), _parse_year_month(end)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    periods = await _call_spring_api("/api/v1/payroll/periods")
+    if "error" in periods:
+        return periods
+    period_list = periods if isinstance(periods, list) else periods.get("periods", [])
+    if not period_list:
+        return {"message": "등록된 급여대장이 없습니다. 먼저 급여대장을 작성해주세요."}
+
+    # 연/월이 없거나 잘못된 기간은 비교할 수 없으므로 제외
+    by_month = {
+        (p["year"], p["month"]): p
+        for p in period_list
+        if isinstance(p.get("year"), int) and isinstance(p.get("month"), int) and 1 <= p["month"] <= 12
+    }
+    if not by_month:
+        return {"message": "연/월이 지정된 급여대장이 없습니다."}
+    end_key = end_key or max(by_month)
+    if start_key is None:
+        index = end_key[0] * 12 + end_key[1] - 12  # 종료 월 포함 12개월
+        start_key = (index // 12, index % 12 + 1)
+    targets = sorted(key for key in by_month if start_key <= key <= end_key)
+    label = f"{start_key[0]}-{start_key[1]:02d} ~ {end_key[0]}-{end_key[1]:02d}"
+    if not targets:
+        return {"message": f"{label} 기간의 급여대장이 없습니다."}
+
+    # 기간별 급여대장 동시 조회 (Spring 부하 제한)
+    semaphore = asyncio.Semaphore(settings.spring_fanout_concurrency)
+
+    async def fetch(key: tuple[int, int]) -> dict:
+        async with semaphore:
+            return await _call_spring_api(f"/api/v1/payroll/periods/{by_month[key]['id']}")
+
+    ledgers = await asyncio.gather(*(fetch(key) for key in targets))
+
+    # 월별/직원별 집계 (엔트리 1회 순회)
+    months = []
+    employees: dict[str, dict] = {}
+    failed = []
+    for (year, month), ledger in zip(targets, ledgers):
+        if "error" in ledger:
+            failed.append(f"{year}-{month:02d}")
+            continue
+        gross = net = deductions = 0
+        entries = ledger.get("entries", [])
+        for e in entries:
+            e_gross = e.get("totalGross") or 0
+            e_net = e.get("netPay") or 0
+            e_deductions = e.get("totalDeductions")
+            e_deductions = e_gross - e_net if e_deductions is None else e_deductions
+            gross += e_gross
+            net += e_net
+            deductions += e_deductions
+
+            key = e.get("employeeId") or e.get("employeeName") or "?"
+            row = employees.get(key)
+            if row is None:
+                row = employees[key] = {
+                    "name": e.get("employeeName") or "이름없음", "months": 0,
+                    "total_gross": 0, "total_deductions": 0, "total_net_pay": 0,
+                }
+            row["months"] += 1
+            row["total_gross"] += e_gross
+            row["total_deductions"] += e_deductions
+            row["total_net_pay"] += e_net
+        months.append({
+            "period": f"{year}-{month:02d}",
+            "employee_count": len(entries),
+            "total_gross": gross,
+            "total_deductions": deductions,
+            "total_net_pay": net,
+        })
+
+    if not months:
+        return {"error": f"{label} 급여대장 조회에 실패했습니다. 잠시 후 다시 시도해주세요."}
+
+    total_gross = sum(m["total_gross"] for m in months)
+    total_deductions = sum(m["total_deductions"] for m in months)
+    total_net = sum(m["total_net_pay"] for m in months)
+
+    # LLM용 요약 표 (월별 1행, 조회 실패한 달도 표시)
+    # 전월대비는 바로 이전 달 행이 있을 때만 계산 (급여대장 없음/조회 실패로 빠진 달 건너 비교하지 않음)
+    lines = ["월 | 직원 | 총지급액 | 공제 | 실지급액 | 전월대비"]
+    rows = iter(months)
+    previous = None  # (월 인덱스, 총지급액)
+    for (year, month), ledger in zip(targets, ledgers):
+        index = year * 12 + month
+        if "error" in ledger:
+            lines.append(f"{year}-{month:02d} | 조회 실패 | - | - | - | -")
+            previous = None
+            continue
+        m = next(rows)
+        change = "-" if previous is None or previous[0] != index - 1 else f"{m['total_gross'] - previous[1]:+,}"
+        lines.append(
+            f"{m['period']} | {m['employee_count']} | {m['total_gross']:,} | "
+            f"{m['total_deductions']:,} | {m['total_net_pay']:,} | {change}"
+        )
+        previous = (index, m["total_gross"])
+
+    result = {
+        "range": label,
+        "month_count": len(months),
+        "months": months,
+        "table": "\n".join(lines),
+        "total_gross": total_gross,
+        "total_deductions": total_deductions,
+        "total_net_pay": total_net,
+        "average_monthly_gross": total_gross // len(months),
+        "employee_count": len(employees),
+        "employees": sorted(employees.values(), key=lambda r: r["total_gross"], reverse=True)[:_TREND_EMPLOYEE_ROWS],
+        "summary": (
+            f"{label} {len(months)}개월 인건비 합계 {total_gross:,}원 "
+            f"(월평균 {total_gross // len(months):,}원, 실지급 {total_net:,}원, 공제 {total_deductions:,}원)"
+        ),
+    }
+    if failed:
+        result["failed_periods"] = failed
+    return result
+
+
 # 일반 도구 (인증 불필요)
 GENERAL_TOOLS = [
     salary_calculator,
     minimum_wage_check,
     overtime_calculator,
     insurance_calculator,
+    batch_salary_simulation,
     law_search,
 ]
 
@@ -510,7 +785,14 @@ USER_DATA_TOOLS = [
     get_employee_detail,
     get_payroll_summary,
     get_monthly_labor_cost,
+    get_labor_cost_trend,
 ]
 
 # 전체 도구 목록
 ALL_TOOLS = GENERAL_TOOLS + USER_DATA_TOOLS
+
+# 이름 → 도구 매핑 (실행 시 조회용)
+TOOL_MAP = {t.name: t for t in ALL_TOOLS}
+
+# LLM에 바인딩되는 도구 세트 (로그인 여부별)
+TOOL_SETS = [GENERAL_TOOLS, ALL_TOOLS]
@@ -0,0 +1,248 @@
+"""
+AI_CHAT 사용량 로컬 미터링 (리스 기반)
+Spring에서 로그인 토큰별로 N회분을 미리 예약(lease)해 두고 요청마다 메모리에서 차감
+네트워크 호출은 리스 갱신/정산 시에만 발생
+
+- 예약분은 Spring에서 사용량(count)이 아닌 예약(reserved)으로 집계되고, 사용한 만큼만 정산 시 사용량으로 확정
+- 예약은 월 단위: 예약 응답의 yearMonth로 정산 (월이 바뀐 뒤 반환해도 새 달에 영향 없음)
+- 남은 한도가 적은 사용자는 Spring이 예약 크기를 줄이고(무료 요금제는 1회씩), 미리 갱신하지 않음
+- 워커가 정산 없이 종료되면 Spring 쪽 예약 만료(10분)로 회수
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.core.config import get_settings
+from app.core.http import get_spring_client
+from app.core.security import token_fingerprint
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+LIMIT_MESSAGE = "이번 달 AI 상담 횟수를 모두 사용했습니다. 업그레이드해주세요."
+AUTH_MESSAGE = "인증이 만료되었습니다. 다시 로그인해주세요."
+OUTAGE_MESSAGE = "사용량 확인이 일시적으로 불가합니다. 잠시 후 다시 시도해주세요."
+
+
+@dataclass
+class UsageLease:
+    """토큰별 예약 사용량 (예약·정산은 이 토큰으로만 요청)"""
+    token: str
+    remaining: int = 0
+    used: int = 0  # 차감했지만 아직 Spring에 보고하지 않은 사용량
+    year_month: str = ""  # 예약이 속한 월 (Spring 응답 기준)
+    prefetch: bool = False  # 요청한 크기만큼 받은 경우만 잔량이 적을 때 미리 갱신
+    expires_at: float = 0.0
+    provisional: int = 0  # Spring 장애 중 임시 허용한 횟수 (다음 갱신 시 정산)
+    exhausted_until: float = 0.0  # 한도 초과 응답 이후 재조회 보류 시각
+    message: str = ""
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    renewing: Optional[asyncio.Task] = None
+
+    def is_expired(self, now: float) -> bool:
+        return now >= self.expires_at
+
+
+class UsageMeter:
+    """리스 기반 사용량 미터 (요청 경로는 메모리 차감만 수행)"""
+
+    def __init__(self):
+        self._leases: dict[str, UsageLease] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"local_hits": 0, "renewals": 0, "settlements": 0, "denied": 0, "provisional": 0}
+
+    @staticmethod
+    def _key(token: str) -> str:
+        # 서명 검증 없이 읽은 sub로 묶으면 위조 토큰이 남의 예약분을 쓸 수 있으므로 토큰 단위로 구분
+        # (예약은 Spring이 검증한 토큰으로만 받음, 재로그인한 토큰은 새 예약)
+        return token_fingerprint(token)
+
+    async def consume(self, token: str) -> tuple[bool, str]:
+        """
+        AI_CHAT 1회 차감
+
+        Returns:
+            (allowed, message)
+        """
+        key = self._key(token)
+        lease = self._leases.get(key)
+        if lease is None:
+            lease = self._leases[key] = UsageLease(token=token)
+
+        now = time.monotonic()
+        if lease.remaining <= 0 or lease.is_expired(now):
+            async with lease.lock:
+                if lease.remaining <= 0 or lease.is_expired(time.monotonic()):
+                    await self._renew(lease)
+        else:
+            self.stats["local_hits"] += 1
+
+        if lease.remaining > 0:
+            lease.remaining -= 1
+            lease.used += 1
+            # 잔량이 적으면 다음 요청이 기다리지 않도록 미리 갱신 (한도가 넉넉한 사용자만)
+            if (
+                lease.prefetch
+                and lease.remaining <= settings.usage_lease_low_watermark
+                and lease.renewing is None
+            ):
+                lease.renewing = asyncio.create_task(self._renew_in_background(lease))
+            return True, ""
+
+        # Spring 장애 시 제한된 횟수만 임시 허용 (다음 갱신에서 차감)
+        if not lease.message:
+            if lease.provisional < settings.usage_provisional_limit:
+                lease.provisional += 1
+                self.stats["provisional"] += 1
+                return True, ""
+            self.stats["denied"] += 1
+            return False, OUTAGE_MESSAGE
+
+        self.stats["denied"] += 1
+        return False, lease.message
+
+    async def _renew_in_background(self, lease: UsageLease):
+        try:
+            async with lease.lock:
+                await self._renew(lease, top_up=True)
+        finally:
+            lease.renewing = None
+
+    async def _renew(self, lease: UsageLease, top_up: bool = False):
+        """
+        Spring에서 새 블록 예약 (lease.lock 보유 상태에서 호출)
+        그동안의 사용량을 정산하고 만료된 리스의 미사용분은 반환, 임시 허용분은 새 블록에서 사용 처리
+        """
+        now = time.monotonic()
+        if now < lease.exhausted_until:
+            return
+        await self._settle(lease, release=lease.is_expired(now))
+
+        requested = settings.usage_lease_size + lease.provisional
+        try:
+            response = await get_spring_client().post(
+                "/api/v1/subscription/usage/lease",
+                params={"type": "AI_CHAT", "count": requested},
+                headers={"Authorization": f"Bearer {lease.token}"},
+                timeout=10,
+            )
+        except Exception as e:
+            logger.error(f"Usage lease failed: {e}")
+            lease.message = ""
+            return
+
+        if response.status_code == 401:
+            lease.message = AUTH_MESSAGE
+            lease.remaining = 0
+            return
+        if response.status_code != 200:
+            logger.warning(f"Usage lease API error: {response.status_code}")
+            lease.message = ""
+            return
+
+        self.stats["renewals"] += 1
+        data = response.json().get("data", {})
+        granted = int(data.get("granted", 0))
+        year_month = data.get("yearMonth", "")
+        if lease.remaining > 0 and year_month != lease.year_month:
+            # 월이 바뀜 → 지난달 예약 잔량은 지난달로 반환하고 새 달 예약만 사용
+            await self._settle(lease, release=True)
+        settled = min(granted, lease.provisional)
+        lease.provisional -= settled
+        lease.used += settled  # 장애 중 임시 허용한 요청은 새 예약에서 사용 처리
+        lease.remaining = (lease.remaining if top_up else 0) + granted - settled
+        lease.year_month = year_month
+        lease.prefetch = granted >= requested
+        lease.expires_at = now + settings.usage_lease_ttl
+        if granted == 0:
+            lease.message = data.get("message") or LIMIT_MESSAGE
+            lease.exhausted_until = now + settings.usage_exhausted_recheck
+        else:
+            lease.message = ""
+        logger.info(f"Usage lease renewed: granted={granted}, settled={settled}, remaining={lease.remaining}")
+
+    async def _settle(self, lease: UsageLease, release: bool = False):
+        """
+        사용량 보고 (+ release면 미사용 예약분 반환), lease.lock 보유 상태에서 호출
+        실패한 사용량은 다음 정산에서 다시 보고, 반환 실패분은 Spring 예약 만료로 회수
+        """
+        used = lease.used
+        count = lease.remaining if release else 0
+        if release:
+            lease.remaining = 0
+        if used == 0 and count == 0:
+            return
+        try:
+            response = await get_spring_client().post(
+                "/api/v1/subscription/usage/release",
+                params={"type": "AI_CHAT", "count": count, "used": used, "yearMonth": lease.year_month or None},
+                headers={"Authorization": f"Bearer {lease.token}"},
+                timeout=10,
+            )
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"Usage settlement failed (used={used}, release={count}): {e}")
+            return
+        lease.used -= used
+        self.stats["settlements"] += 1
+
+    async def reconcile(self):
+        """사용량 보고 + 만료된 리스의 미사용분 반환 및 정리"""
+        now = time.monotonic()
+        for key, lease in list(self._leases.items()):
+            if lease.lock.locked():
+                continue
+            expired = lease.is_expired(now)
+            if not expired and lease.used == 0:
+                continue
+            async with lease.lock:
+                await self._settle(lease, release=expired)
+            if expired and lease.provisional == 0 and lease.used == 0:
+                self._leases.pop(key, None)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """종료 시 사용량 보고 + 모든 미사용 예약분 반환"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for lease in self._leases.values():
+            lease.expires_at = 0.0
+        await self.reconcile()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(settings.usage_lease_ttl / 2)
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.warning(f"Usage reconcile failed: {e}")
+
+    def get_stats(self) -> dict:
+        return {
+            **self.stats,
+            "leases": len(self._leases),
+            "leased_remaining": sum(lease.remaining for lease in self._leases.values()),
+            "unreported_used": sum(lease.used for lease in self._leases.values()),
+        }
+
+
+# 싱글톤 인스턴스
+_usage_meter: Optional[UsageMeter] = None
+
+
+def get_usage_meter() -> UsageMeter:
+    global _usage_meter
+    if _usage_meter is None:
+        _usage_meter = UsageMeter()
+    return _usage_meter
@@ -0,0 +1,130 @@
+"""
+토큰 사용량 기록 서비스
+TieredLLM 호출별 토큰 수를 메모리 버퍼에 모아 주기적으로 token_usage 테이블에 일괄 upsert
+요청 경로에서는 DB를 기다리지 않음
+"""
+
+import asyncio
+import logging
+import uuid
+from contextvars import ContextVar
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.db.database import engine
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# 현재 요청의 사용자 (LLM 호출 시 사용량 귀속 대상)
+_usage_user: ContextVar[Optional[uuid.UUID]] = ContextVar("usage_user", default=None)
+
+UPSERT_SQL = text("""
+    INSERT INTO token_usage (user_id, date, model, input_tokens, output_tokens, request_count)
+    VALUES (:user_id, :date, :model, :input_tokens, :output_tokens, :request_count)
+    ON CONFLICT (user_id, date, model) DO UPDATE SET
+        input_tokens = token_usage.input_tokens + EXCLUDED.input_tokens,
+        output_tokens = token_usage.output_tokens + EXCLUDED.output_tokens,
+        request_count = token_usage.request_count + EXCLUDED.request_count
+""")
+
+
+def set_usage_user(user_id: Optional[uuid.UUID]):
+    """현재 요청의 사용량 귀속 사용자 설정 (verified_user_id()로 확인된 ID, 확인 안 되면 None → 기록 안 함)"""
+    _usage_user.set(user_id)
+
+
+class TokenUsageWriter:
+    """토큰 사용량 배치 기록기"""
+
+    def __init__(self, flush_interval: float = 5.0):
+        self.flush_interval = flush_interval
+        # (user_id, date, model) -> [input_tokens, output_tokens, request_count]
+        self._buffer: dict[tuple[uuid.UUID, date, str], list[int]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.flushed_rows = 0
+        self.failed_flushes = 0
+
+    def add(self, model: str, input_tokens: int, output_tokens: int):
+        """사용량 누적 (메모리만 갱신, 즉시 반환)"""
+        user_id = _usage_user.get()
+        if user_id is None:
+            return
+        key = (user_id, date.today(), model)
+        counts = self._buffer.get(key)
+        if counts is None:
+            self._buffer[key] = [input_tokens, output_tokens, 1]
+        else:
+            counts[0] += input_tokens
+            counts[1] += output_tokens
+            counts[2] += 1
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """백그라운드 작업 종료 후 남은 버퍼 flush (graceful shutdown)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self):
+        """버퍼를 비우고 한 번의 executemany로 upsert (실패 시 버퍼에 되돌림)"""
+        if not self._buffer:
+            return
+        pending, self._buffer = self._buffer, {}
+        rows = [
+            {
+                "user_id": user_id,
+                "date": day,
+                "model": model,
+                "input_tokens": counts[0],
+                "output_tokens": counts[1],
+                "request_count": counts[2],
+            }
+            for (user_id, day, model), counts in pending.items()
+        ]
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(UPSERT_SQL, rows)
+            self.flushed_rows += len(rows)
+            logger.debug(f"Token usage flushed: {len(rows)} rows")
+        except Exception as e:
+            self.failed_flushes += 1
+            logger.warning(f"Token usage flush failed ({len(rows)} rows kept): {e}")
+            for key, counts in pending.items():
+                current = self._buffer.setdefault(key, [0, 0, 0])
+                for i in range(3):
+                    current[i] += counts[i]
+
+    def get_stats(self) -> dict:
+        return {
+            "buffered_rows": len(self._buffer),
+            "flushed_rows": self.flushed_rows,
+            "failed_flushes": self.failed_flushes,
+        }
+
+
+# 싱글톤 인스턴스
+_usage_writer: Optional[TokenUsageWriter] = None
+
+
+def get_usage_writer() -> TokenUsageWriter:
+    global _usage_writer
+    if _usage_writer is None:
+        _usage_writer = TokenUsageWriter()
+    return _usage_writer
@@ -0,0 +1,110 @@
+"""
+사용자 프로필 (Spring /auth/me)
+AI 서비스는 JWT 서명 키가 없으므로 토큰의 소유자는 Spring이 인증한 응답으로만 확인
+대화 기록/세션/사용량 귀속처럼 사용자별로 나뉘는 데이터는 여기서 확인된 user_id를 키로 사용
+"""
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.http import get_spring_client
+from app.core.security import token_fingerprint, token_ttl
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class UserProfile:
+    """Spring이 인증한 사용자 정보"""
+    user_id: uuid.UUID  # Spring users.id → UUID(int=id) (AI DB user_id 컬럼 형식)
+    name: str
+    email: str
+    tier: str  # FREE/TRIAL/BASIC/PRO/ENTERPRISE
+
+
+# 토큰 지문 → UserProfile, 토큰 만료(exp)까지만 유지 (인증 실패는 캐시하지 않음)
+_profile_cache = TTLCache(settings.profile_cache_size, settings.profile_cache_max_ttl)
+# 토큰 지문 → 마지막으로 인증된 UserProfile (Spring 장애 시에만 사용, 거부 응답이면 삭제)
+_last_verified = TTLCache(settings.profile_cache_size, settings.profile_stale_max_ttl)
+_profile_loading: dict[str, asyncio.Task] = {}  # 토큰 지문 → 진행 중인 /auth/me 조회
+
+
+async def get_user_profile(token: Optional[str]) -> Optional[UserProfile]:
+    """
+    토큰 소유자 프로필 조회 (같은 토큰이면 세션이 달라도 캐시 사용)
+    동시에 들어온 같은 토큰의 조회는 하나의 요청을 공유 (사용량 체크와 컨텍스트 준비가 함께 기다림)
+
+    Returns:
+        UserProfile 또는 None (토큰 없음/위조·만료 토큰/인증 이력 없이 Spring 조회 실패)
+    """
+    if not token:
+        return None
+    key = token_fingerprint(token)
+    cached = _profile_cache.get(key)
+    if cached is not None:
+        return cached
+
+    task = _profile_loading.get(key)
+    if task is None:
+        task = asyncio.create_task(_request_profile(token, key))
+        _profile_loading[key] = task
+        task.add_done_callback(lambda _: _profile_loading.pop(key, None))
+    return await asyncio.shield(task)
+
+
+async def _request_profile(token: str, key: str) -> Optional[UserProfile]:
+    try:
+        resp = await get_spring_client().get(
+            "/api/v1/auth/me",
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=10,
+        )
+    except Exception as e:
+        logger.warning(f"User info fetch failed, using last verified profile: {e}")
+        return _last_verified.get(key)
+
+    if resp.status_code in (401, 403):
+        _last_verified.pop(key)
+        return None
+    if resp.status_code != 200:
+        logger.warning(f"User info fetch failed ({resp.status_code}), using last verified profile")
+        return _last_verified.get(key)
+
+    try:
+        data = resp.json().get("data") or {}
+        profile = UserProfile(
+            user_id=uuid.UUID(int=int(data["id"])),
+            name=data.get("name") or "",
+            email=data.get("email") or "",
+            tier=data.get("subscriptionTier") or "FREE",
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        logger.warning(f"Unexpected /auth/me response: {e}")
+        return None
+
+    ttl = token_ttl(token, settings.profile_cache_max_ttl)
+    if ttl > 0:
+        _profile_cache.set(key, profile, ttl=ttl)
+        _last_verified.set(key, profile, ttl=token_ttl(token, settings.profile_stale_max_ttl))
+    return profile
+
+
+async def verified_user_id(token: Optional[str]) -> Optional[uuid.UUID]:
+    """Spring이 인증한 토큰 소유자 ID (확인되지 않으면 None)"""
+    profile = await get_user_profile(token)
+    return profile.user_id if profile is not None else None
+
+
+def invalidate_profile(token: str) -> bool:
+    """프로필 캐시 삭제 (이름/이메일/요금제 변경 후)"""
+    return _profile_cache.pop(token_fingerprint(token)) is not None
+
+
+def get_profile_cache_stats() -> dict:
+    return _profile_cache.get_stats()
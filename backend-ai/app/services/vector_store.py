@@ -36,7 +36,7 @@ class VectorStoreService:
         if self._client is None:
             try:
                 from openai import OpenAI
-                self._client = OpenAI(api_key=settings.openai_api_key)
+                self._client = OpenAI(api_key=settings.openai_api_key, base_url=settings.openai_base_url or None)
             except Exception as e:
                 logger.warning(f"OpenAI client init failed: {e}")
         return self._client
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+급여 일괄 시뮬레이션 벤치마크
+
+직원별 payroll.calculate_salary 반복 호출(도구를 직원마다 호출하는 방식)과
+payroll_batch.simulate_batch(NumPy 벡터 연산)의 처리량(직원/초)을 비교하고,
+두 결과가 모든 금액 항목에서 1원 단위까지 일치하는지 확인합니다.
+
+사용법:
+    cd backend-ai
+    python -m benchmarks.bench_payroll_batch
+    python -m benchmarks.bench_payroll_batch --sizes 1000 10000 100000 --scalar-limit 5000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from app.services import payroll
+from app.services.payroll_batch import simulate_batch
+from app.services.tools import _split_weekly_hours
+
+FIELDS = (
+    "base_salary", "hourly_wage", "overtime_pay", "night_pay", "holiday_pay", "weekly_holiday_pay",
+    "total_gross", "national_pension", "health_insurance", "long_term_care", "employment_insurance",
+    "income_tax", "local_income_tax", "total_deductions", "net_pay",
+)
+
+
+def _workforce(n: int, seed: int = 42) -> dict:
+    """임의 직원 데이터 (기본급 180만~1200만, 주 15~52시간, 부양가족 0~6명, 월 가산시간 일부)"""
+    rng = np.random.default_rng(seed)
+    dependents = rng.integers(0, 7, n)
+    return {
+        "base_salary": rng.integers(1_800_000, 12_000_000, n),
+        "weekly_hours": rng.choice([15, 20, 24, 30, 35, 40, 40, 40, 44, 52], n),
+        "dependents": dependents,
+        "children_under_20": rng.integers(0, dependents + 1),
+        "overtime_hours": np.where(rng.random(n) < 0.4, np.round(rng.uniform(0, 52, n), 1), 0.0),
+        "night_hours": np.where(rng.random(n) < 0.2, np.round(rng.uniform(0, 30, n), 1), 0.0),
+        "holiday_hours": np.where(rng.random(n) < 0.1, rng.integers(0, 17, n).astype(float), 0.0),
+    }
+
+
+def _scalar_row(data: dict, i: int) -> tuple:
+    days, daily = _split_weekly_hours(int(data["weekly_hours"][i]))
+    employee = payroll.Employee(
+        dependents_count=int(data["dependents"][i]),
+        children_under_20=int(data["children_under_20"][i]),
+        scheduled_work_days=days,
+        daily_work_hours=daily,
+    )
+    extra = (float(data["overtime_hours"][i]), float(data["night_hours"][i]), float(data["holiday_hours"][i]))
+    r = payroll.calculate_salary(employee, base_salary=int(data["base_salary"][i]), extra_hours=extra if any(extra) else None)
+    return (
+        r.base_salary, r.hourly_wage, r.overtime.overtime_pay, r.overtime.night_pay, r.overtime.holiday_pay,
+        r.weekly_holiday.weekly_holiday_pay, r.total_gross, r.insurance.national_pension, r.insurance.health_insurance,
+        r.insurance.long_term_care, r.insurance.employment_insurance, r.tax.income_tax, r.tax.local_income_tax,
+        r.total_deductions, r.net_pay,
+    )
+
+
+def _batch(data: dict):
+    return simulate_batch(
+        data["base_salary"], data["weekly_hours"], data["dependents"], data["children_under_20"],
+        data["overtime_hours"], data["night_hours"], data["holiday_hours"],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch payroll simulation benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000])
+    parser.add_argument("--scalar-limit", type=int, default=10_000, help="직원별 계산은 이 인원까지만 측정")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("급여 일괄 시뮬레이션 벤치마크 (직원/초, 높을수록 좋음)")
+    print("=" * 78)
+    print(f"  {'직원 수':>9}  {'직원별 계산':>14}  {'일괄 계산':>14}  {'배속':>8}  일치")
+
+    for n in args.sizes:
+        data = _workforce(n)
+        _batch(data)  # 워밍업
+
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            _batch(data)
+            timings.append(time.perf_counter() - start)
+        batch_rate = n / min(timings)
+
+        if n <= args.scalar_limit:
+            start = time.perf_counter()
+            rows = [_scalar_row(data, i) for i in range(n)]
+            scalar_rate = n / (time.perf_counter() - start)
+            result = _batch(data)
+            expected = np.array(rows, dtype=np.int64)
+            actual = np.column_stack([getattr(result, f) for f in FIELDS])
+            mismatches = int((expected != actual).any(axis=1).sum())
+            match = "OK" if mismatches == 0 else f"불일치 {mismatches}명"
+            print(f"  {n:>9,}  {scalar_rate:>14,.0f}  {batch_rate:>14,.0f}  {batch_rate / scalar_rate:>7.0f}x  {match}")
+        else:
+            print(f"  {n:>9,}  {'-':>14}  {batch_rate:>14,.0f}  {'-':>8}  -")
+
+
+if __name__ == "__main__":
+    main()
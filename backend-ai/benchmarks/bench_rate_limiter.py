@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter 벤치마크 (10만 사용자 시뮬레이션)
+
+기존 방식(요청 타임스탬프 리스트를 매 체크마다 재구성 + min())과
+슬라이딩 윈도우 카운터(RateLimiter)의 체크당 비용과 메모리를 비교합니다.
+
+사용법:
+    cd backend-ai
+    python -m benchmarks.bench_rate_limiter
+    python -m benchmarks.bench_rate_limiter --users 100000 --ops 500000 --tier pro
+
+시나리오:
+    zipf       10만 사용자, Zipf 분포 요청 (대부분 가벼운 사용자)
+    saturated  한도까지 사용한 사용자들이 계속 요청 (기존 방식의 최악 경우)
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from collections import defaultdict
+
+from app.core.config import get_settings
+from app.services.rate_limiter import RateLimiter
+
+settings = get_settings()
+
+
+class LegacyRateLimiter:
+    """변경 전 구현 (비교용): 1시간 내 요청 타임스탬프 리스트 유지"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.users: dict[str, list] = defaultdict(list)
+
+    def check_limit(self, user_id: str) -> tuple[bool, int, int]:
+        now = time.time()
+        hour_ago = now - 3600
+        requests = self.users[user_id] = [t for t in self.users[user_id] if t > hour_ago]
+        remaining = self.limit - len(requests)
+        reset_seconds = 0
+        if remaining <= 0 and requests:
+            reset_seconds = int(min(requests) + 3600 - now)
+        return remaining > 0, max(0, remaining), reset_seconds
+
+    def record_request(self, user_id: str):
+        self.users[user_id].append(time.time())
+
+
+def _workload(users: int, ops: int, seed: int = 42) -> list[str]:
+    """Zipf 분포 사용자 요청 시퀀스 (소수 사용자가 한도까지 몰리는 실제 트래픽 형태)"""
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) ** 0.8 for rank in range(users)]
+    ids = [f"user-{i}" for i in range(users)]
+    return rng.choices(ids, weights=weights, k=ops)
+
+
+def _saturated(users: int, limit: int) -> list[str]:
+    """모든 사용자가 한도의 2배만큼 번갈아 요청"""
+    ids = [f"heavy-{i}" for i in range(users)]
+    return [user_id for _ in range(limit * 2) for user_id in ids]
+
+
+def _run(limiter, sequence: list[str], check) -> tuple[float, int]:
+    allowed = 0
+    started = time.perf_counter()
+    for user_id in sequence:
+        if check(user_id)[0]:
+            limiter.record_request(user_id)
+            allowed += 1
+    return time.perf_counter() - started, allowed
+
+
+def _retained_bytes(factory, sequence: list[str], check_name: str) -> int:
+    """같은 워크로드 실행 후 limiter가 보유한 메모리 (tracemalloc은 시간 측정과 분리)"""
+    tracemalloc.start()
+    limiter = factory()
+    check = getattr(limiter, check_name)
+    for user_id in sequence:
+        if check(user_id)[0]:
+            limiter.record_request(user_id)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rate limiter benchmark")
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--ops", type=int, default=500_000)
+    parser.add_argument("--tier", choices=["free", "pro"], default="pro")
+    args = parser.parse_args()
+
+    limit = settings.pro_tier_requests_per_hour if args.tier == "pro" else settings.free_tier_requests_per_hour
+    scenarios = (
+        ("zipf", _workload(args.users, args.ops)),
+        ("saturated", _saturated(max(1, args.ops // (limit * 2)), limit)),
+    )
+
+    print("=" * 78)
+    print(f"Rate Limiter 벤치마크 (users={args.users:,}, ops={args.ops:,}, tier={args.tier}, limit={limit}/h)")
+    print("=" * 78)
+
+    for name, sequence in scenarios:
+        legacy = LegacyRateLimiter(limit)
+        legacy_time, legacy_allowed = _run(legacy, sequence, legacy.check_limit)
+        legacy_mem = _retained_bytes(lambda: LegacyRateLimiter(limit), sequence, "check_limit")
+
+        limiter = RateLimiter()
+        new_time, new_allowed = _run(limiter, sequence, lambda u: limiter.check_limit(u, args.tier))
+        new_mem = _retained_bytes(RateLimiter, sequence, "check_limit")
+
+        print(f"\n[{name}] 요청 {len(sequence):,}건, 사용자 {len(set(sequence)):,}명")
+        for label, elapsed, retained, allowed in (
+            ("기존 (타임스탬프 리스트)", legacy_time, legacy_mem, legacy_allowed),
+            ("슬라이딩 윈도우 카운터", new_time, new_mem, new_allowed),
+        ):
+            print(
+                f"  {label:<24} 체크당 {elapsed / len(sequence) * 1_000_000:7.2f}µs  "
+                f"총 {elapsed:6.2f}s  보유 메모리 {retained / 1024 / 1024:6.1f}MiB  허용 {allowed:,}"
+            )
+        print(f"  속도 {legacy_time / new_time:.1f}x, 메모리 {legacy_mem / max(new_mem, 1):.1f}x")
+
+    # 유휴 사용자 제거 비용 (zipf 시나리오 사용자 전원 유휴 처리)
+    limiter = RateLimiter()
+    _run(limiter, scenarios[0][1], lambda u: limiter.check_limit(u, args.tier))
+    started = time.perf_counter()
+    removed = limiter.evict_idle(now=time.monotonic() + limiter.idle_seconds)
+    print(f"\n유휴 사용자 제거: {removed:,}명, {(time.perf_counter() - started) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
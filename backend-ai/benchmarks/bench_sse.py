@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+SSE 송신 벤치마크 (동시 스트림 시뮬레이션)
+
+기존 방식(에이전트 이벤트 1건 = SSE 프레임 1개)과 SSEEmitter(시간/크기 기준 토큰 병합)의
+응답당 프레임 수, 전송 바이트, 스트림당 CPU 시간을 비교합니다.
+실제 EventSourceResponse를 ASGI send 콜백으로 구동하므로 프레임당 인코딩/전송 오버헤드가 포함됩니다.
+(소켓 쓰기 비용은 제외 → 실제 서버에서는 프레임 감소 효과가 더 큼)
+
+사용법:
+    cd backend-ai
+    python -m benchmarks.bench_sse
+    python -m benchmarks.bench_sse --streams 500 --tokens 400 --interval 0.005
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from sse_starlette.sse import EventSourceResponse
+
+from app.core.sse import SSEEmitter
+
+SCOPE = {"type": "http", "method": "GET", "path": "/chat/stream", "headers": []}
+
+
+async def _agent_events(tokens: int, interval: float):
+    """LLM 토큰 스트림 흉내 (토큰당 2~4자, interval 간격)"""
+    yield {"type": "tool_call", "data": {"tool": "calculate_salary_estimate", "status": "start"}}
+    yield {"type": "tool_call", "data": {"tool": "calculate_salary_estimate", "status": "end", "result": "{}"}}
+    for i in range(tokens):
+        if interval:
+            await asyncio.sleep(interval)
+        yield {"type": "token", "data": "월급" if i % 2 else " 입니다"}
+    yield {"type": "citation", "data": [{"source": "근로기준법", "article": "제56조"}]}
+    yield {"type": "done", "data": ""}
+
+
+async def _legacy(events):
+    """변경 전 event_generator (이벤트마다 프레임)"""
+    async for event in events:
+        event_type = event.get("type", "token")
+        data = event.get("data", "")
+        if event_type in ("citation", "tool_call"):
+            data = json.dumps(data, ensure_ascii=False)
+        yield {"event": event_type, "data": data}
+        if event_type in ("done", "error"):
+            break
+
+
+async def _consume(frames) -> tuple[int, int]:
+    """EventSourceResponse를 끝까지 구동하고 전송된 body 프레임 수/바이트 집계"""
+    count = 0
+    size = 0
+    disconnect = asyncio.Event()
+
+    async def receive():
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal count, size
+        if message["type"] == "http.response.body" and message.get("body"):
+            count += 1
+            size += len(message["body"])
+
+    await EventSourceResponse(frames)(SCOPE, receive, send)
+    disconnect.set()
+    return count, size
+
+
+async def _run(label: str, factory, streams: int, tokens: int, interval: float):
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    results = await asyncio.gather(*(
+        _consume(factory(_agent_events(tokens, interval))) for _ in range(streams)
+    ))
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    frames = sum(r[0] for r in results)
+    size = sum(r[1] for r in results)
+    print(
+        f"  {label:<22} 응답당 프레임 {frames / streams:7.1f}  응답당 {size / streams / 1024:6.1f}KiB  "
+        f"스트림당 CPU {cpu / streams * 1000:6.2f}ms  총 {wall:5.2f}s"
+    )
+    return frames, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SSE emitter benchmark")
+    parser.add_argument("--streams", type=int, default=200)
+    parser.add_argument("--tokens", type=int, default=300)
+    parser.add_argument("--interval", type=float, default=0.005, help="토큰 간격(초)")
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print(f"SSE 벤치마크 (streams={args.streams}, tokens={args.tokens}, interval={args.interval * 1000:.0f}ms)")
+    print("=" * 78)
+
+    legacy_frames, legacy_cpu = asyncio.run(_run("기존 (이벤트당 프레임)", _legacy, args.streams, args.tokens, args.interval))
+    new_frames, new_cpu = asyncio.run(_run(
+        "SSEEmitter (병합)", lambda events: SSEEmitter(events).stream(), args.streams, args.tokens, args.interval
+    ))
+    print(f"  프레임 {legacy_frames / max(new_frames, 1):.1f}x 감소, CPU {legacy_cpu / max(new_cpu, 1e-9):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Tool 바인딩 오버헤드 벤치마크
+
+요청마다 llm.bind_tools(tools)를 호출하던 방식과
+TieredLLM.bind_tools 캐시를 사용하는 방식의 호출당 비용을 비교합니다.
+네트워크 호출 없이 실행됩니다 (bind_tools는 스키마 변환만 수행).
+
+사용법:
+    cd backend-ai
+    python -m benchmarks.bench_tool_binding
+"""
+
+import os
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-bench")
+os.environ.setdefault("GROQ_API_KEY", "gsk-bench")
+
+from app.services.llm import TieredLLM  # noqa: E402
+from app.services.tools import ALL_TOOLS, GENERAL_TOOLS, TOOL_SETS  # noqa: E402
+
+ITERATIONS = 2000
+
+
+def _per_call_us(fn, iterations: int = ITERATIONS) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main():
+    tiered = TieredLLM()
+    name, llm = tiered.tiers[0]
+
+    print("=" * 60)
+    print(f"Tool 바인딩 벤치마크 (tier={name}, {ITERATIONS}회)")
+    print("=" * 60)
+
+    for label, tools in (("GENERAL_TOOLS", GENERAL_TOOLS), ("ALL_TOOLS", ALL_TOOLS)):
+        uncached = _per_call_us(lambda: llm.bind_tools(tools))
+        tiered.prebind_tools(TOOL_SETS)
+        cached = _per_call_us(lambda: tiered.bind_tools(name, tools))
+        print(
+            f"{label:<14} ({len(tools)} tools): "
+            f"매번 바인딩 {uncached:8.1f}µs  →  캐시 {cached:6.2f}µs  "
+            f"({uncached / cached:,.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
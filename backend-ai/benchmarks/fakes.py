@@ -0,0 +1,157 @@
+"""
+벤치마크용 가짜 프로바이더 (네트워크 없이 실행)
+
+- FakeEmbeddingClient: OpenAI embeddings.create 대체 (문자 bigram 해시 기반 결정적 벡터)
+- FakeLawClient: 법령정보센터 API 대체 (합성 노동법 조문)
+- FakeChatModel / fake_tiered_llm: LLM 티어 대체 (고정 응답, 선택적 지연)
+"""
+
+import asyncio
+import hashlib
+from types import SimpleNamespace
+from typing import Optional
+
+import numpy as np
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from app.services.law_api import LawArticle, LawSearchResult
+from app.services.llm import CircuitBreaker, HedgeBudget, LatencyTracker, TieredLLM, UsageStats
+
+EMBEDDING_DIM = 1536  # text-embedding-3-small과 같은 차원
+
+LAW_NAMES = ["근로기준법", "최저임금법", "근로자퇴직급여보장법", "국민연금법", "국민건강보험법", "고용보험법"]
+_TOPICS = [
+    ("연장근로", "사용자는 연장근로에 대하여는 통상임금의 100분의 50 이상을 가산하여 근로자에게 지급하여야 한다."),
+    ("야간근로", "사용자는 야간근로(오후 10시부터 다음 날 오전 6시 사이의 근로)에 대하여는 통상임금의 100분의 50 이상을 가산하여 지급하여야 한다."),
+    ("휴일", "사용자는 근로자에게 1주에 평균 1회 이상의 유급휴일을 보장하여야 한다."),
+    ("연차 유급휴가", "사용자는 1년간 80퍼센트 이상 출근한 근로자에게 15일의 유급휴가를 주어야 한다."),
+    ("해고의 예고", "사용자는 근로자를 해고하려면 적어도 30일 전에 예고를 하여야 한다."),
+    ("최저임금의 효력", "사용자는 최저임금의 적용을 받는 근로자에게 최저임금액 이상의 임금을 지급하여야 한다."),
+    ("퇴직금제도", "사용자는 계속근로기간 1년에 대하여 30일분 이상의 평균임금을 퇴직금으로 지급하여야 한다."),
+    ("근로조건의 명시", "사용자는 근로계약을 체결할 때에 임금, 소정근로시간, 휴일, 연차 유급휴가를 명시하여야 한다."),
+    ("임금 지급", "임금은 통화로 직접 근로자에게 그 전액을 지급하여야 한다."),
+    ("보험료", "보험료는 가입자의 보수월액에 보험료율을 곱하여 얻은 금액으로 한다."),
+]
+
+
+def make_articles(count: int, content_chars: int = 400) -> list[LawArticle]:
+    """합성 법령 조문 count개 (법령/주제 순환, 조문 번호 고유)"""
+    articles = []
+    for i in range(count):
+        title, sentence = _TOPICS[i % len(_TOPICS)]
+        content = (f"제{i + 1}조({title}) ① " + sentence + " ") * (content_chars // len(sentence) + 1)
+        articles.append(LawArticle(
+            law_name=LAW_NAMES[i % len(LAW_NAMES)],
+            article_no=f"{i + 1}조",
+            article_title=f"({title})",
+            content=content[:content_chars],
+        ))
+    return articles
+
+
+def fake_embedding(text: str, dim: int = EMBEDDING_DIM) -> list[float]:
+    """문자 bigram 해시 → 정규화 벡터 (같은 텍스트는 항상 같은 벡터, 비슷한 텍스트는 유사도 높음)"""
+    vector = np.zeros(dim, dtype=np.float64)
+    for i in range(len(text) - 1):
+        digest = hashlib.blake2b(text[i:i + 2].encode(), digest_size=4).digest()
+        vector[int.from_bytes(digest, "little") % dim] += 1.0
+    norm = np.linalg.norm(vector)
+    if norm:
+        vector /= norm
+    return vector.tolist()
+
+
+class FakeEmbeddingClient:
+    """OpenAI 클라이언트의 embeddings.create만 흉내"""
+
+    def __init__(self):
+        self.calls = 0
+        self.embeddings = SimpleNamespace(create=self._create)
+
+    def _create(self, model: str, input: str):
+        self.calls += 1
+        return SimpleNamespace(data=[SimpleNamespace(embedding=fake_embedding(input))])
+
+
+class FakeLawClient:
+    """LawAPIClient 대체 (검색/본문 조회를 메모리에서 응답)"""
+
+    def __init__(self, articles_per_law: int = 60, latency: float = 0.0):
+        self.latency = latency
+        self._laws = {
+            name: [
+                LawArticle(law_name=name, article_no=a.article_no, article_title=a.article_title, content=a.content)
+                for a in make_articles(articles_per_law)
+            ]
+            for name in LAW_NAMES
+        }
+
+    async def _wait(self):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def search_laws(self, query: str, target: str = "law", display: int = 10) -> list[LawSearchResult]:
+        await self._wait()
+        return [
+            LawSearchResult(law_id=name, law_name=name, law_type="법률", promulgation_date="20250101")
+            for name in self._laws if query in name
+        ][:display]
+
+    async def get_law_content(self, law_id: str, article_no: Optional[str] = None) -> list[LawArticle]:
+        await self._wait()
+        return list(self._laws.get(law_id, []))
+
+    async def get_labor_laws(self) -> dict[str, list[LawArticle]]:
+        await self._wait()
+        return {name: list(articles) for name, articles in self._laws.items()}
+
+    async def close(self):
+        pass
+
+
+class FakeChatModel:
+    """bind_tools/ainvoke/astream만 지원하는 가짜 채팅 모델 (tool call 없이 고정 답변)"""
+
+    def __init__(self, answer: str, latency: float = 0.0):
+        self.answer = answer
+        self.latency = latency
+        self.calls = 0
+
+    def bind_tools(self, tools: list) -> "FakeChatModel":
+        return self
+
+    async def ainvoke(self, messages, **kwargs) -> AIMessage:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return AIMessage(
+            content=self.answer,
+            usage_metadata={"input_tokens": 1200, "output_tokens": 180, "total_tokens": 1380},
+        )
+
+    async def astream(self, messages, **kwargs):
+        """고정 답변을 어절 단위 청크로 스트리밍 (지연은 첫 청크 전에 적용, 사용량은 마지막 청크)"""
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        for word in self.answer.split(" "):
+            yield AIMessageChunk(content=word + " ")
+        yield AIMessageChunk(
+            content="",
+            usage_metadata={"input_tokens": 1200, "output_tokens": 180, "total_tokens": 1380},
+        )
+
+
+def fake_tiered_llm(answer: str, latency: float = 0.0) -> TieredLLM:
+    """API 키 없이 가짜 모델 1개 티어로 구성한 TieredLLM"""
+    tiered = TieredLLM.__new__(TieredLLM)
+    tiered.tiers = [("fake", FakeChatModel(answer, latency))]
+    tiered.circuit_breakers = {"fake": CircuitBreaker()}
+    tiered.latency = {"fake": LatencyTracker()}
+    tiered.call_latency = {"fake": LatencyTracker()}
+    tiered.tier_costs = {"fake": 0.0}
+    tiered.usage = {"fake": UsageStats()}
+    tiered.models = {"fake": "fake-model"}
+    tiered.hedge_budget = HedgeBudget(ratio=0.1)
+    tiered._bound_tools = {}
+    return tiered
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+/api/v1/chat/stream 부하 테스트 드라이버 (동시 SSE 스트림)
+
+동시 스트림 수를 단계별로 올리며(closed loop: 스트림마다 응답이 끝나면 바로 다음 요청)
+단계별 처리량, 첫 토큰까지 시간(TTFT), 전체 응답 시간 백분위, 에러율을 측정합니다.
+처리량이 더 이상 늘지 않거나 에러율이 한도를 넘는 단계를 포화 지점으로 표시합니다.
+
+업스트림 없이 측정하려면 benchmarks/mock_upstreams.py를 먼저 띄우고
+출력된 환경 변수로 backend-ai를 실행합니다:
+
+    cd backend-ai
+    python -m benchmarks.mock_upstreams --port 9100 &
+    OPENAI_API_KEY=sk-mock OPENAI_BASE_URL=http://127.0.0.1:9100/openai/v1 \\
+    GROQ_API_KEY=gsk-mock GROQ_BASE_URL=http://127.0.0.1:9100/groq \\
+    SPRING_API_URL=http://127.0.0.1:9100/spring LAW_API_KEY=mock LAW_API_BASE_URL=http://127.0.0.1:9100/law \\
+    uvicorn app.main:app --port 8001 --workers 2 &
+    python -m benchmarks.load_chat_stream --stages 10,50,100,200 --duration 30
+
+드라이버도 같은 머신의 CPU를 쓰므로, 포화 지점 근처에서는 드라이버 CPU 사용률도 함께 확인하세요.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from benchmarks.mock_upstreams import RECORDINGS
+
+
+def make_token(user_id: int) -> str:
+    """서명 없는 JWT 형태 토큰 (backend-ai는 클레임만 읽고 검증은 Spring 대역이 생략)"""
+    def encode(payload: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=").decode()
+
+    claims = {"sub": str(user_id), "exp": int(time.time()) + 86400}
+    return f"{encode({'alg': 'HS256', 'typ': 'JWT'})}.{encode(claims)}.loadtest"
+
+
+@dataclass
+class StreamResult:
+    ok: bool
+    error: str = ""  # http_429, http_500, error_event, timeout, connect, incomplete ...
+    ttft: Optional[float] = None  # 첫 token 이벤트까지 (초)
+    total: float = 0.0
+    tokens: int = 0
+    frames: int = 0
+    tool_calls: int = 0
+
+
+async def run_stream(client: httpx.AsyncClient, url: str, token: str, message: str,
+                     session_id: Optional[str], timeout: float) -> StreamResult:
+    """SSE 스트림 하나를 끝까지 읽고 타이밍 기록"""
+    started = time.perf_counter()
+    result = StreamResult(ok=False)
+    payload = {"message": message}
+    if session_id:
+        payload["session_id"] = session_id
+    try:
+        async with asyncio.timeout(timeout):
+            async with client.stream(
+                "POST", url, json=payload,
+                headers={"Authorization": f"Bearer {token}", "Accept": "text/event-stream"},
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    result.error = f"http_{response.status_code}"
+                    return result
+                event = "message"
+                async for line in response.aiter_lines():
+                    if line.startswith("event:"):
+                        event = line[6:].strip()
+                    elif line.startswith("data:"):
+                        result.frames += 1
+                        if event == "token":
+                            if result.ttft is None:
+                                result.ttft = time.perf_counter() - started
+                            result.tokens += len(line) - 5
+                        elif event == "tool_call":
+                            result.tool_calls += 1
+                        elif event == "error":
+                            result.error = "error_event"
+                            return result
+                        elif event == "done":
+                            result.ok = True
+                            return result
+                    elif not line:
+                        event = "message"
+                result.error = "incomplete"
+    except TimeoutError:
+        result.error = "timeout"
+    except httpx.ConnectError:
+        result.error = "connect"
+    except httpx.HTTPError as e:
+        result.error = type(e).__name__
+    finally:
+        result.total = time.perf_counter() - started
+    return result
+
+
+def _percentiles(values: list[float]) -> dict:
+    if not values:
+        return {"p50": None, "p90": None, "p99": None, "max": None}
+    values = sorted(values)
+
+    def pick(q: float) -> float:
+        return round(values[min(len(values) - 1, int(q * len(values)))] * 1000, 1)
+
+    return {"p50": pick(0.50), "p90": pick(0.90), "p99": pick(0.99), "max": round(values[-1] * 1000, 1)}
+
+
+@dataclass
+class Stage:
+    concurrency: int
+    results: list[StreamResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def summary(self) -> dict:
+        ok = [r for r in self.results if r.ok]
+        errors = Counter(r.error for r in self.results if not r.ok)
+        return {
+            "concurrency": self.concurrency,
+            "requests": len(self.results),
+            "ok": len(ok),
+            "error_rate": round(1 - len(ok) / len(self.results), 4) if self.results else None,
+            "errors": dict(errors),
+            "throughput_rps": round(len(ok) / self.elapsed, 2) if self.elapsed else 0.0,
+            "ttft_ms": _percentiles([r.ttft for r in ok if r.ttft is not None]),
+            "latency_ms": _percentiles([r.total for r in ok]),
+            "avg_frames": round(statistics.mean(r.frames for r in ok), 1) if ok else None,
+            "tool_call_ratio": round(sum(1 for r in ok if r.tool_calls) / len(ok), 3) if ok else None,
+        }
+
+
+async def run_stage(args, concurrency: int, prompts: list[str], tokens: list[str]) -> Stage:
+    """동시 스트림 concurrency개를 duration초 동안 유지 (또는 요청 수 도달까지)"""
+    stage = Stage(concurrency)
+    url = args.url.rstrip("/") + "/api/v1/chat/stream"
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    deadline = time.perf_counter() + args.duration
+    budget = args.requests or None
+
+    async with httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(args.timeout, connect=10.0)) as client:
+        async def worker(index: int):
+            nonlocal budget
+            rng = random.Random(args.seed * 100_003 + concurrency * 1_009 + index)
+            while time.perf_counter() < deadline:
+                if budget is not None:
+                    if budget <= 0:
+                        return
+                    budget -= 1
+                token = tokens[rng.randrange(len(tokens))]
+                session_id = f"load-{index}-{rng.randrange(args.sessions_per_stream)}" if args.sessions_per_stream else None
+                stage.results.append(
+                    await run_stream(client, url, token, rng.choice(prompts), session_id, args.timeout)
+                )
+
+        started = time.perf_counter()
+        if args.ramp:
+            # 동시에 연결을 열지 않도록 ramp초에 걸쳐 스트림 시작
+            tasks = []
+            for i in range(concurrency):
+                tasks.append(asyncio.create_task(worker(i)))
+                await asyncio.sleep(args.ramp / concurrency)
+            await asyncio.gather(*tasks)
+        else:
+            await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        stage.elapsed = time.perf_counter() - started
+    return stage
+
+
+def find_saturation(stages: list[dict], max_error_rate: float, min_gain: float) -> Optional[dict]:
+    """처리량 증가율이 min_gain 미만이거나 에러율이 한도를 넘는 첫 단계"""
+    for previous, current in zip([None] + stages, stages):
+        if current["error_rate"] is not None and current["error_rate"] > max_error_rate:
+            return {"concurrency": current["concurrency"], "reason": f"error_rate {current['error_rate']:.1%}"}
+        if previous and previous["throughput_rps"]:
+            gain = current["throughput_rps"] / previous["throughput_rps"] - 1
+            if gain < min_gain:
+                return {"concurrency": current["concurrency"], "reason": f"throughput gain {gain:+.1%}"}
+    return None
+
+
+def _print_stage(s: dict):
+    ttft, lat = s["ttft_ms"], s["latency_ms"]
+    errors = ", ".join(f"{k}={v}" for k, v in s["errors"].items()) or "-"
+    print(f"  c={s['concurrency']:<5} req={s['requests']:<6} {s['throughput_rps']:>8.2f} req/s  "
+          f"TTFT p50/p90/p99 {ttft['p50']}/{ttft['p90']}/{ttft['p99']}ms  "
+          f"total p50/p90/p99 {lat['p50']}/{lat['p90']}/{lat['p99']}ms  "
+          f"err {s['error_rate']:.2%} ({errors})" if s["error_rate"] is not None else f"  c={s['concurrency']}: no requests")
+
+
+async def run(args) -> int:
+    recordings = json.loads(Path(args.recordings).read_text(encoding="utf-8"))
+    prompts = recordings["prompts"]
+    tokens = [make_token(args.user_offset + i + 1) for i in range(args.users)]
+
+    try:
+        async with httpx.AsyncClient(timeout=5) as client:
+            health = await client.get(args.url.rstrip("/") + "/health")
+        print(f"대상: {args.url} (health {health.status_code})")
+    except httpx.HTTPError as e:
+        print(f"대상 서버 연결 실패: {args.url} ({e})")
+        return 2
+
+    concurrencies = [int(c) for c in args.stages.split(",")]
+    print(f"단계: {concurrencies} × {args.duration}s, 사용자 {args.users}명, 프롬프트 {len(prompts)}개")
+    summaries = []
+    for concurrency in concurrencies:
+        stage = await run_stage(args, concurrency, prompts, tokens)
+        summary = stage.summary()
+        summaries.append(summary)
+        _print_stage(summary)
+        if args.cooldown:
+            await asyncio.sleep(args.cooldown)
+
+    saturation = find_saturation(summaries, args.max_error_rate, args.min_gain)
+    if saturation:
+        print(f"\n  포화 지점: 동시 {saturation['concurrency']} 스트림 ({saturation['reason']})")
+    else:
+        print("\n  포화 지점 없음 (더 높은 단계로 재측정)")
+
+    if args.output:
+        report = {
+            "target": args.url,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "config": {k: v for k, v in vars(args).items() if k != "output"},
+            "stages": summaries,
+            "saturation": saturation,
+        }
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"  결과: {args.output}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SSE load driver for /api/v1/chat/stream")
+    parser.add_argument("--url", default="http://127.0.0.1:8001")
+    parser.add_argument("--stages", default="10,25,50,100", help="단계별 동시 스트림 수 (쉼표 구분)")
+    parser.add_argument("--duration", type=float, default=20.0, help="단계별 측정 시간(초)")
+    parser.add_argument("--requests", type=int, default=0, help="단계별 최대 요청 수 (0 = 시간 기준)")
+    parser.add_argument("--ramp", type=float, default=0.0, help="스트림 시작을 분산할 시간(초)")
+    parser.add_argument("--cooldown", type=float, default=2.0, help="단계 사이 대기(초)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="스트림당 제한 시간(초)")
+    parser.add_argument("--users", type=int, default=500, help="서로 다른 사용자 토큰 수")
+    parser.add_argument("--user-offset", type=int, default=1_000_000, help="토큰 sub 시작값")
+    parser.add_argument("--sessions-per-stream", type=int, default=0,
+                        help="스트림별 순환할 session_id 수 (0 = session_id 없이, 대화 히스토리/DB 기록 제외)")
+    parser.add_argument("--recordings", default=str(RECORDINGS), help="프롬프트 목록이 담긴 기록 파일")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--min-gain", type=float, default=0.1, help="이보다 처리량 증가가 작으면 포화로 판단")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default=None, help="결과 JSON 경로")
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+부하 테스트용 업스트림 대역 서버 (OpenAI / Groq / Spring API / 법령정보센터)
+
+recordings/upstreams.json의 기록된 응답을 실제 API 형식으로 재생하고,
+업스트림별 지연 분포와 장애(에러 응답, 응답 지연 정지)를 주입합니다.
+
+경로:
+    /openai/v1/chat/completions, /openai/v1/embeddings   → OPENAI_BASE_URL=http://HOST:PORT/openai/v1
+    /groq/openai/v1/chat/completions                     → GROQ_BASE_URL=http://HOST:PORT/groq
+    /spring/api/v1/...                                   → SPRING_API_URL=http://HOST:PORT/spring
+    /law/lawSearch.do, /law/lawService.do                → LAW_API_BASE_URL=http://HOST:PORT/law
+    /_mock/stats                                         → 업스트림별 요청/주입 장애 수 (워커별)
+
+지연 분포 (--latency NAME=SPEC, NAME: llm | embedding | spring | law):
+    fixed:0.2 | uniform:0.1,0.5 | normal:평균,표준편차 | lognormal:중앙값,sigma
+
+사용법:
+    cd backend-ai
+    python -m benchmarks.mock_upstreams --port 9100
+    python -m benchmarks.mock_upstreams --latency llm=lognormal:1.2,0.6 --errors llm=0.02 --stalls spring=0.01
+    python -m benchmarks.mock_upstreams --workers 4 --llm-token-interval 0.02   # 스트리밍 청크 간격
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+from xml.sax.saxutils import escape
+
+import numpy as np
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from benchmarks.fakes import fake_embedding
+
+RECORDINGS = Path(__file__).resolve().parent / "recordings" / "upstreams.json"
+UPSTREAMS = ("llm", "embedding", "spring", "law")
+DEFAULT_LATENCY = {
+    "llm": "lognormal:0.8,0.5",
+    "embedding": "lognormal:0.08,0.3",
+    "spring": "lognormal:0.03,0.5",
+    "law": "lognormal:0.15,0.6",
+}
+CONFIG_ENV = "MOCK_UPSTREAMS_CONFIG"  # --workers > 1일 때 워커 프로세스로 설정 전달
+
+
+def parse_latency(spec: str):
+    """지연 분포 문자열 → 샘플러 (초, 0 이상)"""
+    kind, _, params = spec.partition(":")
+    values = [float(v) for v in params.split(",")] if params else []
+    if kind == "fixed" and len(values) == 1:
+        return lambda: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda: random.uniform(values[0], values[1])
+    if kind == "normal" and len(values) == 2:
+        return lambda: max(0.0, random.gauss(values[0], values[1]))
+    if kind == "lognormal" and len(values) == 2:
+        mu = np.log(values[0]) if values[0] > 0 else 0.0
+        return lambda: random.lognormvariate(mu, values[1]) if values[0] > 0 else 0.0
+    raise ValueError(f"지연 분포 형식 오류: {spec} (fixed:S | uniform:A,B | normal:M,SD | lognormal:MEDIAN,SIGMA)")
+
+
+@dataclass
+class Upstream:
+    """업스트림 하나의 지연/장애 설정과 통계"""
+    latency: str
+    error_rate: float = 0.0
+    stall_rate: float = 0.0
+    stats: dict = field(default_factory=lambda: {"requests": 0, "errors": 0, "stalls": 0})
+
+    def __post_init__(self):
+        self.sample = parse_latency(self.latency)
+
+
+class MockUpstreams:
+    def __init__(self, config: dict):
+        self.recordings = json.loads(Path(config.get("recordings") or RECORDINGS).read_text(encoding="utf-8"))
+        self.stall_seconds = config.get("stall_seconds", 120.0)
+        self.token_interval = config.get("llm_token_interval", 0.0)
+        self.upstreams = {
+            name: Upstream(
+                latency=config.get("latency", {}).get(name, DEFAULT_LATENCY[name]),
+                error_rate=config.get("errors", {}).get(name, 0.0),
+                stall_rate=config.get("stalls", {}).get(name, 0.0),
+            )
+            for name in UPSTREAMS
+        }
+        llm = self.recordings["llm"]
+        self._tool_calls = llm["tool_calls"]
+        self._laws = {law["id"]: law for law in self.recordings["law"]["laws"]}
+        self._ledger_entries = self.recordings["spring"]["ledger_entries"]
+
+    async def enter(self, name: str, error_status: int = 500) -> Optional[Response]:
+        """지연 적용 + 장애 주입 (주입 시 반환할 응답, 정상이면 None)"""
+        upstream = self.upstreams[name]
+        upstream.stats["requests"] += 1
+        roll = random.random()
+        if roll < upstream.stall_rate:
+            upstream.stats["stalls"] += 1
+            await asyncio.sleep(self.stall_seconds)  # 클라이언트 타임아웃 유도
+        elif roll < upstream.stall_rate + upstream.error_rate:
+            upstream.stats["errors"] += 1
+            await asyncio.sleep(upstream.sample() / 4)
+            return JSONResponse({"error": {"message": "injected failure", "type": "server_error"}}, status_code=error_status)
+        delay = upstream.sample()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return None
+
+    # ---- LLM (OpenAI 호환 chat completions) ----
+
+    def choose_reply(self, body: dict) -> tuple[str, Optional[dict]]:
+        """요청 메시지 상태로 응답 선택: 도구 결과 뒤 → 마무리 답변, 도구 없음 → 요약, 그 외 답변/도구 호출"""
+        llm = self.recordings["llm"]
+        messages = body.get("messages", [])
+        if messages and messages[-1].get("role") == "tool":
+            return llm["after_tool"], None
+        offered = {t.get("function", {}).get("name") for t in body.get("tools") or []}
+        if not offered:
+            return llm["summary"], None
+        if random.random() < llm["tool_call_ratio"]:
+            candidates = [c for c in self._tool_calls if c["name"] in offered]
+            if candidates:
+                call = random.choices(candidates, weights=[c.get("weight", 1) for c in candidates])[0]
+                return "", {
+                    "id": f"call_{uuid.uuid4().hex[:24]}",
+                    "type": "function",
+                    "function": {"name": call["name"], "arguments": json.dumps(call["arguments"], ensure_ascii=False)},
+                }
+        return random.choice(llm["answers"]), None
+
+    def _usage(self) -> dict:
+        usage = self.recordings["llm"]["usage"]
+        return {**usage, "total_tokens": usage["prompt_tokens"] + usage["completion_tokens"]}
+
+    async def chat_completions(self, request: Request) -> Response:
+        body = await request.json()
+        injected = await self.enter("llm", error_status=random.choice((429, 500, 503)))
+        if injected is not None:
+            return injected
+
+        content, tool_call = self.choose_reply(body)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        model = body.get("model") or self.recordings["llm"]["model"]
+        created = int(time.time())
+        finish_reason = "tool_calls" if tool_call else "stop"
+
+        if not body.get("stream"):
+            message = {"role": "assistant", "content": content or None}
+            if tool_call:
+                message["tool_calls"] = [tool_call]
+            return JSONResponse({
+                "id": completion_id, "object": "chat.completion", "created": created, "model": model,
+                "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+                "usage": self._usage(),
+            })
+
+        async def chunks():
+            def chunk(delta: Optional[dict], finish: Optional[str] = None, **extra) -> str:
+                choices = [] if delta is None else [{"index": 0, "delta": delta, "finish_reason": finish}]
+                payload = {
+                    "id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                    "choices": choices, **extra,
+                }
+                return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+            yield chunk({"role": "assistant", "content": ""})
+            if tool_call:
+                yield chunk({"tool_calls": [{"index": 0, **tool_call}]})
+            else:
+                for i in range(0, len(content), 4):  # 4자씩 (토큰 단위 흉내)
+                    if self.token_interval:
+                        await asyncio.sleep(self.token_interval)
+                    yield chunk({"content": content[i:i + 4]})
+            yield chunk({}, finish_reason)
+            if (body.get("stream_options") or {}).get("include_usage"):
+                yield chunk(None, usage=self._usage())
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    async def embeddings(self, request: Request) -> Response:
+        body = await request.json()
+        injected = await self.enter("embedding")
+        if injected is not None:
+            return injected
+        inputs = body.get("input")
+        inputs = [inputs] if isinstance(inputs, str) else inputs
+        data = []
+        for i, text in enumerate(inputs):
+            vector = fake_embedding(text)
+            if body.get("encoding_format") == "base64":  # openai SDK 기본 요청 형식
+                vector = base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode()
+            data.append({"object": "embedding", "index": i, "embedding": vector})
+        tokens = sum(len(t) for t in inputs)
+        return JSONResponse({
+            "object": "list", "data": data, "model": body.get("model", "text-embedding-3-small"),
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+        })
+
+    # ---- Spring API ----
+
+    async def spring(self, request: Request, path: str) -> Response:
+        injected = await self.enter("spring", error_status=503)
+        if injected is not None:
+            return injected
+        spring = self.recordings["spring"]
+        if not request.headers.get("authorization", "").startswith("Bearer "):
+            return JSONResponse({"success": False, "message": "Unauthorized"}, status_code=401)
+
+        if path == "api/v1/auth/me":
+            # 부하 테스트 사용자가 서로 다른 사용자로 인증되도록 토큰 sub를 id로 응답
+            token = request.headers["authorization"].removeprefix("Bearer ")
+            me = spring["me"]
+            return JSONResponse({**me, "data": {**me["data"], "id": _token_sub(token)}})
+        if path == "api/v1/subscription/usage/lease":
+            count = int(request.query_params.get("count", 1))
+            return JSONResponse({"success": True, "data": {"granted": count, "yearMonth": time.strftime("%Y-%m")}})
+        if path == "api/v1/subscription/usage/release":
+            params = request.query_params
+            return JSONResponse({"success": True, "data": {
+                "released": int(params.get("count", 0)),
+                "used": int(params.get("used", 0)),
+                "yearMonth": params.get("yearMonth") or time.strftime("%Y-%m"),
+            }})
+        if path == "api/v1/employees":
+            return JSONResponse(spring["employees"])
+        if path == "api/v1/payroll/periods":
+            return JSONResponse(spring["periods"])
+        if path.startswith("api/v1/payroll/periods/"):
+            period_id = path.rsplit("/", 1)[-1]
+            return JSONResponse({"id": int(period_id) if period_id.isdigit() else period_id, "entries": self._ledger_entries})
+        return JSONResponse({"success": False, "message": f"not recorded: /{path}"}, status_code=404)
+
+    # ---- 법령정보센터 DRF (XML) ----
+
+    async def law_search(self, request: Request) -> Response:
+        injected = await self.enter("law")
+        if injected is not None:
+            return injected
+        query = request.query_params.get("query", "")
+        display = int(request.query_params.get("display", 10))
+        items = [
+            f"<law><법령ID>{law['id']}</법령ID><법령명한글>{escape(law['name'])}</법령명한글>"
+            f"<법령구분>{law['type']}</법령구분><공포일자>{law['promulgation_date']}</공포일자></law>"
+            for law in self._laws.values() if query in law["name"]
+        ][:display]
+        return Response(f"<LawSearch>{''.join(items)}</LawSearch>", media_type="application/xml")
+
+    async def law_service(self, request: Request) -> Response:
+        injected = await self.enter("law")
+        if injected is not None:
+            return injected
+        law = self._laws.get(request.query_params.get("ID", ""))
+        if law is None:
+            return Response("<Law></Law>", media_type="application/xml")
+        articles = "".join(
+            f"<조문단위><조문번호>{a['no']}</조문번호><조문제목>{escape(a['title'])}</조문제목>"
+            f"<조문내용>{escape(a['content'])}</조문내용></조문단위>"
+            for a in law["articles"]
+        )
+        return Response(
+            f"<법령><기본정보><법령명_한글>{escape(law['name'])}</법령명_한글></기본정보><조문>{articles}</조문></법령>",
+            media_type="application/xml",
+        )
+
+
+def create_app(config: Optional[dict] = None) -> FastAPI:
+    """대역 서버 앱 (config 없으면 환경 변수 MOCK_UPSTREAMS_CONFIG 사용)"""
+    if config is None:
+        config = json.loads(os.environ.get(CONFIG_ENV, "{}"))
+    mock = MockUpstreams(config)
+    app = FastAPI(title="PayTools upstream mocks", docs_url=None, redoc_url=None, openapi_url=None)
+
+    app.add_api_route("/openai/v1/chat/completions", mock.chat_completions, methods=["POST"])
+    app.add_api_route("/openai/v1/embeddings", mock.embeddings, methods=["POST"])
+    app.add_api_route("/groq/openai/v1/chat/completions", mock.chat_completions, methods=["POST"])
+    app.add_api_route("/spring/{path:path}", mock.spring, methods=["GET", "POST"])
+    app.add_api_route("/law/lawSearch.do", mock.law_search, methods=["GET"])
+    app.add_api_route("/law/lawService.do", mock.law_service, methods=["GET"])
+
+    @app.get("/_mock/stats")
+    async def stats():
+        return {
+            "pid": os.getpid(),
+            "upstreams": {
+                name: {"latency": u.latency, "error_rate": u.error_rate, "stall_rate": u.stall_rate, **u.stats}
+                for name, u in mock.upstreams.items()
+            },
+        }
+
+    return app
+
+
+def _token_sub(token: str) -> int:
+    """JWT sub 클레임 (없거나 형식이 다르면 1)"""
+    try:
+        payload = token.split(".")[1]
+        return int(json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))["sub"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return 1
+
+
+def _named(values: list[str], cast) -> dict:
+    """["llm=0.02", ...] → {"llm": 0.02}"""
+    result = {}
+    for value in values:
+        name, _, spec = value.partition("=")
+        if name not in UPSTREAMS or not spec:
+            raise SystemExit(f"형식: NAME=VALUE (NAME: {', '.join(UPSTREAMS)}): {value}")
+        result[name] = cast(spec)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Upstream mocks for load testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--recordings", default=str(RECORDINGS))
+    parser.add_argument("--latency", action="append", default=[], metavar="NAME=SPEC", help="지연 분포")
+    parser.add_argument("--errors", action="append", default=[], metavar="NAME=RATE", help="에러 응답 비율")
+    parser.add_argument("--stalls", action="append", default=[], metavar="NAME=RATE", help="응답 정지 비율")
+    parser.add_argument("--stall-seconds", type=float, default=120.0)
+    parser.add_argument("--llm-token-interval", type=float, default=0.0, help="스트리밍 응답 청크 간격(초)")
+    args = parser.parse_args()
+
+    latency = _named(args.latency, str)
+    for spec in latency.values():
+        parse_latency(spec)  # 시작 전에 형식 검증
+    config = {
+        "recordings": args.recordings,
+        "latency": latency,
+        "errors": _named(args.errors, float),
+        "stalls": _named(args.stalls, float),
+        "stall_seconds": args.stall_seconds,
+        "llm_token_interval": args.llm_token_interval,
+    }
+    os.environ[CONFIG_ENV] = json.dumps(config)
+
+    base = f"http://{args.host}:{args.port}"
+    print("backend-ai 환경 변수:")
+    print(f"  OPENAI_API_KEY=sk-mock OPENAI_BASE_URL={base}/openai/v1")
+    print(f"  GROQ_API_KEY=gsk-mock GROQ_BASE_URL={base}/groq")
+    print(f"  SPRING_API_URL={base}/spring")
+    print(f"  LAW_API_KEY=mock LAW_API_BASE_URL={base}/law")
+
+    import uvicorn
+    uvicorn.run(
+        "benchmarks.mock_upstreams:create_app", factory=True,
+        host=args.host, port=args.port, workers=args.workers, log_level="warning", access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+backend-ai 핫패스 마이크로벤치마크 모음 (네트워크 없이 실행)
+
+가짜 임베딩/LLM/법령 API(benchmarks/fakes.py)로 다음 구간의 연산당 시간을 측정합니다.
+- VectorStoreService.search (코퍼스 크기별)
+- RAGService.get_context (벡터 검색 / 키워드 폴백), _extract_keywords, _format_context
+- RateLimiter.check_limit
+- get_agent_response 프롬프트 구성 (_build_messages, LLM 호출 전후 전체 경로)
+- 계산기 도구 (salary/insurance/overtime/minimum wage/batch simulation)
+
+결과는 JSON으로 저장하고, 기준 결과(baseline)와 비교해 중앙값이 threshold 이상 느려진 항목을 회귀로 보고합니다.
+
+사용법:
+    cd backend-ai
+    python -m benchmarks.suite                                       # 실행 + benchmarks/results/latest.json 저장
+    python -m benchmarks.suite --save-baseline                       # 기준 결과 저장 (benchmarks/results/baseline.json)
+    python -m benchmarks.suite --baseline benchmarks/results/baseline.json --threshold 0.2
+    python -m benchmarks.suite --filter rag --rounds 10
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-bench")  # VectorStoreService.initialize 활성화 (실제 호출 없음)
+os.environ.setdefault("GROQ_API_KEY", "gsk-bench")
+
+from benchmarks.fakes import FakeEmbeddingClient, FakeLawClient, fake_tiered_llm, make_articles  # noqa: E402
+
+from app.services import agent as agent_module  # noqa: E402
+from app.services import rag as rag_module  # noqa: E402
+from app.services.prompts import STATIC_PROMPT_MEMBER  # noqa: E402
+from app.services.rag import RAGService  # noqa: E402
+from app.services.rate_limiter import RateLimiter  # noqa: E402
+from app.services.session_store import UserSession, session_key  # noqa: E402
+from app.services.tools import (  # noqa: E402
+    batch_salary_simulation,
+    insurance_calculator,
+    minimum_wage_check,
+    overtime_calculator,
+    salary_calculator,
+)
+from app.services.vector_store import VectorStoreService  # noqa: E402
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+CORPUS_SIZES = (100, 1_000, 5_000)
+QUERY = "야간근로 가산수당은 통상임금의 몇 퍼센트인가요? 연장근로와 겹치면 어떻게 계산하나요?"
+ANSWER = (
+    "야간근로(22시~06시)에는 통상임금의 50%를 가산하여 지급해야 합니다. "
+    "연장근로와 겹치면 연장 50%와 야간 50%가 각각 가산되어 통상임금의 200%가 됩니다! "
+    "5인 미만 사업장은 가산수당 의무가 없습니다. 구체적인 금액이 궁금하신가요?"
+)
+
+
+@dataclass
+class Case:
+    name: str
+    fn: Callable  # 동기 함수 또는 코루틴 함수 (인자 없음)
+    number: int  # 라운드당 반복 횟수
+
+
+async def _build_cases() -> list[Case]:
+    """벤치마크 대상과 고정 입력 준비 (가짜 프로바이더 주입)"""
+    cases: list[Case] = []
+
+    # 벡터 검색 (코퍼스 크기별)
+    for size in CORPUS_SIZES:
+        store = VectorStoreService()
+        store._client = FakeEmbeddingClient()
+        await store.initialize(make_articles(size))
+        cases.append(Case(f"vector_store.search[{size}]", lambda s=store: s.search(QUERY, k=3), max(5, 20_000 // size)))
+
+    # RAG (벡터 검색 경로 / 키워드 폴백 경로)
+    law_client = FakeLawClient()
+    vector_rag = RAGService.__new__(RAGService)
+    vector_rag.law_client = law_client
+    vector_rag.vector_store = VectorStoreService()
+    vector_rag.vector_store._client = FakeEmbeddingClient()
+    vector_rag._cache = {}
+    vector_rag._vector_initialized = False
+    await vector_rag.get_context(QUERY)  # 조문 360개 색인
+
+    keyword_rag = RAGService.__new__(RAGService)
+    keyword_rag.law_client = law_client
+    keyword_rag.vector_store = VectorStoreService()  # 초기화되지 않은 스토어 → 키워드 폴백
+    keyword_rag._cache = {}
+    keyword_rag._vector_initialized = True
+    await keyword_rag.get_context(QUERY)  # 법령 캐시 적재
+
+    articles = make_articles(5, content_chars=800)
+    cases += [
+        Case("rag.get_context[vector]", lambda: vector_rag.get_context(QUERY), 50),
+        Case("rag.get_context[keyword]", lambda: keyword_rag.get_context(QUERY), 2_000),
+        Case("rag._extract_keywords", lambda: keyword_rag._extract_keywords(QUERY), 20_000),
+        Case("rag._format_context", lambda: keyword_rag._format_context(articles), 20_000),
+    ]
+
+    # Rate limiter (1만 사용자 순환)
+    limiter = RateLimiter()
+    user_ids = [f"user-{i}" for i in range(10_000)]
+    counter = itertools.count()
+    cases.append(Case(
+        "rate_limiter.check_limit",
+        lambda: limiter.check_limit(user_ids[next(counter) % len(user_ids)], "free"),
+        50_000,
+    ))
+
+    # 프롬프트 구성 (히스토리 10턴 + 요약 + RAG 컨텍스트)
+    session = UserSession()
+    session.user_name = "홍길동"
+    session.summary = "사용자는 5인 이상 사업장 대표이며 야간근무 직원 3명의 수당 계산을 문의함."
+    for i in range(10):
+        session.add_exchange(f"질문 {i}: 주휴수당 계산 방법 알려줘", f"답변 {i}: " + ANSWER, 20)
+    context_text = keyword_rag._format_context(articles)
+    cases.append(Case(
+        "agent._build_messages",
+        lambda: agent_module._build_messages(STATIC_PROMPT_MEMBER, session, QUERY, context_text, "홍길동"),
+        20_000,
+    ))
+
+    # get_agent_response 전체 경로 (세션 → RAG → 프롬프트 → 가짜 LLM 청크 스트리밍)
+    agent_module.get_tiered_llm = lambda: fake_tiered_llm(ANSWER)
+    rag_module._rag_service = keyword_rag
+
+    async def agent_turn():
+        async for _ in agent_module.get_agent_response(QUERY, session_id=None, user_token=None):
+            pass
+        agent_module.get_session_store().get_or_create(session_key(None, None)).messages.clear()
+
+    cases.append(Case("agent.get_agent_response[fake_llm]", agent_turn, 500))
+
+    # 계산기 도구
+    cases += [
+        Case("tools.salary_calculator", lambda: salary_calculator.ainvoke(
+            {"base_salary": 3_000_000, "dependents_count": 2, "weekly_hours": 40, "overtime_hours": 10}), 1_000),
+        Case("tools.insurance_calculator", lambda: insurance_calculator.ainvoke({"monthly_salary": 3_000_000}), 5_000),
+        Case("tools.overtime_calculator", lambda: overtime_calculator.ainvoke(
+            {"hourly_rate": 12_000, "overtime_hours": 10, "night_hours": 4}), 5_000),
+        Case("tools.minimum_wage_check", lambda: minimum_wage_check.ainvoke({"hourly_rate": 10_000}), 5_000),
+        Case("tools.batch_salary_simulation[1000]", lambda: batch_salary_simulation.ainvoke(
+            {"base_salaries": list(range(2_000_000, 7_000_000, 5_000)), "raise_percent": 5}), 20),
+    ]
+    return cases
+
+
+async def _measure(case: Case, rounds: int, warmup: int) -> dict:
+    """라운드별 연산당 시간(µs) → 중앙값/p95/최소"""
+    is_async = None
+    samples = []
+    for round_index in range(warmup + rounds):
+        started = time.perf_counter()
+        for _ in range(case.number):
+            result = case.fn()
+            if is_async is None:
+                is_async = asyncio.iscoroutine(result)
+            if is_async:
+                await result
+        elapsed = (time.perf_counter() - started) / case.number * 1_000_000
+        if round_index >= warmup:
+            samples.append(elapsed)
+    samples.sort()
+    median = statistics.median(samples)
+    return {
+        "median_us": round(median, 3),
+        "p95_us": round(samples[min(len(samples) - 1, int(0.95 * len(samples)))], 3),
+        "min_us": round(samples[0], 3),
+        "ops_per_sec": round(1_000_000 / median, 1) if median else None,
+        "rounds": rounds,
+        "number": case.number,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[dict]:
+    """중앙값 기준 비교 → 항목별 변화율 (threshold 이상 느려지면 regression)"""
+    rows = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base:
+            rows.append({"name": name, "status": "new"})
+            continue
+        change = current["median_us"] / base["median_us"] - 1 if base["median_us"] else 0.0
+        status = "regression" if change > threshold else "improved" if change < -threshold else "ok"
+        rows.append({
+            "name": name, "status": status, "change": round(change, 4),
+            "baseline_us": base["median_us"], "current_us": current["median_us"],
+        })
+    return rows
+
+
+async def run(args) -> int:
+    import logging
+    logging.disable(logging.CRITICAL)  # 도구/에이전트 INFO 로그가 측정을 방해하지 않도록
+
+    cases = [c for c in await _build_cases() if not args.filter or args.filter in c.name]
+    if args.quick:
+        for case in cases:
+            case.number = max(1, case.number // 10)
+
+    print("=" * 78)
+    print(f"backend-ai 마이크로벤치마크 ({len(cases)}개, rounds={args.rounds})")
+    print("=" * 78)
+    results = {}
+    for case in cases:
+        results[case.name] = stats = await _measure(case, args.rounds, args.warmup)
+        print(f"  {case.name:<40} {stats['median_us']:>12,.2f}µs  p95 {stats['p95_us']:>12,.2f}µs  "
+              f"{stats['ops_per_sec'] or 0:>12,.0f}/s")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rounds": args.rounds,
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+
+    exit_code = 0
+    if args.baseline:
+        baseline_path = Path(args.baseline)
+        if not baseline_path.exists():
+            print(f"\n  기준 결과 없음: {baseline_path} (--save-baseline으로 생성)")
+        else:
+            baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+            rows = compare(results, baseline.get("results", {}), args.threshold)
+            report["comparison"] = {"baseline": str(baseline_path), "threshold": args.threshold, "rows": rows}
+            print(f"\n  기준 대비 (threshold ±{args.threshold:.0%}, baseline commit={baseline.get('meta', {}).get('commit')})")
+            for row in rows:
+                if row["status"] == "new":
+                    print(f"  {'new':<11} {row['name']}")
+                    continue
+                mark = {"regression": "❌ 회귀", "improved": "✅ 개선", "ok": "   유지"}[row["status"]]
+                print(f"  {mark:<9} {row['name']:<40} {row['baseline_us']:>12,.2f} → {row['current_us']:>12,.2f}µs "
+                      f"({row['change']:+.1%})")
+            regressions = [r for r in rows if r["status"] == "regression"]
+            if regressions:
+                print(f"\n  ❌ 회귀 {len(regressions)}건")
+                exit_code = 1
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\n  결과: {output}")
+    if args.save_baseline:
+        baseline_path = Path(args.save_baseline)
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"  기준 결과 저장: {baseline_path}")
+    return exit_code
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="backend-ai microbenchmark suite")
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--filter", default="", help="이름에 포함된 항목만 실행")
+    parser.add_argument("--quick", action="store_true", help="반복 횟수 1/10 (스모크 테스트)")
+    parser.add_argument("--output", default=str(RESULTS_DIR / "latest.json"))
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.15, help="회귀 판정 비율 (0.15 = 15%% 느려짐)")
+    parser.add_argument(
+        "--save-baseline", nargs="?", const=str(RESULTS_DIR / "baseline.json"), default=None,
+        help="이번 결과를 기준 결과로 저장",
+    )
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
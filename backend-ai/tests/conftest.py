@@ -0,0 +1,59 @@
+"""공용 픽스처: 서명 부분으로 위조 여부를 구분하는 JWT와 Spring /auth/me 대역"""
+
+import base64
+import json
+
+import pytest
+
+from app.services import user_profile
+
+
+def _encode(payload: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=").decode()
+
+
+def _make_token(sub: int, signature: str = "valid") -> str:
+    return f"{_encode({'alg': 'HS256'})}.{_encode({'sub': str(sub)})}.{signature}"
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, data: dict):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self) -> dict:
+        return {"success": self.status_code == 200, "data": self._data}
+
+
+class FakeAuthSpring:
+    """/auth/me 대역 (서명이 valid로 시작하고 폐기되지 않은 토큰만 인증, down이면 연결 실패)"""
+
+    def __init__(self):
+        self.calls = 0
+        self.tiers: dict[int, str] = {}
+        self.revoked: set[str] = set()
+        self.down = False
+
+    async def get(self, path: str, headers: dict, timeout: float):
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("spring down")
+        token = headers["Authorization"].removeprefix("Bearer ")
+        if not token.rsplit(".", 1)[-1].startswith("valid") or token in self.revoked:
+            return FakeResponse(401, {})
+        sub = int(json.loads(base64.urlsafe_b64decode(token.split(".")[1] + "=="))["sub"])
+        return FakeResponse(200, {"id": sub, "name": f"사용자{sub}", "subscriptionTier": self.tiers.get(sub, "FREE")})
+
+
+@pytest.fixture
+def make_token():
+    return _make_token
+
+
+@pytest.fixture
+def auth_spring(monkeypatch):
+    fake = FakeAuthSpring()
+    monkeypatch.setattr(user_profile, "get_spring_client", lambda: fake)
+    monkeypatch.setattr(user_profile, "_profile_cache", user_profile.TTLCache(100, 60))
+    monkeypatch.setattr(user_profile, "_last_verified", user_profile.TTLCache(100, 60))
+    return fake
@@ -0,0 +1,79 @@
+"""에이전트 스트리밍: 도구 호출 턴의 본문(서두)은 전송/저장하지 않고 최종 답변만 전송"""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessageChunk
+
+from app.services import agent
+from app.services.rag import RAGContext
+from app.services.session_store import SessionStore
+from benchmarks.fakes import fake_tiered_llm
+
+QUESTION = "우리 가게 알바 시급이 괜찮은지 봐줘"
+
+
+class ScriptedChatModel:
+    """턴마다 정해진 청크 목록을 스트리밍하는 가짜 모델"""
+
+    def __init__(self, turns: list[list[AIMessageChunk]]):
+        self.turns = list(turns)
+
+    def bind_tools(self, tools: list) -> "ScriptedChatModel":
+        return self
+
+    async def astream(self, messages, **kwargs):
+        for chunk in self.turns.pop(0):
+            yield chunk
+
+
+@pytest.fixture
+def session_store(monkeypatch):
+    store = SessionStore()
+    monkeypatch.setattr(agent, "get_session_store", lambda: store)
+    monkeypatch.setattr(agent, "get_session_sync", lambda: None)
+    monkeypatch.setattr(agent.get_summarizer(), "schedule", lambda session: None)
+    return store
+
+
+async def _run(monkeypatch, turns: list[list[AIMessageChunk]]) -> list[dict]:
+    tiered = fake_tiered_llm("")
+    tiered.tiers = [("fake", ScriptedChatModel(turns))]
+    monkeypatch.setattr(agent, "get_tiered_llm", lambda: tiered)
+
+    async def ready():
+        return agent.PreparedContext(user_name="", rag_context=RAGContext(QUESTION, [], ""))
+
+    prepared = asyncio.ensure_future(ready())
+    return [event async for event in agent.get_agent_response(QUESTION, "s1", None, prepared)]
+
+
+@pytest.mark.asyncio
+async def test_preamble_of_a_tool_call_turn_is_not_sent_or_saved(monkeypatch, session_store):
+    events = await _run(monkeypatch, [
+        [
+            AIMessageChunk(content="계산해 보겠습니다. "),
+            AIMessageChunk(content="", tool_call_chunks=[
+                {"name": "minimum_wage_check", "args": '{"hourly_rate": 9500}', "id": "call_1", "index": 0},
+            ]),
+        ],
+        [AIMessageChunk(content="최저임금에 "), AIMessageChunk(content="미달합니다.")],
+    ])
+
+    tokens = "".join(e["data"] for e in events if e["type"] == "token")
+    assert "계산해 보겠습니다" not in tokens
+    assert tokens.endswith("최저임금에 미달합니다.")
+    assert [e["data"]["status"] for e in events if e["type"] == "tool_call"] == ["start", "end"]
+    assert events[-1]["type"] == "done"
+
+    saved = session_store.get("guest:s1").messages
+    assert saved[-1].content == tokens
+    assert "계산해 보겠습니다" not in saved[-1].content
+
+
+@pytest.mark.asyncio
+async def test_answer_without_tool_calls_is_sent_in_order(monkeypatch, session_store):
+    events = await _run(monkeypatch, [[AIMessageChunk(content="통상임금은 "), AIMessageChunk(content="정기 임금입니다.")]])
+
+    assert [e["data"] for e in events if e["type"] == "token"] == ["통상임금은 ", "정기 임금입니다."]
+    assert session_store.get("guest:s1").messages[-1].content == "통상임금은 정기 임금입니다."
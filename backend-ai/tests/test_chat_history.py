@@ -0,0 +1,108 @@
+"""대화 기록 API: Spring이 인증한 사용자만 조회, 세션은 (사용자, session_id)별로 분리"""
+
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from app.api import chat
+from app.services import chat_history
+from app.services.chat_history import ChatHistoryWriter, session_uuid
+from app.services.session_store import SessionMessage
+
+
+class FakeConnection:
+    def __init__(self, executed: list):
+        self.executed = executed
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql, params):
+        self.executed.append((sql, params))
+
+
+class FakeEngine:
+    def __init__(self):
+        self.executed: list = []
+
+    def begin(self):
+        return FakeConnection(self.executed)
+
+
+@pytest.fixture
+def listed(monkeypatch):
+    """list_sessions/list_messages 호출 인자 기록 (DB 없이)"""
+    calls = []
+
+    async def fake_list_sessions(db, user_id, limit, cursor=None):
+        calls.append(("sessions", user_id))
+        return [], None
+
+    async def fake_list_messages(db, session_key, user_id, limit, cursor=None):
+        calls.append(("messages", session_key, user_id))
+        return [], None
+
+    async def no_flush():
+        return None
+
+    monkeypatch.setattr(chat, "list_sessions", fake_list_sessions)
+    monkeypatch.setattr(chat, "list_messages", fake_list_messages)
+    monkeypatch.setattr(chat.get_history_writer(), "flush", no_flush)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_forged_token_cannot_list_another_users_history(auth_spring, listed, make_token):
+    forged = make_token(42, signature="forged")
+
+    with pytest.raises(HTTPException) as sessions_error:
+        await chat.get_sessions(limit=20, cursor=None, auth_token=forged, db=None)
+    with pytest.raises(HTTPException) as messages_error:
+        await chat.get_messages("s1", limit=50, cursor=None, auth_token=forged, db=None)
+
+    assert sessions_error.value.status_code == 401
+    assert messages_error.value.status_code == 401
+    assert listed == []
+
+
+@pytest.mark.asyncio
+async def test_history_is_listed_for_the_verified_user(auth_spring, listed, make_token):
+    token = make_token(42)
+    await chat.get_sessions(limit=20, cursor=None, auth_token=token, db=None)
+    await chat.get_messages("s1", limit=50, cursor=None, auth_token=token, db=None)
+
+    assert listed == [("sessions", uuid.UUID(int=42)), ("messages", "s1", uuid.UUID(int=42))]
+    assert auth_spring.calls == 1  # 같은 토큰의 /auth/me는 캐시
+
+
+def test_same_session_id_maps_to_different_rows_per_user():
+    session_id = str(uuid.uuid4())
+    alice, bob = uuid.UUID(int=1), uuid.UUID(int=2)
+    assert session_uuid(session_id, alice) != session_uuid(session_id, bob)
+    assert session_uuid(session_id, alice) == session_uuid(session_id, alice)
+
+
+@pytest.mark.asyncio
+async def test_two_users_with_same_session_id_are_both_recorded(monkeypatch):
+    engine = FakeEngine()
+    monkeypatch.setattr(chat_history, "engine", engine)
+    writer = ChatHistoryWriter()
+    alice, bob = uuid.UUID(int=1), uuid.UUID(int=2)
+
+    writer.record("shared", alice, [SessionMessage("user", "alice 질문", 1.0), SessionMessage("assistant", "a", 2.0)])
+    writer.record("shared", bob, [SessionMessage("user", "bob 질문", 3.0), SessionMessage("assistant", "b", 4.0)])
+    await writer.flush()
+
+    (_, session_rows), (_, message_rows) = engine.executed
+    assert {(row["user_id"], row["session_key"], row["title"]) for row in session_rows} == {
+        (alice, "shared", "alice 질문"),
+        (bob, "shared", "bob 질문"),
+    }
+    assert len({row["id"] for row in session_rows}) == 2
+    assert [(row["user_id"], row["session_key"]) for row in message_rows] == [
+        (alice, "shared"), (alice, "shared"), (bob, "shared"), (bob, "shared"),
+    ]
@@ -0,0 +1,90 @@
+"""계산기 Fast Path: 의도 분류 → 인자 추출 → 도구 실행"""
+
+import pytest
+
+from app.services.fast_path import classify_intent, parse_hours, parse_money, try_fast_path
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("300만원", [3_000_000]),
+        ("9,500원", [9_500]),
+        ("1억 2천만원", [120_000_000]),
+        ("2.5만원", [25_000]),
+    ],
+)
+def test_parse_money(text, expected):
+    assert parse_money(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [("2시간", [2.0]), ("2시간 반", [2.5]), ("1.5시간", [1.5]), ("2시간 30분", [2.5]), ("30분", [0.5])],
+)
+def test_parse_hours(text, expected):
+    assert parse_hours(text) == expected
+
+
+@pytest.mark.parametrize(
+    "message, intent",
+    [
+        ("시급 9500원 최저임금 위반이야?", "minimum_wage"),
+        ("월급 300만원 4대보험 얼마", "insurance"),
+        ("연장근로수당 시급 12000원 2시간 얼마", "overtime"),
+        ("월급 300만원 실수령액 알려줘", "salary_calc"),
+    ],
+)
+def test_classify_intent(message, intent):
+    assert classify_intent(message) == intent
+
+
+@pytest.mark.asyncio
+async def test_minimum_wage_example():
+    result = await try_fast_path("시급 9500원 최저임금 위반이야?")
+    assert result is not None
+    assert result.tool == "minimum_wage_check"
+    assert result.args == {"hourly_rate": 9_500}
+    assert result.result["is_compliant"] is False
+    assert f"{result.result['year']}년 최저시급" in result.answer
+
+
+@pytest.mark.asyncio
+async def test_insurance_example():
+    result = await try_fast_path("월급 300만원 4대보험 얼마")
+    assert result is not None
+    assert result.tool == "insurance_calculator"
+    assert result.args == {"monthly_salary": 3_000_000}
+    assert result.result["total"] > 0
+
+
+@pytest.mark.asyncio
+async def test_overtime_example():
+    result = await try_fast_path("연장근로수당 시급 12000원 2시간 반이면 얼마?")
+    assert result is not None
+    assert result.tool == "overtime_calculator"
+    assert result.args["overtime_hours"] == 2.5
+    assert result.result["total_extra_pay"] == 45_000  # 12,000 × 2.5 × 1.5
+
+
+@pytest.mark.asyncio
+async def test_minimum_wage_uses_mentioned_year():
+    result = await try_fast_path("2026년 최저시급 11000원 위반인가요")
+    assert result is not None
+    assert result.args["year"] == 2026
+    assert result.result["year"] == 2026
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "message",
+    [
+        "2024년 최저임금 9,900원 괜찮나요",  # 요율 없는 연도
+        "월급 300만원 세후 실수령액이랑 4대보험",  # 세금 포함 질문
+        "최저임금 9000원 주휴수당 포함?",  # 수당 질문은 LLM
+        "우리 직원 4대보험 300만원 얼마",  # 사용자 데이터 맥락
+        "연장 야간 수당 시급 12000원 2시간",  # 여러 가산 유형
+    ],
+)
+async def test_ambiguous_questions_fall_back_to_llm(message):
+    assert await try_fast_path(message) is None
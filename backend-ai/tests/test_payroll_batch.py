@@ -0,0 +1,59 @@
+"""급여 일괄 시뮬레이션: 직원별 payroll.calculate_salary 결과와 1원 단위 일치"""
+
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pytest
+
+from app.services import payroll
+from app.services.payroll_batch import RAISE_PERCENT_STEP, simulate_batch
+from benchmarks.bench_payroll_batch import FIELDS, _scalar_row, _workforce
+
+RAISE_PERCENTS = [16.9, 2 / 3, 10 / 3, 0.1, 1.05, 3.5, 5, 7.77, 12.345, 33.33333, 99.9, 150, -0.5, -10, -99.5]
+
+
+def _scalar_raised(data: dict, raise_percent: float) -> np.ndarray:
+    """인상 후 기본급(Decimal, 원 단위 반올림)으로 직원마다 payroll.calculate_salary"""
+    percent = Decimal(str(raise_percent)).quantize(RAISE_PERCENT_STEP, rounding=ROUND_HALF_UP)
+    raised = {
+        **data,
+        "base_salary": [payroll.won(Decimal(int(b)) * (1 + percent / 100)) for b in data["base_salary"]],
+    }
+    return np.array([_scalar_row(raised, i) for i in range(len(data["base_salary"]))], dtype=np.int64)
+
+
+@pytest.mark.parametrize("raise_percent", RAISE_PERCENTS)
+def test_raise_matches_scalar_payroll(raise_percent):
+    data = _workforce(150, seed=int(abs(raise_percent) * 1000))
+    result = simulate_batch(
+        data["base_salary"], data["weekly_hours"], data["dependents"], data["children_under_20"],
+        data["overtime_hours"], data["night_hours"], data["holiday_hours"], raise_percent=raise_percent,
+    )
+    actual = np.column_stack([getattr(result, field) for field in FIELDS])
+    np.testing.assert_array_equal(actual, _scalar_raised(data, raise_percent))
+
+
+@pytest.mark.parametrize(
+    "raise_percent, expected",
+    [(16.9, 3_507_000), (2 / 3, 3_020_001), (10 / 3, 3_099_999), (0, 3_000_000)],
+)
+def test_raised_base_salary(raise_percent, expected):
+    assert simulate_batch([3_000_000], raise_percent=raise_percent).base_salary.tolist() == [expected]
+
+
+@pytest.mark.parametrize("field", ["overtime_hours", "night_hours", "holiday_hours"])
+@pytest.mark.parametrize("company_size", ["OVER_5", "UNDER_5"])
+def test_negative_extra_hours_are_rejected(field, company_size):
+    with pytest.raises(ValueError, match="0 이상"):
+        simulate_batch([3_000_000, 3_000_000], company_size=company_size, **{field: [2, -1]})
+
+
+@pytest.mark.parametrize("raise_percent", [-100, -150, float("nan"), float("inf"), 1e30])
+def test_invalid_raise_is_rejected(raise_percent):
+    with pytest.raises(ValueError):
+        simulate_batch([3_000_000], raise_percent=raise_percent)
+
+
+def test_amounts_beyond_int64_are_rejected_instead_of_wrapping():
+    with pytest.raises(ValueError, match="범위"):
+        simulate_batch([10**15], raise_percent=1_000_000)
@@ -0,0 +1,71 @@
+"""시간당 요청 한도: Spring이 인증한 사용자 기준, 조회 실패 시 마지막 요금제 유지"""
+
+import uuid
+
+import pytest
+
+from app.api import chat
+from app.services import user_profile
+from app.services.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    fresh = RateLimiter()
+    monkeypatch.setattr(chat, "get_rate_limiter", lambda: fresh)
+    return fresh
+
+
+@pytest.mark.asyncio
+async def test_forged_token_does_not_spend_victims_limit(auth_spring, limiter, make_token):
+    auth_spring.tiers[42] = "PRO"
+    await chat.check_rate_limit(make_token(42))
+
+    for _ in range(5):
+        await chat.check_rate_limit(make_token(42, signature="forged"))
+
+    victim = limiter.users[str(uuid.UUID(int=42))]
+    assert victim.current == 1 and victim.tier == "pro"
+    forged_keys = [key for key in limiter.users if key.startswith("token:")]
+    assert len(forged_keys) == 1
+    assert limiter.users[forged_keys[0]].current == 5
+    assert limiter.users[forged_keys[0]].tier == "free"
+
+
+@pytest.mark.asyncio
+async def test_spring_outage_keeps_the_last_verified_user_and_tier(auth_spring, limiter, make_token, monkeypatch):
+    auth_spring.tiers[7] = "PRO"
+    token = make_token(7)
+    await chat.check_rate_limit(token)
+
+    # 프로필 캐시 만료 후 Spring 장애
+    monkeypatch.setattr(user_profile, "_profile_cache", user_profile.TTLCache(100, 60))
+    auth_spring.down = True
+    await chat.check_rate_limit(token)
+
+    assert list(limiter.users) == [str(uuid.UUID(int=7))]
+    assert limiter.users[str(uuid.UUID(int=7))].tier == "pro"
+    assert limiter.users[str(uuid.UUID(int=7))].current == 2
+
+
+@pytest.mark.asyncio
+async def test_rejected_token_drops_the_last_verified_profile(auth_spring, make_token, monkeypatch):
+    token = make_token(7)
+    assert await user_profile.verified_user_id(token) == uuid.UUID(int=7)
+
+    # 같은 토큰이 이후 거부되면 (로그아웃/폐기) 장애 시에도 다시 쓰지 않음
+    monkeypatch.setattr(user_profile, "_profile_cache", user_profile.TTLCache(100, 60))
+    auth_spring.revoked.add(token)
+    assert await user_profile.verified_user_id(token) is None
+    auth_spring.down = True
+    assert await user_profile.verified_user_id(token) is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_tier_keeps_the_stored_tier():
+    limiter = RateLimiter()
+    await limiter.acquire("u1", "pro")
+    await limiter.acquire("u1")
+    assert limiter.users["u1"].tier == "pro"
+    await limiter.acquire("u2")
+    assert limiter.users["u2"].tier == "free"
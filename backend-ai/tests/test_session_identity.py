@@ -0,0 +1,79 @@
+"""대화 세션 소유자: Spring이 인증한 사용자만 자기 세션(히스토리/요약/이름)에 접근"""
+
+import uuid
+
+import pytest
+
+from app.services import agent
+from app.services.session_store import SessionStore, session_key
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """워커 메모리 세션만 사용 (공유 백엔드/DB 기록 없음)"""
+    fresh = SessionStore()
+    monkeypatch.setattr(agent, "get_session_store", lambda: fresh)
+    monkeypatch.setattr(agent, "get_session_sync", lambda: None)
+    return fresh
+
+
+@pytest.fixture
+def history(monkeypatch):
+    """DB 대화 기록 조회/기록 호출 기록"""
+    calls = []
+
+    class FakeWriter:
+        async def load(self, session_key, user_id, limit):
+            calls.append(("load", session_key, user_id))
+            return None
+
+        def record(self, session_key, user_id, messages):
+            calls.append(("record", session_key, user_id))
+
+    monkeypatch.setattr(agent, "get_history_writer", lambda: FakeWriter())
+    monkeypatch.setattr(agent.get_summarizer(), "schedule", lambda session: None)
+    return calls
+
+
+async def _open(session_id, token):
+    user_id = await agent.verified_user_id(token)
+    return user_id, await agent._get_session(session_id, user_id, token)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("session_id", [None, "s1"])
+async def test_forged_token_does_not_load_victims_session(auth_spring, store, history, make_token, session_id):
+    victim_id, victim_session = await _open(session_id, make_token(42))
+    assert victim_id == uuid.UUID(int=42)
+    victim_session.user_name = "피해자"
+    victim_session.summary = "급여 상담 요약"
+    agent._save_exchange(victim_session, session_id, victim_id, "질문", "답변")
+
+    forged_id, forged_session = await _open(session_id, make_token(42, signature="forged"))
+
+    assert forged_id is None
+    assert forged_session is not victim_session
+    assert forged_session.messages == [] and forged_session.summary == "" and forged_session.user_name == ""
+    # 위조 토큰의 대화는 DB 기록을 조회하지도, 남기지도 않음
+    agent._save_exchange(forged_session, session_id, forged_id, "위조 질문", "답변")
+    assert all(user_id == victim_id for _, _, user_id in history)
+    assert [m.content for m in victim_session.messages] == ["질문", "답변"]
+
+
+@pytest.mark.asyncio
+async def test_verified_user_gets_the_same_session_with_a_new_token(auth_spring, store, history, make_token):
+    user_id, first = await _open("s1", make_token(7))
+    agent._save_exchange(first, "s1", user_id, "질문", "답변")
+
+    # 토큰이 갱신돼도 같은 사용자면 같은 세션
+    _, second = await _open("s1", make_token(7, signature="valid-reissued"))
+    assert second is first
+    assert ("record", "s1", uuid.UUID(int=7)) in history
+
+
+def test_session_key_separates_owners():
+    user_id = uuid.UUID(int=42)
+    assert session_key("s1", user_id) == f"{user_id}:s1"
+    assert session_key(None, user_id) == f"{user_id}:default"
+    assert session_key("s1", "token:abc") == "token:abc:s1"
+    assert session_key("s1", None) == "guest:s1"
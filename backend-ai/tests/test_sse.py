@@ -0,0 +1,86 @@
+"""SSE 송신기: 느린 리더 백프레셔, 재연결 이어받기"""
+
+import asyncio
+
+import pytest
+
+from app.core.sse import SSEEmitter
+
+EVENTS = 40
+
+
+class Source:
+    """tool_call 이벤트(병합되지 않음 → 이벤트당 프레임 1개)를 생성하고 생성 개수를 기록"""
+
+    def __init__(self, count: int = EVENTS):
+        self.count = count
+        self.produced = 0
+
+    async def __aiter__(self):
+        for i in range(self.count):
+            self.produced += 1
+            yield {"type": "tool_call", "data": {"tool": f"t{i}", "status": "end"}}
+        yield {"type": "done", "data": ""}
+
+
+def make_emitter(source: Source) -> SSEEmitter:
+    return SSEEmitter(source.__aiter__(), max_delay=0, heartbeat=5, queue_size=2, replay_frames=4, grace=5)
+
+
+@pytest.mark.asyncio
+async def test_slow_reader_receives_every_frame_and_pauses_generation():
+    source = Source()
+    emitter = make_emitter(source)
+    received = []
+    ahead = []
+    async for frame in emitter.stream():
+        received.append(frame)
+        await asyncio.sleep(0.001)
+        ahead.append(source.produced - len(received))
+
+    assert [f["event"] for f in received] == ["tool_call"] * EVENTS + ["done"]
+    assert [int(f["id"].split(":")[1]) for f in received] == list(range(1, EVENTS + 2))
+    # 생성은 리더보다 (보관 버퍼 + 큐 + 병합 단계) 이상 앞서가지 않음
+    assert max(ahead) <= 4 + 2 + 2
+
+
+@pytest.mark.asyncio
+async def test_two_readers_are_paced_by_the_slowest():
+    emitter = make_emitter(Source())
+
+    async def read(delay: float) -> list[str]:
+        events = []
+        async for frame in emitter.stream():
+            events.append(frame["event"])
+            await asyncio.sleep(delay)
+        return events
+
+    fast, slow = await asyncio.gather(read(0), read(0.002))
+    assert fast == slow == ["tool_call"] * EVENTS + ["done"]
+
+
+@pytest.mark.asyncio
+async def test_resume_from_last_event_id_continues_without_regenerating():
+    source = Source(count=3)
+    emitter = make_emitter(source)
+    first = emitter.stream()
+    frame = await anext(first)
+    await first.aclose()
+
+    last_seq = int(frame["id"].split(":")[1])
+    rest = [f async for f in emitter.stream(after=last_seq)]
+    assert [f["event"] for f in rest] == ["tool_call", "tool_call", "done"]
+    assert source.produced == 3
+
+
+@pytest.mark.asyncio
+async def test_without_readers_old_frames_are_dropped():
+    emitter = make_emitter(Source())
+    first = emitter.stream()
+    await anext(first)
+    await first.aclose()  # 리더 없음 → 유예 시간 동안 생성 계속, 버퍼는 최근 4개만 보관
+    while not emitter.done:
+        await asyncio.sleep(0.001)
+
+    frames = [f async for f in emitter.stream(after=1)]
+    assert frames[0]["event"] == "error"
@@ -0,0 +1,157 @@
+"""AI_CHAT 리스 미터: 토큰별 예약, 예약/사용 정산, 월 단위 반환"""
+
+import base64
+import json
+
+import pytest
+
+from app.services import usage_meter
+from app.services.usage_meter import UsageMeter
+
+
+def make_token(sub: int, signature: str = "valid") -> str:
+    def encode(payload: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=").decode()
+
+    return f"{encode({'alg': 'HS256'})}.{encode({'sub': str(sub)})}.{signature}"
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, data: dict):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self) -> dict:
+        return {"success": self.status_code == 200, "data": self._data}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeSpring:
+    """UsageService.reserveUsage/settleUsage와 같은 규칙의 대역 (서명이 valid인 토큰만 인증)"""
+
+    def __init__(self, limit: int, year_month: str = "2026-10"):
+        self.limit = limit
+        self.year_month = year_month
+        self.count: dict[str, int] = {}
+        self.reserved: dict[str, int] = {}
+        self.requests: list[tuple[str, dict, str]] = []
+        self.fail_settlements = False
+
+    async def post(self, path: str, params: dict, headers: dict, timeout: float):
+        token = headers["Authorization"].removeprefix("Bearer ")
+        self.requests.append((path, dict(params), token))
+        if not token.endswith(".valid"):
+            return FakeResponse(401, {})
+        if path.endswith("/lease"):
+            month = self.year_month
+            available = max(0, self.limit - self.count.get(month, 0) - self.reserved.get(month, 0))
+            granted = min(params["count"], available, max(1, available // 10))
+            self.reserved[month] = self.reserved.get(month, 0) + granted
+            return FakeResponse(200, {"granted": granted, "yearMonth": month})
+        if self.fail_settlements:
+            return FakeResponse(503, {})
+        month = params["yearMonth"] or self.year_month
+        self.count[month] = self.count.get(month, 0) + params["used"]
+        self.reserved[month] = max(0, self.reserved.get(month, 0) - params["used"])
+        released = min(params["count"], self.reserved[month])
+        self.reserved[month] -= released
+        return FakeResponse(200, {"released": released, "used": params["used"], "yearMonth": month})
+
+
+@pytest.fixture
+def spring(monkeypatch):
+    fake = FakeSpring(limit=10)
+    monkeypatch.setattr(usage_meter, "get_spring_client", lambda: fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_forged_token_with_same_sub_does_not_spend_victims_lease(spring):
+    spring.limit = 1000  # 한 번에 여러 건 예약되는 요금제
+    meter = UsageMeter()
+    victim = make_token(42)
+    assert await meter.consume(victim) == (True, "")
+    assert meter.get_stats()["leased_remaining"] > 0
+
+    forged = make_token(42, signature="forged")
+    for _ in range(4):
+        allowed, message = await meter.consume(forged)
+        assert not allowed
+        assert message == usage_meter.AUTH_MESSAGE
+
+    # 위조 토큰은 Spring에 직접 예약을 요청했다가 거부됨, 피해자 예약 잔량은 그대로
+    assert all(token == forged for path, _, token in spring.requests[1:])
+    assert meter._leases[meter._key(victim)].token == victim
+    assert meter._leases[meter._key(victim)].used == 1
+
+
+@pytest.mark.asyncio
+async def test_free_quota_is_fully_usable_and_reserved_units_are_not_counted(spring):
+    meter = UsageMeter()
+    token = make_token(7)
+
+    assert (await meter.consume(token))[0]
+    assert spring.count.get("2026-10", 0) == 0  # 예약만 됨, 사용 보고 전
+    await meter.reconcile()
+    assert spring.count["2026-10"] == 1 and spring.reserved["2026-10"] == 0
+
+    allowed = 1
+    for _ in range(15):
+        meter._leases[meter._key(token)].exhausted_until = 0.0
+        if (await meter.consume(token))[0]:
+            allowed += 1
+    await meter.stop()
+
+    assert allowed == 10
+    assert spring.count["2026-10"] == 10
+    assert spring.reserved["2026-10"] == 0
+
+
+@pytest.mark.asyncio
+async def test_small_quota_leases_one_unit_and_does_not_prefetch(spring):
+    meter = UsageMeter()
+    token = make_token(8)
+    await meter.consume(token)
+    lease = meter._leases[meter._key(token)]
+    assert lease.remaining == 0 and lease.used == 1
+    assert not lease.prefetch
+    assert lease.renewing is None
+
+
+@pytest.mark.asyncio
+async def test_leftover_units_are_released_against_the_month_they_were_leased_in(spring):
+    spring.limit = 1000
+    meter = UsageMeter()
+    token = make_token(9)
+    await meter.consume(token)
+    lease = meter._leases[meter._key(token)]
+    leftover = lease.remaining
+    assert leftover > 0 and lease.year_month == "2026-10"
+
+    spring.year_month = "2026-11"
+    lease.expires_at = 0.0  # 만료 → 다음 요청에서 정산 후 새 달 예약
+    await meter.consume(token)
+
+    release = next(params for path, params, _ in spring.requests if path.endswith("/release"))
+    assert release == {"type": "AI_CHAT", "count": leftover, "used": 1, "yearMonth": "2026-10"}
+    assert spring.reserved["2026-10"] == 0
+    assert lease.year_month == "2026-11"
+
+
+@pytest.mark.asyncio
+async def test_failed_settlement_is_retried(spring):
+    meter = UsageMeter()
+    token = make_token(10)
+    await meter.consume(token)
+
+    spring.fail_settlements = True
+    await meter.reconcile()
+    assert meter.get_stats()["unreported_used"] == 1
+
+    spring.fail_settlements = False
+    await meter.reconcile()
+    assert meter.get_stats()["unreported_used"] == 0
+    assert spring.count["2026-10"] == 1
@@ -0,0 +1,46 @@
+"""토큰 사용량 귀속: Spring이 인증한 사용자에게만 기록"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from app.services import agent, llm
+from app.services.rag import RAGContext
+from app.services.session_store import SessionStore
+from app.services.usage_writer import TokenUsageWriter
+from benchmarks.fakes import fake_tiered_llm
+
+
+@pytest.fixture
+def writer(monkeypatch):
+    fresh = TokenUsageWriter()
+    monkeypatch.setattr(llm, "get_usage_writer", lambda: fresh)
+    monkeypatch.setattr(agent, "get_tiered_llm", lambda: fake_tiered_llm("통상임금은 정기적으로 지급되는 임금입니다."))
+    store = SessionStore()
+    monkeypatch.setattr(agent, "get_session_store", lambda: store)
+    monkeypatch.setattr(agent, "get_session_sync", lambda: None)
+    monkeypatch.setattr(agent.get_history_writer(), "record", lambda *args: None)
+    monkeypatch.setattr(agent.get_summarizer(), "schedule", lambda session: None)
+    return fresh
+
+
+async def _ask(token: str):
+    async def ready():
+        return agent.PreparedContext(user_name="", rag_context=RAGContext("통상임금", [], ""))
+
+    prepared = asyncio.ensure_future(ready())
+    events = [event async for event in agent.get_agent_response("통상임금이 뭐야?", "s1", token, prepared)]
+    assert events[-1]["type"] == "done"
+
+
+@pytest.mark.asyncio
+async def test_usage_is_attributed_to_the_verified_user(auth_spring, writer, make_token):
+    await _ask(make_token(42))
+    assert [user_id for user_id, _, _ in writer._buffer] == [uuid.UUID(int=42)]
+
+
+@pytest.mark.asyncio
+async def test_forged_token_usage_is_not_attributed_to_its_sub(auth_spring, writer, make_token):
+    await _ask(make_token(42, signature="forged"))
+    assert writer._buffer == {}
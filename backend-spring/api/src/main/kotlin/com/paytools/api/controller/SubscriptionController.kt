@@ -9,6 +9,8 @@ import com.paytools.domain.model.UsageType
 import org.springframework.http.ResponseEntity
 import org.springframework.web.bind.annotation.*
 import java.time.LocalDateTime
+import java.time.YearMonth
+import java.time.format.DateTimeParseException
 
 @RestController
 @RequestMapping("/api/v1/subscription")
@@ -40,9 +42,11 @@ class SubscriptionController(
     ): ResponseEntity<ApiResponse<UsageResponse>> {
         val userId = getUserId(authorization)
         val usage = usageService.getMonthlyUsage(userId)
+        val reserved = usageService.getReservedUsage(userId)
 
         val response = UsageResponse(
             aiChats = usage[UsageType.AI_CHAT] ?: 0,
+            aiChatsReserved = reserved[UsageType.AI_CHAT] ?: 0,
             salaryCalcs = usage[UsageType.SALARY_CALC] ?: 0,
             pdfExports = usage[UsageType.PDF_EXPORT] ?: 0,
             excelExports = usage[UsageType.EXCEL_EXPORT] ?: 0
@@ -72,6 +76,58 @@ class SubscriptionController(
         }
     }
 
+    /**
+     * 사용량 블록 예약 (내부 API, AI 서비스 로컬 미터링용)
+     * POST /api/v1/subscription/usage/lease
+     * 예약분은 사용 보고 전까지 사용량(aiChats)이 아닌 예약(aiChatsReserved)으로 집계
+     */
+    @PostMapping("/usage/lease")
+    fun leaseUsage(
+        @RequestHeader("Authorization") authorization: String,
+        @RequestParam type: UsageType,
+        @RequestParam(defaultValue = "1") count: Int
+    ): ResponseEntity<ApiResponse<Map<String, Any>>> {
+        val userId = getUserId(authorization)
+        val lease = usageService.reserveUsage(userId, type, count.coerceIn(1, 100))
+
+        return if (lease.granted > 0) {
+            ResponseEntity.ok(ApiResponse.success(mapOf("granted" to lease.granted, "yearMonth" to lease.yearMonth)))
+        } else {
+            ResponseEntity.ok(ApiResponse.success(mapOf(
+                "granted" to 0,
+                "yearMonth" to lease.yearMonth,
+                "message" to "사용량 한도를 초과했습니다. 업그레이드를 고려해주세요."
+            )))
+        }
+    }
+
+    /**
+     * 예약 정산 (내부 API): 사용한 개수 확정 + 미사용 예약분 반환
+     * POST /api/v1/subscription/usage/release
+     * yearMonth는 예약 응답의 월 (생략 시 현재 월)
+     */
+    @PostMapping("/usage/release")
+    fun releaseUsage(
+        @RequestHeader("Authorization") authorization: String,
+        @RequestParam type: UsageType,
+        @RequestParam count: Int,
+        @RequestParam(defaultValue = "0") used: Int,
+        @RequestParam(required = false) yearMonth: String?
+    ): ResponseEntity<ApiResponse<Map<String, Any>>> {
+        val userId = getUserId(authorization)
+        val month = try {
+            YearMonth.parse(yearMonth ?: YearMonth.now().toString()).toString()
+        } catch (e: DateTimeParseException) {
+            throw IllegalArgumentException("yearMonth 형식이 올바르지 않습니다: $yearMonth")
+        }
+        val settlement = usageService.settleUsage(userId, type, month, used.coerceIn(0, 100), count.coerceIn(0, 100))
+        return ResponseEntity.ok(ApiResponse.success(mapOf(
+            "released" to settlement.released,
+            "used" to settlement.used,
+            "yearMonth" to month
+        )))
+    }
+
     /**
      * 사용 가능 여부 체크
      * GET /api/v1/subscription/can-use
@@ -21,6 +21,7 @@ data class SubscriptionResponse(
  */
 data class UsageResponse(
     val aiChats: Int,
+    val aiChatsReserved: Int = 0,  // AI 서비스가 예약했지만 아직 사용하지 않은 수
     val salaryCalcs: Int,
     val pdfExports: Int,
     val excelExports: Int
@@ -32,6 +32,7 @@ class SubscriptionService(
 
         val limits = PlanLimits.forTier(user.subscriptionTier)
         val usage = usageService.getMonthlyUsage(userId)
+        val reserved = usageService.getReservedUsage(userId)
 
         return SubscriptionResponse(
             tier = user.subscriptionTier,
@@ -40,6 +41,7 @@ class SubscriptionService(
             limits = limits,
             usage = UsageResponse(
                 aiChats = usage[UsageType.AI_CHAT] ?: 0,
+                aiChatsReserved = reserved[UsageType.AI_CHAT] ?: 0,
                 salaryCalcs = usage[UsageType.SALARY_CALC] ?: 0,
                 pdfExports = usage[UsageType.PDF_EXPORT] ?: 0,
                 excelExports = usage[UsageType.EXCEL_EXPORT] ?: 0
@@ -8,9 +8,24 @@ import com.paytools.infrastructure.repository.UsageTrackingRepository
 import com.paytools.infrastructure.repository.UserRepository
 import org.springframework.stereotype.Service
 import org.springframework.transaction.annotation.Transactional
+import java.time.LocalDateTime
 import java.time.YearMonth
 import java.time.format.DateTimeFormatter
 
+/**
+ * 사용량 예약 결과
+ * @property granted 예약된 개수 (0이면 한도 초과)
+ * @property yearMonth 예약이 속한 월 (반환/정산 시 같은 월로 처리)
+ */
+data class UsageLease(val granted: Int, val yearMonth: String)
+
+/**
+ * 예약 정산 결과
+ * @property used 사용량으로 확정된 개수
+ * @property released 실제로 반환된 예약 개수
+ */
+data class UsageSettlement(val used: Int, val released: Int)
+
 /**
  * 사용량 추적 서비스
  */
@@ -21,6 +36,14 @@ class UsageService(
 ) {
     private val yearMonthFormatter = DateTimeFormatter.ofPattern("yyyy-MM")
 
+    companion object {
+        /** 예약 유효 시간 (AI 서비스 리스 TTL 5분 + 정산 주기 여유) */
+        const val RESERVATION_TTL_MINUTES = 10L
+
+        /** 한 번에 예약할 수 있는 최대 비율 (남은 한도의 1/N, 최소 1) */
+        const val RESERVATION_FRACTION = 10
+    }
+
     /**
      * 사용량 증가 및 제한 체크
      * @return true if usage is allowed, false if limit exceeded
@@ -53,7 +76,7 @@ class UsageService(
             UsageType.EXCEL_EXPORT -> if (limits.hasExcelExport) Int.MAX_VALUE else 0
         }
 
-        if (usage.count >= limit) {
+        if (usage.count + usage.activeReserved() >= limit) {
             return false
         }
 
@@ -63,6 +86,65 @@ class UsageService(
         return true
     }
 
+    /**
+     * 사용량 블록 예약 (AI 서비스 로컬 미터링용)
+     * 예약분은 count가 아닌 reserved에 기록되고, 사용 보고(settleUsage) 시 count로 확정
+     * 남은 한도가 적으면 예약 크기도 줄임 (무료 요금제는 1개씩)
+     */
+    @Transactional
+    fun reserveUsage(userId: Long, usageType: UsageType, count: Int): UsageLease {
+        val yearMonth = YearMonth.now().format(yearMonthFormatter)
+        val limit = getUsageLimits(userId)[usageType] ?: 0
+        val usage = findOrCreateUsage(userId, usageType, yearMonth)
+        val now = LocalDateTime.now()
+        usage.expireReservation(now)
+
+        val available = (limit - usage.count - usage.reserved).coerceAtLeast(0)
+        val granted = minOf(count, available, maxOf(1, available / RESERVATION_FRACTION))
+        if (granted > 0) {
+            usage.reserved += granted
+            usage.reservedUntil = now.plusMinutes(RESERVATION_TTL_MINUTES)
+            usage.updatedAt = now
+            usageTrackingRepository.save(usage)
+        }
+        return UsageLease(granted, yearMonth)
+    }
+
+    /**
+     * 예약 정산: 사용한 개수는 count로 확정하고, 미사용분은 반환
+     * @param yearMonth 예약이 속한 월 (월이 바뀐 뒤 반환해도 새 달 사용량에 영향 없음)
+     */
+    @Transactional
+    fun settleUsage(userId: Long, usageType: UsageType, yearMonth: String, used: Int, released: Int): UsageSettlement {
+        val usage = findOrCreateUsage(userId, usageType, yearMonth)
+        val now = LocalDateTime.now()
+        usage.expireReservation(now)
+
+        val confirmed = used.coerceAtLeast(0)
+        usage.count += confirmed
+        usage.reserved = (usage.reserved - confirmed).coerceAtLeast(0)
+        val returned = minOf(released.coerceAtLeast(0), usage.reserved)
+        usage.reserved -= returned
+        if (usage.reserved == 0) {
+            usage.reservedUntil = null
+        }
+        usage.updatedAt = now
+        usageTrackingRepository.save(usage)
+        return UsageSettlement(confirmed, returned)
+    }
+
+    private fun findOrCreateUsage(userId: Long, usageType: UsageType, yearMonth: String): UsageTrackingEntity {
+        return usageTrackingRepository.findByUserIdAndUsageTypeAndYearMonth(
+            userId, usageType.name, yearMonth
+        ).orElseGet {
+            UsageTrackingEntity(
+                userId = userId,
+                usageType = usageType.name,
+                yearMonth = yearMonth
+            )
+        }
+    }
+
     /**
      * 현재 월 사용량 조회
      */
@@ -75,6 +157,19 @@ class UsageService(
         }
     }
 
+    /**
+     * 현재 월 예약 중인 사용량 조회 (사용 보고 전, 만료된 예약 제외)
+     */
+    fun getReservedUsage(userId: Long): Map<UsageType, Int> {
+        val currentYearMonth = YearMonth.now().format(yearMonthFormatter)
+        val usages = usageTrackingRepository.findByUserIdAndYearMonth(userId, currentYearMonth)
+        val now = LocalDateTime.now()
+
+        return UsageType.entries.associateWith { type ->
+            usages.find { it.usageType == type.name }?.activeReserved(now) ?: 0
+        }
+    }
+
     /**
      * 사용량 제한 정보 조회
      */
@@ -98,7 +193,8 @@ class UsageService(
      */
     fun canUse(userId: Long, usageType: UsageType): Boolean {
         val usage = getMonthlyUsage(userId)[usageType] ?: 0
+        val reserved = getReservedUsage(userId)[usageType] ?: 0
         val limit = getUsageLimits(userId)[usageType] ?: 0
-        return usage < limit
+        return usage + reserved < limit
     }
 }
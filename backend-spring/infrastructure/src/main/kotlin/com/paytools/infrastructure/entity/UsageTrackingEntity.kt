@@ -30,6 +30,12 @@ class UsageTrackingEntity(
     @Column(name = "count", nullable = false)
     var count: Int = 0,
 
+    @Column(name = "reserved", nullable = false)
+    var reserved: Int = 0,
+
+    @Column(name = "reserved_until")
+    var reservedUntil: LocalDateTime? = null,
+
     @Column(name = "created_at")
     val createdAt: LocalDateTime = LocalDateTime.now(),
 
@@ -40,4 +46,20 @@ class UsageTrackingEntity(
         count++
         updatedAt = LocalDateTime.now()
     }
+
+    /**
+     * 유효한 예약분 (만료된 예약은 0)
+     */
+    fun activeReserved(now: LocalDateTime = LocalDateTime.now()): Int =
+        if (reservedUntil?.isAfter(now) == true) reserved else 0
+
+    /**
+     * 만료된 예약 회수 (예약한 AI 워커가 반환 없이 종료된 경우)
+     */
+    fun expireReservation(now: LocalDateTime = LocalDateTime.now()) {
+        if (reserved > 0 && reservedUntil?.isAfter(now) != true) {
+            reserved = 0
+            reservedUntil = null
+        }
+    }
 }
@@ -0,0 +1,7 @@
+-- V8: AI 서비스 사용량 예약분을 실제 사용량(count)과 분리
+-- reserved: 예약되었지만 아직 사용 보고되지 않은 수, reserved_until: 예약 만료 시각 (AI 워커 비정상 종료 시 자동 회수)
+
+ALTER TABLE usage_tracking ADD COLUMN IF NOT EXISTS reserved INT NOT NULL DEFAULT 0;
+ALTER TABLE usage_tracking ADD COLUMN IF NOT EXISTS reserved_until TIMESTAMP;
+
+COMMENT ON COLUMN usage_tracking.reserved IS 'AI 서비스가 예약했지만 아직 사용 보고되지 않은 수 (reserved_until 이후 무효)';
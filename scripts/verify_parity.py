@@ -1,259 +1,585 @@
 #!/usr/bin/env python3
 """
-Python vs Kotlin 급여 계산 결과 비교 검증 스크립트
+Python vs Kotlin 급여 계산 결과 비교 검증 (무작위 속성 기반 퍼저)
 
-Python FastAPI와 Kotlin Spring Boot API의 급여 계산 결과가
+backend-ai 급여 계산 엔진(app/services/payroll.py)과 Kotlin Spring Boot API에
+무작위로 생성한 급여 계산 요청 수천 건을 동시에 보내고, 응답의 모든 금액 필드가
 1원 단위까지 일치하는지 검증합니다.
+
+- 생성 범위: 급여 유형 5종, 주 소정근로일/1일 소정시간, 근무 패턴(주간/야간/자정 걸침/휴일근로/결근),
+  수당(과세/비과세), 결근 정책, 174/209 모드, 4대보험 적용 옵션, 포괄임금제, 계약월급
+- 불일치 사례는 시프트/수당/옵션을 줄여가며 같은 필드가 계속 어긋나는 최소 요청으로 축소
+- 처리량(건/초)과 엔진별 지연시간을 출력하고 JSON 리포트를 저장
+- 같은 --seed면 같은 요청이 생성되므로 리포트의 seed로 재현 가능
+
+사용법:
+    python verify_parity.py                       # 2,000건
+    python verify_parity.py --cases 10000 --concurrency 64 --seed 7
+    python verify_parity.py --in-process          # Python 엔진을 서버 없이 직접 호출
 """
-import requests
+
+import argparse
+import asyncio
+import copy
 import json
-from typing import Dict, Any, List
-from decimal import Decimal
+import random
+import sys
+import time
+from calendar import monthrange
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import httpx
 
 # API URLs
-PYTHON_API = "http://localhost:8000/api/v1/salary/calculate"
+PYTHON_API = "http://localhost:8001/api/v1/payroll/calculate"
 KOTLIN_API = "http://localhost:8080/api/v1/salary/calculate"
 
-# 테스트 케이스
-TEST_CASES = [
+# 고정 회귀 케이스 (무작위 케이스보다 먼저 실행)
+FIXED_CASES = [
     {
         "name": "풀타임 주5일 근무 (월급제)",
         "request": {
             "employee": {
-                "name": "홍길동",
-                "dependentsCount": 1,
-                "childrenUnder20": 0,
-                "employmentType": "FULL_TIME",
-                "companySize": "OVER_5",
-                "scheduledWorkDays": 5,
-                "dailyWorkHours": 8
+                "name": "홍길동", "dependentsCount": 1, "childrenUnder20": 0, "employmentType": "FULL_TIME",
+                "companySize": "OVER_5", "scheduledWorkDays": 5, "dailyWorkHours": 8,
             },
             "baseSalary": 2800000,
             "allowances": [],
             "workShifts": [
-                {
-                    "date": "2026-01-02",
-                    "startTime": "09:00",
-                    "endTime": "18:00",
-                    "breakMinutes": 60,
-                    "isHolidayWork": False
-                },
-                {
-                    "date": "2026-01-03",
-                    "startTime": "09:00",
-                    "endTime": "18:00",
-                    "breakMinutes": 60,
-                    "isHolidayWork": False
-                }
+                {"date": "2026-01-02", "startTime": "09:00", "endTime": "18:00", "breakMinutes": 60, "isHolidayWork": False},
+                {"date": "2026-01-03", "startTime": "09:00", "endTime": "18:00", "breakMinutes": 60, "isHolidayWork": False},
             ],
-            "wageType": "MONTHLY",
-            "hourlyWage": 0,
-            "calculationMonth": "2026-01",
-            "absencePolicy": "STRICT",
-            "hoursMode": "174"
-        }
+            "wageType": "MONTHLY", "hourlyWage": 0, "calculationMonth": "2026-01",
+            "absencePolicy": "STRICT", "hoursMode": "174",
+        },
     },
     {
         "name": "시급제 파트타임",
         "request": {
             "employee": {
-                "name": "김파트",
-                "dependentsCount": 0,
-                "childrenUnder20": 0,
-                "employmentType": "PART_TIME",
-                "companySize": "OVER_5",
-                "scheduledWorkDays": 3,
-                "dailyWorkHours": 4
+                "name": "김파트", "dependentsCount": 0, "childrenUnder20": 0, "employmentType": "PART_TIME",
+                "companySize": "OVER_5", "scheduledWorkDays": 3, "dailyWorkHours": 4,
             },
             "baseSalary": 0,
             "allowances": [],
             "workShifts": [
-                {
-                    "date": "2026-01-02",
-                    "startTime": "14:00",
-                    "endTime": "18:00",
-                    "breakMinutes": 0,
-                    "isHolidayWork": False
-                }
+                {"date": "2026-01-02", "startTime": "14:00", "endTime": "18:00", "breakMinutes": 0, "isHolidayWork": False},
             ],
-            "wageType": "HOURLY",
-            "hourlyWage": 10320,
-            "calculationMonth": "2026-01",
-            "absencePolicy": "LENIENT",
-            "hoursMode": "174"
-        }
+            "wageType": "HOURLY", "hourlyWage": 10320, "calculationMonth": "2026-01",
+            "absencePolicy": "LENIENT", "hoursMode": "174",
+        },
     },
     {
         "name": "연장근로 포함",
         "request": {
             "employee": {
-                "name": "이연장",
-                "dependentsCount": 2,
-                "childrenUnder20": 1,
-                "employmentType": "FULL_TIME",
-                "companySize": "OVER_5",
-                "scheduledWorkDays": 5,
-                "dailyWorkHours": 8
+                "name": "이연장", "dependentsCount": 2, "childrenUnder20": 1, "employmentType": "FULL_TIME",
+                "companySize": "OVER_5", "scheduledWorkDays": 5, "dailyWorkHours": 8,
             },
             "baseSalary": 2800000,
             "allowances": [],
             "workShifts": [
-                {
-                    "date": "2026-01-02",
-                    "startTime": "09:00",
-                    "endTime": "20:00",  # 11시간 - 휴게 1시간 = 10시간 (연장 2시간)
-                    "breakMinutes": 60,
-                    "isHolidayWork": False
-                }
+                # 11시간 - 휴게 1시간 = 10시간 (연장 2시간)
+                {"date": "2026-01-02", "startTime": "09:00", "endTime": "20:00", "breakMinutes": 60, "isHolidayWork": False},
             ],
-            "wageType": "MONTHLY",
-            "hourlyWage": 0,
-            "calculationMonth": "2026-01",
-            "absencePolicy": "MODERATE",
-            "hoursMode": "174"
-        }
-    }
+            "wageType": "MONTHLY", "hourlyWage": 0, "calculationMonth": "2026-01",
+            "absencePolicy": "MODERATE", "hoursMode": "174",
+        },
+    },
 ]
 
-def compare_money(py_val: int, kt_val: int, field_path: str) -> bool:
-    """금액 비교 (1원 단위)"""
-    if py_val == kt_val:
-        return True
-    else:
-        print(f"  ❌ {field_path}: Python={py_val:,}원 vs Kotlin={kt_val:,}원 (차이={abs(py_val - kt_val):,}원)")
-        return False
-
-def extract_money_field(data: Any, field_name: str) -> int:
-    """중첩된 딕셔너리에서 amount 필드 추출"""
-    if isinstance(data, dict) and "amount" in data:
-        return data["amount"]
-    return data
-
-def compare_results(py_result: Dict[str, Any], kt_result: Dict[str, Any], test_name: str) -> bool:
-    """결과 비교"""
-    print(f"\n📋 {test_name}")
-    all_match = True
-
-    # 실수령액 비교
-    py_net = extract_money_field(py_result.get("netPay", {}), "netPay")
-    kt_net = extract_money_field(kt_result.get("netPay", {}), "netPay")
-    if not compare_money(py_net, kt_net, "실수령액"):
-        all_match = False
-
-    # 총 지급액 비교
-    py_gross = extract_money_field(py_result.get("grossBreakdown", {}).get("total", {}), "total")
-    kt_gross = extract_money_field(kt_result.get("grossBreakdown", {}).get("total", {}), "total")
-    if not compare_money(py_gross, kt_gross, "총 지급액"):
-        all_match = False
-
-    # 기본급 비교
-    py_base = extract_money_field(py_result.get("grossBreakdown", {}).get("baseSalary", {}), "baseSalary")
-    kt_base = extract_money_field(kt_result.get("grossBreakdown", {}).get("baseSalary", {}), "baseSalary")
-    if not compare_money(py_base, kt_base, "기본급"):
-        all_match = False
-
-    # 4대 보험 비교
-    insurance = py_result.get("deductionsBreakdown", {}).get("insurance", {})
-    kt_insurance = kt_result.get("deductionsBreakdown", {}).get("insurance", {})
-
-    py_np = extract_money_field(insurance.get("nationalPension", {}), "nationalPension")
-    kt_np = extract_money_field(kt_insurance.get("nationalPension", {}), "nationalPension")
-    if not compare_money(py_np, kt_np, "국민연금"):
-        all_match = False
-
-    py_hi = extract_money_field(insurance.get("healthInsurance", {}), "healthInsurance")
-    kt_hi = extract_money_field(kt_insurance.get("healthInsurance", {}), "healthInsurance")
-    if not compare_money(py_hi, kt_hi, "건강보험"):
-        all_match = False
-
-    py_ltc = extract_money_field(insurance.get("longTermCare", {}), "longTermCare")
-    kt_ltc = extract_money_field(kt_insurance.get("longTermCare", {}), "longTermCare")
-    if not compare_money(py_ltc, kt_ltc, "장기요양보험"):
-        all_match = False
-
-    py_ei = extract_money_field(insurance.get("employmentInsurance", {}), "employmentInsurance")
-    kt_ei = extract_money_field(kt_insurance.get("employmentInsurance", {}), "employmentInsurance")
-    if not compare_money(py_ei, kt_ei, "고용보험"):
-        all_match = False
-
-    # 세금 비교
-    tax = py_result.get("deductionsBreakdown", {}).get("tax", {})
-    kt_tax = kt_result.get("deductionsBreakdown", {}).get("tax", {})
-
-    py_it = extract_money_field(tax.get("incomeTax", {}), "incomeTax")
-    kt_it = extract_money_field(kt_tax.get("incomeTax", {}), "incomeTax")
-    if not compare_money(py_it, kt_it, "소득세"):
-        all_match = False
-
-    py_lit = extract_money_field(tax.get("localIncomeTax", {}), "localIncomeTax")
-    kt_lit = extract_money_field(kt_tax.get("localIncomeTax", {}), "localIncomeTax")
-    if not compare_money(py_lit, kt_lit, "지방소득세"):
-        all_match = False
-
-    # 총 공제액 비교
-    py_ded = extract_money_field(py_result.get("deductionsBreakdown", {}).get("total", {}), "total")
-    kt_ded = extract_money_field(kt_result.get("deductionsBreakdown", {}).get("total", {}), "total")
-    if not compare_money(py_ded, kt_ded, "총 공제액"):
-        all_match = False
-
-    if all_match:
-        print("  ✅ 모든 필드 일치")
-
-    return all_match
-
-def run_tests():
-    """테스트 실행"""
-    print("=" * 60)
-    print("Python vs Kotlin 급여 계산 결과 비교 검증")
-    print("=" * 60)
-
-    total_tests = len(TEST_CASES)
-    passed_tests = 0
-
-    for test_case in TEST_CASES:
-        test_name = test_case["name"]
-        request_data = test_case["request"]
+WAGE_TYPES = ["MONTHLY", "MONTHLY_FIXED", "HOURLY", "HOURLY_MONTHLY", "HOURLY_BASED_MONTHLY"]
+ABSENCE_POLICIES = ["STRICT", "MODERATE", "LENIENT"]
+HOLIDAYS_2026 = {
+    date(2026, 1, 1), date(2026, 2, 16), date(2026, 2, 17), date(2026, 2, 18), date(2026, 3, 1),
+    date(2026, 5, 1), date(2026, 5, 5), date(2026, 5, 24), date(2026, 6, 6), date(2026, 8, 15),
+    date(2026, 9, 24), date(2026, 9, 25), date(2026, 9, 26), date(2026, 10, 3), date(2026, 10, 9),
+    date(2026, 12, 25),
+}
+
+# 근무 패턴: (출근 시각 후보, 근무 길이(분) 후보)
+SHIFT_PATTERNS = {
+    "day": (["08:00", "09:00", "09:30", "10:00"], [240, 480, 540, 600]),
+    "evening": (["14:00", "17:00", "18:00", "19:30"], [300, 360, 480, 540]),  # 22시 이후로 걸침
+    "night": (["21:00", "22:00", "23:00", "23:30"], [360, 480, 540]),  # 자정 넘김
+    "early": (["04:00", "05:00", "05:30"], [180, 300, 480]),  # 06시 이전 야간
+    "long": (["07:00", "08:00", "09:00"], [660, 720, 780]),  # 1일 소정시간 초과
+}
+
+
+# ==================== 요청 생성 ====================
+
+def _time(minutes: int) -> str:
+    minutes %= 24 * 60
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _parse_time(value: str) -> int:
+    hours, minutes = value.split(":")[:2]
+    return int(hours) * 60 + int(minutes)
+
+
+def _shift(rng: random.Random, day: date, pattern: str, holiday: bool) -> dict:
+    starts, lengths = SHIFT_PATTERNS[pattern]
+    start = _parse_time(rng.choice(starts)) + rng.choice([0, 0, 0, 10, 15, 45])
+    length = rng.choice(lengths) + rng.choice([0, 0, 20, 30, -30])
+    break_minutes = rng.choice([0, 30, 60, 60, 90]) if length >= 240 else rng.choice([0, 0, 30])
+    return {
+        "date": day.isoformat(),
+        "startTime": _time(start),
+        "endTime": _time(start + length),
+        "breakMinutes": min(break_minutes, length),
+        "isHolidayWork": holiday,
+    }
+
+
+def _shifts(rng: random.Random, year: int, month: int, work_days: int) -> list[dict]:
+    """한 달 근무 기록 (개근/결근/휴일근로/패턴 혼합)"""
+    style = rng.choice(["full", "full", "absent", "sparse", "mixed", "none"])
+    if style == "none":
+        return []
+    pattern = rng.choice(list(SHIFT_PATTERNS))
+    last_day = monthrange(year, month)[1]
+    shifts = []
+    day = date(year, month, 1)
+    # 가끔 전월 말일부터 시작 (월 경계에 걸친 주)
+    if rng.random() < 0.15:
+        day -= timedelta(days=rng.randint(1, 3))
+    end = date(year, month, last_day)
+    while day <= end:
+        scheduled = day.isoweekday() <= work_days
+        holiday = day in HOLIDAYS_2026 or day.isoweekday() == 7
+        if style == "sparse":
+            works = rng.random() < 0.3
+        elif style == "absent":
+            works = scheduled and rng.random() > 0.15
+        else:
+            works = scheduled
+        if style == "mixed" and rng.random() < 0.25:
+            pattern = rng.choice(list(SHIFT_PATTERNS))
+        if works:
+            shifts.append(_shift(rng, day, pattern, holiday and rng.random() < 0.7))
+        elif holiday and rng.random() < 0.1:
+            # 휴일 특근
+            shifts.append(_shift(rng, day, rng.choice(["day", "long", "night"]), True))
+        day += timedelta(days=1)
+    return shifts
+
+
+def _allowances(rng: random.Random) -> list[dict]:
+    names = ["식대", "교통비", "직책수당", "자격수당", "가족수당", "차량유지비"]
+    allowances = []
+    for name in rng.sample(names, rng.choice([0, 0, 1, 2, 3])):
+        allowances.append({
+            "name": name,
+            "amount": rng.choice([50_000, 100_000, 150_000, 200_000, 200_000, 300_000]) + rng.randint(0, 3) * 3_333,
+            "isTaxable": rng.random() < 0.6,
+            "isIncludableInMinimumWage": rng.random() < 0.7,
+            "isFixed": rng.random() < 0.8,
+            "isIncludedInRegularWage": rng.random() < 0.6,
+        })
+    return allowances
+
+
+def generate_request(rng: random.Random) -> dict:
+    """무작위 SalaryCalculationRequest"""
+    wage_type = rng.choice(WAGE_TYPES)
+    work_days = rng.choice([5, 5, 5, 6, 4, 3, 2, 1, 7])
+    daily_hours = rng.choice([8, 8, 8, 4, 5, 6, 7, 9, 10, 12, 3])
+    dependents = rng.choice([0, 1, 1, 1, 2, 3, 4, 6, 10, 12])
+    year, month = 2026, rng.randint(1, 12)
+    hourly = wage_type.startswith("HOURLY")
+
+    request = {
+        "employee": {
+            "name": "퍼저",
+            "dependentsCount": dependents,
+            "childrenUnder20": rng.randint(0, min(dependents, 3)),
+            "employmentType": rng.choice(["FULL_TIME", "PART_TIME", "CONTRACT"]),
+            "companySize": rng.choice(["OVER_5", "OVER_5", "UNDER_5"]),
+            "scheduledWorkDays": work_days,
+            "dailyWorkHours": daily_hours,
+        },
+        "baseSalary": 0 if hourly else rng.choice([
+            rng.randrange(1_000_000, 3_000_000, 10_000),
+            rng.randrange(3_000_000, 7_000_000, 10_000),
+            rng.randint(1_500_000, 12_000_000),
+            rng.choice([390_000, 5_900_000, 13_500_000, 100_000_000]),  # 보험 상하한 경계
+        ]),
+        "allowances": _allowances(rng),
+        "workShifts": _shifts(rng, year, month, work_days),
+        "wageType": wage_type,
+        "hourlyWage": rng.choice([10_320, 10_320, 11_000, 12_500, 15_000, rng.randint(9_000, 40_000)]) if hourly else 0,
+        "calculationMonth": f"{year}-{month:02d}" if rng.random() < 0.8 else "",
+        "absencePolicy": rng.choice(ABSENCE_POLICIES),
+        "hoursMode": rng.choice(["174", "174", "209"]),
+    }
+    if rng.random() < 0.2:
+        request["insuranceOptions"] = {
+            "applyNationalPension": rng.random() < 0.7,
+            "applyHealthInsurance": rng.random() < 0.7,
+            "applyLongTermCare": rng.random() < 0.7,
+            "applyEmploymentInsurance": rng.random() < 0.7,
+        }
+    if not hourly and rng.random() < 0.2:
+        request["inclusiveWageOptions"] = {
+            "enabled": True,
+            "fixedOvertimeHourlyRate": rng.choice([15_000, 18_000, 20_123, 25_000]),
+            "monthlyExpectedOvertimeHours": rng.choice([5.0, 10.0, 12.5, 20.0, 20.25, 31.7]),
+        }
+    if wage_type == "HOURLY_BASED_MONTHLY":
+        request["contractMonthlySalary"] = rng.choice([1_500_000, 2_156_880, 2_500_000, 3_000_000, rng.randint(500_000, 4_000_000)])
+    return request
+
+
+# ==================== 비교 ====================
+
+def money_fields(data: Any, path: str = "") -> dict[str, int]:
+    """응답의 모든 금액 필드 ({amount, formatted} 객체) → {경로: 금액}"""
+    fields = {}
+    if isinstance(data, dict):
+        if "amount" in data and "formatted" in data:
+            fields[path] = data["amount"]
+        else:
+            for key, value in data.items():
+                fields.update(money_fields(value, f"{path}.{key}" if path else key))
+    elif isinstance(data, list):
+        for i, value in enumerate(data):
+            fields.update(money_fields(value, f"{path}[{i}]"))
+    return fields
+
+
+def diff_money(py_result: dict, kt_result: dict) -> list[dict]:
+    """금액 필드 차이 (한쪽에만 있는 필드 포함)"""
+    py_fields, kt_fields = money_fields(py_result), money_fields(kt_result)
+    diffs = []
+    # 응답 순서 유지 (지급 내역 → 공제 → 실수령액, 앞쪽 필드가 원인에 가까움)
+    for path in [*py_fields, *(p for p in kt_fields if p not in py_fields)]:
+        py_value, kt_value = py_fields.get(path), kt_fields.get(path)
+        if py_value != kt_value:
+            delta = py_value - kt_value if py_value is not None and kt_value is not None else None
+            diffs.append({"field": path, "python": py_value, "kotlin": kt_value, "delta": delta})
+    return diffs
+
+
+def _is_aggregate(field: str) -> bool:
+    return field == "netPay" or field.endswith(".total")
+
+
+class Outcome:
+    """한 요청의 비교 결과"""
+
+    __slots__ = ("status", "diffs", "python_status", "kotlin_status", "error")
+
+    def __init__(self, status: str, diffs=None, python_status=None, kotlin_status=None, error=None):
+        self.status = status  # match | mismatch | both_rejected | status_mismatch | error
+        self.diffs = diffs or []
+        self.python_status = python_status
+        self.kotlin_status = kotlin_status
+        self.error = error
+
+    @property
+    def failed(self) -> bool:
+        return self.status in ("mismatch", "status_mismatch")
+
+    def signature(self) -> tuple:
+        """
+        축소 시 유지해야 할 실패 특징
+        금액 불일치는 응답에서 가장 먼저 나오는 합계 외 필드 (합계/공제 차이는 대부분 그 결과)
+        """
+        if self.status == "status_mismatch":
+            return ("status", self.python_status, self.kotlin_status)
+        fields = [d["field"] for d in self.diffs]
+        specific = [f for f in fields if not _is_aggregate(f)]
+        return ("field", (specific or fields)[0])
+
+    def to_dict(self) -> dict:
+        data = {"status": self.status}
+        if self.diffs:
+            data["diffs"] = self.diffs
+        if self.status != "match":
+            data["python_status"] = self.python_status
+            data["kotlin_status"] = self.kotlin_status
+        if self.error:
+            data["error"] = self.error
+        return data
+
 
+Engine = Callable[[dict], Awaitable[tuple[int, Any]]]
+
+
+class Latency:
+    def __init__(self):
+        self.samples: list[float] = []
+
+    def percentiles(self) -> dict:
+        if not self.samples:
+            return {}
+        ordered = sorted(self.samples)
+
+        def pick(q: float) -> float:
+            return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 2)
+
+        return {"p50_ms": pick(0.5), "p95_ms": pick(0.95), "p99_ms": pick(0.99), "max_ms": round(ordered[-1] * 1000, 2)}
+
+
+def http_engine(client: httpx.AsyncClient, url: str) -> Engine:
+    async def call(request: dict) -> tuple[int, Any]:
+        response = await client.post(url, json=request)
+        try:
+            body = response.json()
+        except ValueError:
+            body = response.text
+        return response.status_code, body
+    return call
+
+
+def in_process_engine() -> Engine:
+    """backend-ai 급여 계산 엔진 직접 호출 (서버 없이)"""
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend-ai"))
+    from app.services.payroll import calculate_salary_request
+
+    async def call(request: dict) -> tuple[int, Any]:
         try:
-            # Python API 호출
-            print(f"\n🐍 Python API 호출 중...")
-            py_response = requests.post(PYTHON_API, json=request_data, timeout=10)
-            if py_response.status_code != 200:
-                print(f"  ❌ Python API 에러: {py_response.status_code}")
-                print(f"  응답: {py_response.text}")
-                continue
-            py_result = py_response.json()
-
-            # Kotlin API 호출
-            print(f"☕ Kotlin API 호출 중...")
-            kt_response = requests.post(KOTLIN_API, json=request_data, timeout=10)
-            if kt_response.status_code != 200:
-                print(f"  ❌ Kotlin API 에러: {kt_response.status_code}")
-                print(f"  응답: {kt_response.text}")
-                continue
-            kt_result = kt_response.json()
-
-            # 결과 비교
-            if compare_results(py_result, kt_result, test_name):
-                passed_tests += 1
-
-        except requests.exceptions.ConnectionError as e:
-            print(f"  ❌ 연결 실패: {e}")
-            print(f"  Python API ({PYTHON_API}) 또는 Kotlin API ({KOTLIN_API})가 실행 중인지 확인하세요.")
-        except Exception as e:
-            print(f"  ❌ 예외 발생: {e}")
-
-    # 결과 요약
-    print("\n" + "=" * 60)
-    print(f"테스트 결과: {passed_tests}/{total_tests} 통과")
-    print("=" * 60)
-
-    if passed_tests == total_tests:
-        print("✅ 모든 테스트 통과! Python과 Kotlin의 계산 결과가 1원 단위로 일치합니다.")
-        return 0
-    else:
-        print("❌ 일부 테스트 실패. Python과 Kotlin의 계산 결과가 일치하지 않습니다.")
+            return 200, calculate_salary_request(copy.deepcopy(request))
+        except (KeyError, TypeError, ValueError) as e:
+            return 400, {"error": str(e)}
+    return call
+
+
+async def compare(request: dict, python: Engine, kotlin: Engine, latency: dict[str, Latency]) -> Outcome:
+    async def timed(name: str, engine: Engine):
+        start = time.perf_counter()
+        result = await engine(request)
+        latency[name].samples.append(time.perf_counter() - start)
+        return result
+
+    try:
+        (py_status, py_body), (kt_status, kt_body) = await asyncio.gather(
+            timed("python", python), timed("kotlin", kotlin)
+        )
+    except httpx.HTTPError as e:
+        return Outcome("error", error=f"{type(e).__name__}: {e}")
+
+    if py_status == 200 and kt_status == 200:
+        diffs = diff_money(py_body, kt_body)
+        return Outcome("mismatch" if diffs else "match", diffs, py_status, kt_status)
+    if py_status != 200 and kt_status != 200 and py_status < 500 and kt_status < 500:
+        # 양쪽 모두 잘못된 요청으로 거부
+        return Outcome("both_rejected", python_status=py_status, kotlin_status=kt_status)
+    if py_status >= 500 and kt_status >= 500:
+        return Outcome("error", python_status=py_status, kotlin_status=kt_status, error="both engines failed")
+    return Outcome("status_mismatch", python_status=py_status, kotlin_status=kt_status)
+
+
+# ==================== 축소 ====================
+
+def _candidates(request: dict):
+    """요청을 한 단계 단순화한 후보들 (큰 축소부터)"""
+    shifts = request.get("workShifts") or []
+    n = len(shifts)
+    # 시프트 덩어리 제거 (절반 → 1/4 → ... → 1개)
+    chunk = n // 2
+    while chunk >= 1:
+        for start in range(0, n, chunk):
+            candidate = copy.deepcopy(request)
+            candidate["workShifts"] = shifts[:start] + shifts[start + chunk:]
+            yield candidate
+        chunk //= 2
+    for i in range(len(request.get("allowances") or [])):
+        candidate = copy.deepcopy(request)
+        del candidate["allowances"][i]
+        yield candidate
+    for key in ("insuranceOptions", "inclusiveWageOptions"):
+        if key in request:
+            candidate = copy.deepcopy(request)
+            del candidate[key]
+            yield candidate
+    for key, value in (("hoursMode", "174"), ("absencePolicy", "STRICT")):
+        if request.get(key) != value:
+            candidate = copy.deepcopy(request)
+            candidate[key] = value
+            yield candidate
+    employee = request.get("employee", {})
+    for key, value in (("childrenUnder20", 0), ("dependentsCount", 1), ("companySize", "OVER_5"),
+                       ("scheduledWorkDays", 5), ("dailyWorkHours", 8), ("employmentType", "FULL_TIME")):
+        if employee.get(key) != value:
+            candidate = copy.deepcopy(request)
+            candidate["employee"][key] = value
+            yield candidate
+    for i, shift in enumerate(shifts):
+        for key, value in (("breakMinutes", 0), ("isHolidayWork", False), ("startTime", "09:00"), ("endTime", "18:00")):
+            if shift.get(key) != value:
+                candidate = copy.deepcopy(request)
+                candidate["workShifts"][i][key] = value
+                yield candidate
+    for key in ("baseSalary", "hourlyWage", "contractMonthlySalary"):
+        value = request.get(key)
+        if isinstance(value, int) and value > 0:
+            # 10만원/천원/원 단위로 반올림한 값부터 시도
+            for unit in (100_000, 1_000, 10):
+                rounded = max(unit, round(value / unit) * unit)
+                if rounded != value:
+                    candidate = copy.deepcopy(request)
+                    candidate[key] = rounded
+                    yield candidate
+                    break
+
+
+def _field_signatures(outcome: Outcome) -> list[tuple]:
+    return [("field", d["field"]) for d in outcome.diffs]
+
+
+async def shrink(request: dict, outcome: Outcome, check: Callable[[dict], Awaitable[Outcome]], max_steps: int) -> tuple[dict, Outcome, int]:
+    """같은 실패 특징(어긋나는 필드/상태 코드)을 유지하는 최소 요청 탐색 (탐욕적 축소)"""
+    target = outcome.signature()
+    current, current_outcome = request, outcome
+    steps = 0
+    improved = True
+    while improved and steps < max_steps:
+        improved = False
+        for candidate in _candidates(current):
+            if steps >= max_steps:
+                break
+            steps += 1
+            result = await check(candidate)
+            if result.failed and target in (result.signature(), *_field_signatures(result)):
+                current, current_outcome = candidate, result
+                improved = True
+                break
+    return current, current_outcome, steps
+
+
+# ==================== 실행 ====================
+
+async def run(args) -> int:
+    limits = httpx.Limits(max_connections=args.concurrency * 2, max_keepalive_connections=args.concurrency * 2)
+    async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+        python = in_process_engine() if args.in_process else http_engine(client, args.python_url)
+        kotlin = http_engine(client, args.kotlin_url)
+        latency = {"python": Latency(), "kotlin": Latency()}
+
+        cases = [(case["name"], None, case["request"]) for case in FIXED_CASES]
+        for i in range(args.cases):
+            case_seed = args.seed * 1_000_003 + i
+            cases.append((f"random-{i}", case_seed, generate_request(random.Random(case_seed))))
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def check(request: dict) -> Outcome:
+            async with semaphore:
+                return await compare(request, python, kotlin, latency)
+
+        print("=" * 72)
+        print("Python vs Kotlin 급여 계산 패리티 퍼저")
+        print("=" * 72)
+        print(f"  Python: {'in-process' if args.in_process else args.python_url}")
+        print(f"  Kotlin: {args.kotlin_url}")
+        print(f"  케이스 {len(cases):,}건 (고정 {len(FIXED_CASES)} + 무작위 {args.cases:,}, seed={args.seed}), 동시 {args.concurrency}")
+
+        started = time.perf_counter()
+        outcomes = await asyncio.gather(*(check(request) for _, _, request in cases))
+        elapsed = time.perf_counter() - started
+
+        counts: dict[str, int] = {}
+        for outcome in outcomes:
+            counts[outcome.status] = counts.get(outcome.status, 0) + 1
+        if counts.get("error", 0) == len(cases):
+            print(f"\n❌ 모든 요청 실패: {outcomes[0].error}")
+            print(f"  Python API ({args.python_url}) 또는 Kotlin API ({args.kotlin_url})가 실행 중인지 확인하세요.")
+            return 2
+
+        failures = [(case, outcome) for case, outcome in zip(cases, outcomes) if outcome.failed]
+        field_counts: dict[str, int] = {}
+        for _, outcome in failures:
+            for d in outcome.diffs:
+                field_counts[d["field"]] = field_counts.get(d["field"], 0) + 1
+
+        # 실패 특징별 첫 사례만 축소
+        report_failures = []
+        shrunk_signatures: set = set()
+        for (name, case_seed, request), outcome in failures:
+            entry = {"case": name, "seed": case_seed, "request": request, **outcome.to_dict()}
+            signature = outcome.signature()
+            if args.shrink and signature not in shrunk_signatures and len(shrunk_signatures) < args.max_shrink_cases:
+                shrunk_signatures.add(signature)
+                minimal, minimal_outcome, steps = await shrink(request, outcome, check, args.max_shrink_steps)
+                entry["minimal"] = {"request": minimal, "steps": steps, **minimal_outcome.to_dict()}
+            report_failures.append(entry)
+
+        throughput = len(cases) / elapsed if elapsed else 0.0
+        summary = {
+            "cases": len(cases),
+            "matched": counts.get("match", 0),
+            "mismatched": counts.get("mismatch", 0),
+            "status_mismatched": counts.get("status_mismatch", 0),
+            "both_rejected": counts.get("both_rejected", 0),
+            "errors": counts.get("error", 0),
+            "elapsed_seconds": round(elapsed, 3),
+            "cases_per_second": round(throughput, 1),
+            "latency": {name: lat.percentiles() for name, lat in latency.items()},
+            "mismatched_fields": dict(sorted(field_counts.items(), key=lambda kv: -kv[1])),
+        }
+
+        print(f"\n  일치 {summary['matched']:,} / 불일치 {summary['mismatched']:,} / 상태코드 불일치 {summary['status_mismatched']:,}"
+              f" / 양쪽 거부 {summary['both_rejected']:,} / 오류 {summary['errors']:,}")
+        print(f"  처리량 {throughput:,.1f}건/초 ({elapsed:.2f}s)")
+        for name, stats in summary["latency"].items():
+            if stats:
+                print(f"  {name:<7} p50 {stats['p50_ms']}ms  p95 {stats['p95_ms']}ms  p99 {stats['p99_ms']}ms")
+        for field, count in list(summary["mismatched_fields"].items())[:10]:
+            print(f"  ❌ {field}: {count:,}건")
+        for entry in report_failures:
+            if "minimal" in entry:
+                minimal = entry["minimal"]
+                fields = ", ".join(f"{d['field']}({d['delta']:+,})" if d["delta"] is not None else d["field"] for d in minimal.get("diffs", []))
+                print(f"\n  📋 {entry['case']} (seed={entry['seed']}) → 최소 사례 ({minimal['steps']}회 축소): {fields or minimal['status']}")
+                print("     " + json.dumps(minimal["request"], ensure_ascii=False))
+
+        report = {
+            "config": {
+                "python": "in-process" if args.in_process else args.python_url,
+                "kotlin": args.kotlin_url,
+                "seed": args.seed,
+                "random_cases": args.cases,
+                "concurrency": args.concurrency,
+            },
+            "summary": summary,
+            "failures": report_failures,
+            "errors": [
+                {"case": name, "seed": case_seed, **outcome.to_dict()}
+                for (name, case_seed, _), outcome in zip(cases, outcomes) if outcome.status == "error"
+            ][:100],
+        }
+        Path(args.report).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n  리포트: {args.report}")
+
+    print("=" * 72)
+    if failures or counts.get("error", 0):
+        print("❌ 일부 케이스 실패. Python과 Kotlin의 계산 결과가 일치하지 않습니다.")
         return 1
+    print("✅ 모든 케이스 통과! Python과 Kotlin의 계산 결과가 1원 단위로 일치합니다.")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Python vs Kotlin payroll parity fuzzer")
+    parser.add_argument("--cases", type=int, default=2000, help="무작위 케이스 수")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--python-url", default=PYTHON_API)
+    parser.add_argument("--kotlin-url", default=KOTLIN_API)
+    parser.add_argument("--in-process", action="store_true", help="Python 엔진을 서버 없이 직접 호출")
+    parser.add_argument("--no-shrink", dest="shrink", action="store_false", help="불일치 사례 축소 생략")
+    parser.add_argument("--max-shrink-cases", type=int, default=10, help="축소할 실패 유형 수")
+    parser.add_argument("--max-shrink-steps", type=int, default=300, help="사례당 최대 축소 시도 수")
+    parser.add_argument("--report", default="parity_report.json")
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
 
 if __name__ == "__main__":
-    exit(run_tests())
+    sys.exit(main())